@@ -0,0 +1,71 @@
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING   # "gzip,deflate" plus "br" when brotli is installed
+from urllib3.util.retry import Retry
+
+# --- The Shared HTTP Client ---
+# Module-level requests.get() opens a NEW connection (TCP + TLS handshake) for
+# every call. All skills now share one requests.Session instead:
+#   * per-host connection pools with keep-alive (POOL_HOSTS x POOL_SIZE)
+#   * compressed responses (gzip, and brotli when the package is installed)
+#   * bounded retries with exponential backoff for connection errors and
+#     429/5xx answers on idempotent requests (Retry-After is honoured)
+#   * default (connect, read) timeouts, overridable per call
+
+CONNECT_TIMEOUT = float(os.environ.get("JARVIS_HTTP_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.environ.get("JARVIS_HTTP_READ_TIMEOUT", "10"))
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3         # Waits 0.3 s, 0.6 s, 1.2 s between attempts
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+POOL_HOSTS = 16              # Hosts with a pool of their own
+POOL_SIZE = 8                # Keep-alive connections per host (concurrent scrapes)
+
+
+class HttpClient:
+    """A pooled, keep-alive requests.Session with retries and default timeouts. Thread-safe for GET/HEAD."""
+
+    def __init__(self, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), max_retries=MAX_RETRIES,
+                 pool_hosts=POOL_HOSTS, pool_size=POOL_SIZE):
+        self.timeout = timeout
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,          # Hand the last response back instead of raising
+        )
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client():
+    """The process-wide client every skill uses."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
@@ -1,14 +1,16 @@
 
 
-import requests
 import json
 import os 
 
+from http_client import get_http_client
+
 API_KEY = os.environ.get("WEATHER_API_KEY") 
 
 def get_current_temp(city: str) -> float:    
     base_url = "https://api.weather.com/v1"    
-    response = requests.get(
+    # Shared keep-alive client: retries, compression and a default timeout
+    response = get_http_client().get(
         f"{base_url}/current?city={city}&apikey={API_KEY}"
     )    
     if response.status_code == 200:
@@ -1,7 +1,22 @@
 
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from skills import SKILLS # We'll define SKILLS in the next step
 
+DEFAULT_RESPONSE = "I'm currently focused on core functions. Try asking me the 'time'."
+
+def dispatch(user_input):
+    """Routes one command through the SKILLS registry. Returns (skill_name, response)."""
+    if user_input in SKILLS:
+        skill_func = SKILLS[user_input]
+        # EXECUTION: Call the linked function and get the result
+        return skill_func.__name__, skill_func()
+    # Default response (the AI placeholder)
+    return None, DEFAULT_RESPONSE
+
 def chat(user_id):    
     print("Jarvis Activated. Start talking (or type 'quit' or 'exit').")
     
@@ -17,18 +32,69 @@ def chat(user_id):
 
             # 2. Routing Logic: The MVP Switchboard
             # We check if the user's input matches any skill keys
-            if user_input in SKILLS:
-                skill_func = SKILLS[user_input]
-                # EXECUTION: Call the linked function and get the result
-                response = skill_func()
-                print(f"Jarvis: {response}")
-            
-            else:
-                # Default response (the AI placeholder)
-                print("Jarvis: I'm currently focused on core functions. Try asking me the 'time'.")
+            skill_name, response = dispatch(user_input)
+            print(f"Jarvis: {response}")
                 
         except Exception as e:
             # Basic error handling to keep the loop running
             print(f"Jarvis Error: A system error occurred: {e}")
 
+# --- BATCH / PIPE MODE ---
+# Streams commands from a file or stdin through the SAME registry and writes
+# one JSON line per command, so new skills can be load-tested without a human.
+
+def _process_command(index, user_id, command):
+    start = time.perf_counter()
+    record = {"index": index, "user_id": user_id, "command": command}
+    try:
+        skill_name, response = dispatch(command)
+        record.update(skill=skill_name, response=response, error=None)
+    except Exception as e:
+        record.update(skill=None, response=None, error=str(e))
+    record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return record
+
+def _read_commands(lines):
+    """Yields (index, command), skipping blank lines and '#' comments."""
+    index = 0
+    for line in lines:
+        command = line.strip().lower()
+        if not command or command.startswith("#"):
+            continue
+        index += 1
+        yield index, command
+
+def run_batch(lines, output, user_id="batch", workers=1):
+    """
+    Dispatches every command in 'lines' and writes JSONL results to 'output'
+    in input order. With workers > 1, commands run on a thread pool while only
+    a small window of results is held in memory.
+    """
+    summary = {"commands": 0, "matched": 0, "errors": 0}
+    start = time.perf_counter()
+
+    def write(record):
+        output.write(json.dumps(record) + "\n")
+        summary["commands"] += 1
+        summary["matched"] += record["skill"] is not None
+        summary["errors"] += record["error"] is not None
+
+    if workers <= 1:
+        for index, command in _read_commands(lines):
+            write(_process_command(index, user_id, command))
+    else:
+        window = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for index, command in _read_commands(lines):
+                window.append(pool.submit(_process_command, index, user_id, command))
+                if len(window) >= workers * 4:
+                    write(window.popleft().result())
+            while window:
+                write(window.popleft().result())
+
+    output.flush()
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    summary["commands_per_sec"] = round(summary["commands"] / summary["seconds"], 1) if summary["seconds"] else 0.0
+    return summary
+
 # This core.py file should only contain routing and logic functions.
@@ -1,11 +1,35 @@
 
-from core import chat
+import argparse
+import json
+import sys
 import uuid
 
+from core import chat, run_batch
+
 # --- APPLICATION LAUNCH ---
 
 if __name__ == "__main__":    
+    parser = argparse.ArgumentParser(description="J.A.R.V.I.S. chat core (interactive or batch).")
+    parser.add_argument('--batch', help="File of commands, one per line ('-' reads stdin).")
+    parser.add_argument('--output', help="Write JSONL results here instead of stdout.")
+    parser.add_argument('--workers', type=int, default=1, help="Dispatch commands on this many threads.")
+    args = parser.parse_args()
+
     session_id = str(uuid.uuid4())[:8]   
-    chat(session_id)
 
-# When you run this file, the 'chat' function takes over.
\ No newline at end of file
+    # Batch mode: explicit --batch, or commands piped in on stdin
+    if args.batch or not sys.stdin.isatty():
+        source = sys.stdin if args.batch in (None, '-') else open(args.batch, encoding="utf-8")
+        output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            summary = run_batch(source, output, user_id=session_id, workers=args.workers)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+        print(f"[Batch] {json.dumps(summary)}", file=sys.stderr)
+    else:
+        chat(session_id)
+
+# When you run this file, the 'chat' function takes over.
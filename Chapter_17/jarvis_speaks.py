@@ -1,6 +1,6 @@
 from datetime import datetime
 import time
-import subprocess
+from speech_host import get_speech_host, SpeechHostError
 import pyttsx3 
 
 # --- CORE FUNCTIONS ---
@@ -40,22 +40,14 @@ def jarvis_speak(text, voice=None):
     if voice is None:
         voice = "Microsoft David Desktop - English (United States)" 
     print(f"Jarvis Output: {text}")
-    safe_text = text.replace("'", "''")   
-    fallback_index = 1 
-    if "david" in voice.lower():
-        fallback_index = 0 
-    cmd = [
-        "powershell",
-        "-NoProfile",
-        "-Command",        
-        f"Add-Type -AssemblyName System.Speech; "
-        f"$speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
-        f"$available = $speak.GetInstalledVoices() | ForEach-Object {{$_.VoiceInfo.Name}}; "        
-        f"if ($available -contains '{voice}') {{$speak.SelectVoice('{voice}')}}\
-          else {{$speak.SelectVoice($available[{fallback_index}])}};"        
-        f"$speak.Speak('{safe_text}')"
-    ]
-    subprocess.run(cmd, check=False)
+    # One persistent PowerShell host: the voice is only re-selected when it changes,
+    # and say() returns when the host acknowledges the sentence was spoken.
+    try:
+        host = get_speech_host()
+        host.set_voice(voice)
+        host.say(text)
+    except SpeechHostError as e:
+        print(f"Jarvis ERROR: Speech host unavailable. Error: {e}")
 
 def execute_time_report(voice=None): 
     now = datetime.now()
@@ -1,5 +1,4 @@
-import time
-import subprocess
+from speech_host import get_speech_host, SpeechHostError
 import pyttsx3 
 import speech_recognition as sr
 import webbrowser
@@ -12,21 +11,13 @@ engine.setProperty('rate', 150)
 engine.setProperty('volume', 0.9)
 
 def jarvis_speak(text, voice=None):     
+    """Handles text-to-speech output through the persistent PowerShell speech host (Windows-only)."""
     print(f"Jarvis Output: {text} [Spoken]")
-    safe_text = text.replace("'", "''")
-    cmd = [
-        "powershell", "-NoProfile", "-Command", 
-        f"Add-Type -AssemblyName System.Speech;\
-          $speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
-        f"$speak.Speak('{safe_text}')"
-    ]
-
-    
-    # In a real environment, uncomment the line below to execute speech
-    subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, 
-    stderr=subprocess.DEVNULL) 
-    
-    time.sleep(len(text) / 200)
+    # NOTE: The host is Windows-only; on macOS/Linux point JARVIS_SPEECH_HOST at standin_speech_host.py.
+    try:
+        get_speech_host().say(text)   # Returns on the host's DONE acknowledgement
+    except SpeechHostError as e:
+        print(f"Jarvis ERROR: Speech host unavailable. Error: {e}")
 
 def set_jarvis_voice(user_voice="Zira"):    
     return "Microsoft David Desktop - English (United States)"
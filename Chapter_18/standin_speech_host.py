@@ -0,0 +1,41 @@
+# Stand-in for speech_host.ps1 on macOS/Linux (and in tests): same line protocol,
+# but "speaking" just prints the sentence to stderr and waits a little.
+#
+#   JARVIS_SPEECH_HOST="python3 standin_speech_host.py" python jarvis_speaks.py
+
+import sys
+import time
+
+SECONDS_PER_CHAR = 0.002      # Pretend speech duration
+
+
+def reply(line):
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def main():
+    voice = "Stand-in Voice"
+    reply("READY")
+    for line in sys.stdin:
+        line = line.rstrip("\n")
+        if line == "QUIT":
+            break
+        parts = line.split(" ", 2)
+        command = parts[0]
+        request_id = parts[1] if len(parts) > 1 else "0"
+        argument = parts[2] if len(parts) > 2 else ""
+
+        if command == "SAY":
+            print(f"[Stand-in host] ({voice}) {argument}", file=sys.stderr)
+            time.sleep(len(argument) * SECONDS_PER_CHAR)
+            reply(f"DONE {request_id}")
+        elif command == "VOICE":
+            voice = argument
+            reply(f"DONE {request_id} {voice}")
+        else:
+            reply(f"ERR {request_id} unknown command {command}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
-import time
-import subprocess
+from speech_host import get_speech_host, SpeechHostError
+from hedged_recognizer import HedgedRecognizer, Tier, RecognitionFailed
+from offline_stt import get_decoder_pool
 import pyttsx3 
 import speech_recognition as sr
 import webbrowser
@@ -18,6 +19,12 @@ from google.api_core import exceptions as gce_exceptions
 DEFAULT_LANGUAGE = "en-US"
 TARGET_SAMPLE_RATE = 16000 
 
+# --- Hedged Recognition Settings ---
+# Sphinx and the free Google wrapper start together; the paid Cloud API is only
+# launched if no confident transcript has arrived after CLOUD_HEDGE_SECONDS.
+CLOUD_HEDGE_SECONDS = 1.0
+ACCEPT_CONFIDENCE = 0.8
+
 # -------------------------------------------------------------
 ## 2. Text-to-Speech (TTS) Functions
 # -------------------------------------------------------------
@@ -27,18 +34,13 @@ engine.setProperty('rate', 150)
 engine.setProperty('volume', 0.9)
 
 def jarvis_speak(text, voice=None): 
-    """Handles text-to-speech output using PowerShell (Windows-only)."""
+    """Handles text-to-speech output through the persistent PowerShell speech host (Windows-only)."""
     print(f"Jarvis Output: {text} [Spoken]")
-    safe_text = text.replace("'", "''")
-    cmd = [
-        "powershell", "-NoProfile", "-Command", 
-        f"Add-Type -AssemblyName System.Speech; $speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
-        f"$speak.Speak('{safe_text}')"
-    ]
-    # NOTE: This PowerShell command is Windows-only. macOS/Linux require alternatives.
-    # To execute speech, uncomment the line below:
-    subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) 
-    time.sleep(len(text) / 200) 
+    # NOTE: The host is Windows-only; on macOS/Linux point JARVIS_SPEECH_HOST at standin_speech_host.py.
+    try:
+        get_speech_host().say(text)   # Returns on the host's DONE acknowledgement
+    except SpeechHostError as e:
+        print(f"Jarvis ERROR: Speech host unavailable. Error: {e}")
 
 def set_jarvis_voice(user_voice="Zira"):
     """Returns a default voice name for the system to use."""
@@ -114,48 +116,59 @@ def jarvis_listen(timeout=5, phrase_time_limit=8):
             return None
 
 
+# The chapter's en-US Sphinx models, unpacked once and kept warm in a decoder pool.
+# They load on a background thread (started by main(), or by the first request):
+# until the pool is ready - or if it cannot load - recognize_sphinx is used instead.
+offline_pool = get_decoder_pool()
+
+def _sphinx_tier(audio_data, language_code=DEFAULT_LANGUAGE):
+    if language_code[:2] == "en":
+        if offline_pool.started:
+            return offline_pool.recognize(audio_data)
+        offline_pool.start_in_background()
+    return r.recognize_sphinx(audio_data, language=language_code[:2])
+
+def _google_tier(audio_data, language_code=DEFAULT_LANGUAGE):
+    return r.recognize_google(audio_data, language=language_code)
+
+def _cloud_tier(audio_data, language_code=DEFAULT_LANGUAGE):
+    text = recognize_with_cloud_api(audio_data, language_code)
+    if not text:
+        raise RecognitionFailed("Dedicated Cloud API returned no transcript")
+    return text
+
+def build_stt_recognizer():
+    """The 3 tiers as concurrent bets instead of a sequential chain."""
+    tiers = [
+        Tier("Offline/Local", _sphinx_tier, confidence=0.5),
+        Tier("Online/High-Accuracy", _google_tier, confidence=0.9),
+    ]
+    if cloud_client:
+        tiers.append(Tier("Dedicated Cloud API", _cloud_tier, confidence=0.95, hedge_delay=CLOUD_HEDGE_SECONDS))
+    return HedgedRecognizer(tiers, accept_confidence=ACCEPT_CONFIDENCE)
+
+stt_recognizer = build_stt_recognizer()
+
+
 def convert_to_text(audio_data, voice_name=None, language_code=DEFAULT_LANGUAGE):
     
     if audio_data is None:
         return ""
-    text = ""
-    
-    # 1. PRIMARY ATTEMPT: FREE GOOGLE WRAPPER (Tier 1)    
-    try:        
-        text = r.recognize_google(audio_data, language=language_code)
-        print(f"User Command (Online/High-Accuracy) [{language_code}]: {text}")
-        return text    
-    except (sr.UnknownValueError, sr.RequestError):
-        print("Jarvis: Primary online recognition failed. Attempting advanced mode...")
-        
-        # 2. SECONDARY ATTEMPT: DEDICATED GOOGLE CLOUD API (Tier 2)
-        if cloud_client:
-            print("Jarvis: Attempting dedicated Google Cloud API...")            
-            text = recognize_with_cloud_api(audio_data, language_code)
-            if text:
-                return text
-            else:
-                print("Jarvis: Dedicated Cloud API failed. Falling back to local mode...")
-
-        # 3. FINAL FALLBACK: OFFLINE LOCAL SPHINX STT (Tier 3)
-        try:            
-            text = r.recognize_sphinx(audio_data, language=language_code[:2]) 
-            print(f"User Command (Offline/Local) [{language_code[:2]}]: {text}")
-            return text
-
-        except sr.UnknownValueError:
-            jarvis_speak("Offline mode failed. Please speak clearly.", voice_name)
-            return ""
-        except sr.RequestError as sphinx_e:            
-            print(f"Jarvis ERROR: PocketSphinx failed (Data Missing). Details: {sphinx_e}")
-            jarvis_speak("Offline recognition data is missing. Please check the PocketSphinx installation.", voice_name)
-            return ""
-    
-    except sr.UnknownValueError:        
-        jarvis_speak("Online recognition failed. I couldn't understand the audio.", voice_name)
-        return ""
-    
     
+    result = stt_recognizer.recognize(audio_data, language_code=language_code)
+    if result:
+        print(f"User Command ({result.tier}) [{language_code}]: {result.text} "
+              f"({result.seconds * 1000:.0f} ms, launched: {', '.join(stt_recognizer.launched)})")
+        return result.text
+
+    # Every tier failed: explain the most useful reason
+    for tier_name, error in stt_recognizer.errors.items():
+        print(f"Jarvis: {tier_name} recognition failed. Details: {error}")
+    if isinstance(stt_recognizer.errors.get("Offline/Local"), sr.RequestError):
+        jarvis_speak("Offline recognition data is missing. Please check the PocketSphinx installation.", voice_name)
+    else:
+        jarvis_speak("I couldn't understand the audio. Please speak clearly.", voice_name)
+    return ""
 
 
 def execute_web_search(text, voice_name):
@@ -175,6 +188,7 @@ def execute_web_search(text, voice_name):
 CURRENT_LANGUAGE = "en-US" 
 
 def main():
+    offline_pool.start_in_background()
     voice_name = set_jarvis_voice("David")
     jarvis_speak("System check complete. Jarvis is now ready.", voice_name)
     
@@ -182,7 +196,7 @@ def main():
         # 1. Listening: Wait for the user to speak
         audio = jarvis_listen(timeout=5, phrase_time_limit=8) 
         
-        # 2. Transcription: Use the 3-Tier Resiliency Chain
+        # 2. Transcription: Use the hedged 3-Tier Resiliency Chain
         command = convert_to_text(audio, voice_name, language_code=CURRENT_LANGUAGE)
         
         # 3. Command Parsing: Process the command (if one was successfully transcribed)
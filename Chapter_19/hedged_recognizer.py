@@ -0,0 +1,187 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+
+# -------------------------------------------------------------
+## Hedged Speech Recognition (replaces the sequential 3-tier chain)
+# -------------------------------------------------------------
+# The old chain ran Google -> Cloud API -> Sphinx one after the other, so the
+# worst case was the SUM of all three. Here every tier is a "bet":
+#   * tiers with hedge_delay=0 start immediately (local Sphinx, free Google)
+#   * the paid Cloud API only starts if nothing good has arrived after its
+#     hedge delay, so it is not billed for every command - or at once, when
+#     every tier before it has already failed and nothing is in flight
+# The first ACCEPTABLE result wins: a result is accepted as soon as its
+# confidence reaches accept_confidence, or when no tier still running could
+# beat it. Tiers that have not started yet are cancelled; running ones are
+# abandoned (their result is ignored). Abandoned calls still hold a worker
+# thread until they return, so the next recognize() gets a fresh executor
+# whenever they would leave too few workers for every tier.
+# Every tier is just a callable, so local stand-ins can replace the online
+# services for offline testing (see make_standin below).
+
+
+class RecognitionFailed(Exception):
+    """Raised by a tier when it could not produce a transcript."""
+
+
+@dataclass
+class Tier:
+    name: str
+    recognize: object               # callable(audio, **options) -> text or (text, confidence); raise to fail
+    confidence: float = 0.5         # Used when the tier does not report its own confidence
+    hedge_delay: float = 0.0        # Seconds to wait for a good result before launching this tier
+
+
+@dataclass
+class RecognitionResult:
+    text: str
+    confidence: float
+    tier: str
+    seconds: float
+
+
+class HedgedRecognizer:
+    """Runs the recognition tiers concurrently and returns the first acceptable transcript."""
+
+    def __init__(self, tiers, accept_confidence=0.8, timeout=15.0):
+        self.tiers = list(tiers)
+        self.accept_confidence = accept_confidence
+        self.timeout = timeout
+        self.max_workers = 2 * len(self.tiers)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stt-tier")
+        self.in_flight = set()      # Futures still holding a worker, including abandoned ones
+        self.errors = {}            # Tier name -> last exception, for the caller's error message
+        self.launched = []          # Tier names launched during the last recognize()
+
+    def _run_tier(self, tier, audio, options, started):
+        result = tier.recognize(audio, **options)
+        text, confidence = result if isinstance(result, tuple) else (result, tier.confidence)
+        if not text:
+            raise RecognitionFailed(f"{tier.name} returned no text")
+        return RecognitionResult(text, confidence, tier.name, time.perf_counter() - started)
+
+    def _reserve_workers(self):
+        """Makes sure every tier of this call can get a worker, even while abandoned calls still run."""
+        self.in_flight = {future for future in self.in_flight if not future.done()}
+        if len(self.in_flight) + len(self.tiers) > self.max_workers:
+            self.executor.shutdown(wait=False)      # Its threads exit as the abandoned calls return
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stt-tier")
+            self.in_flight = set()
+
+    def _launch(self, tier, audio, options, started, running):
+        future = self.executor.submit(self._run_tier, tier, audio, options, started)
+        self.in_flight.add(future)
+        running[future] = tier
+        self.launched.append(tier.name)
+
+    def recognize(self, audio, **options):
+        """Returns the winning RecognitionResult, or None if every tier failed. Options go to every tier."""
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        self.errors = {}
+        self.launched = []
+        self._reserve_workers()
+        waiting = sorted(self.tiers, key=lambda tier: tier.hedge_delay)
+        running = {}                # future -> tier
+        best = None
+
+        while True:
+            now = time.perf_counter()
+            # Launch every tier whose hedge delay has passed
+            while waiting and now - started >= waiting[0].hedge_delay:
+                self._launch(waiting.pop(0), audio, options, started, running)
+            # Nothing in flight and no good result: waiting out the hedge delay cannot help
+            if waiting and not running and not (best and best.confidence >= self.accept_confidence):
+                self._launch(waiting.pop(0), audio, options, started, running)
+
+            if best and (best.confidence >= self.accept_confidence or not self._can_beat(best, running, waiting)):
+                break
+            if not running and not waiting:
+                break
+            if now >= deadline:
+                print("Jarvis: Speech recognition timed out.")
+                break
+
+            next_launch = waiting[0].hedge_delay - (now - started) if waiting else deadline - now
+            pause = max(min(next_launch, deadline - now), 0)
+            done, _ = wait(running, timeout=pause, return_when=FIRST_COMPLETED)
+            for future in done:
+                tier = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.errors[tier.name] = e
+                    continue
+                if best is None or result.confidence > best.confidence:
+                    best = result
+
+        for future in running:
+            future.cancel()         # Running tiers cannot be interrupted; their result is dropped
+        return best
+
+    @staticmethod
+    def _can_beat(best, running, waiting):
+        candidates = list(running.values()) + waiting
+        return any(tier.confidence > best.confidence for tier in candidates)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# -------------------------------------------------------------
+## Local Stand-ins (offline testing)
+# -------------------------------------------------------------
+
+def make_standin(text="", delay=0.0, confidence=None, error=None):
+    """A fake tier: waits 'delay' seconds, then returns text (or raises error)."""
+    def recognize(audio, **options):
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return (text, confidence) if confidence is not None else text
+    return recognize
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly).
+    # Stand-ins replace Sphinx, the free Google wrapper and the Cloud API.
+    scenarios = {
+        "Google answers first": [
+            Tier("sphinx", make_standin("open google", delay=0.6), confidence=0.5),
+            Tier("google", make_standin("open Google", delay=0.3), confidence=0.9),
+            Tier("cloud", make_standin("open Google.", delay=0.4), confidence=0.95, hedge_delay=1.0),
+        ],
+        "Google fails, Cloud API hedges in": [
+            Tier("sphinx", make_standin("open go girl", delay=0.2), confidence=0.5),
+            Tier("google", make_standin(delay=0.3, error=RecognitionFailed("no network")), confidence=0.9),
+            Tier("cloud", make_standin("open Google.", delay=0.3), confidence=0.95, hedge_delay=0.5),
+        ],
+        "Sphinx and Google fail, no hedge wait": [
+            Tier("sphinx", make_standin(delay=0.1, error=RecognitionFailed("no models")), confidence=0.5),
+            Tier("google", make_standin(delay=0.1, error=RecognitionFailed("no network")), confidence=0.9),
+            Tier("cloud", make_standin("open Google.", delay=0.2), confidence=0.95, hedge_delay=1.0),
+        ],
+        "Offline: only Sphinx works": [
+            Tier("sphinx", make_standin("open google", delay=0.4), confidence=0.5),
+            Tier("google", make_standin(delay=0.1, error=RecognitionFailed("offline")), confidence=0.9),
+            Tier("cloud", make_standin(delay=0.1, error=RecognitionFailed("offline")), confidence=0.95, hedge_delay=0.5),
+        ],
+    }
+    for label, tiers in scenarios.items():
+        recognizer = HedgedRecognizer(tiers)
+        result = recognizer.recognize(audio=None)
+        print(f"{label:<38} -> {result.text!r} from {result.tier} in {result.seconds * 1000:.0f} ms "
+              f"(launched: {', '.join(recognizer.launched)})")
+        recognizer.close()
+
+    # A slow tier that keeps losing must not starve the calls after it
+    recognizer = HedgedRecognizer([
+        Tier("sphinx", make_standin("open google", delay=2.0), confidence=0.5),
+        Tier("google", make_standin("open Google", delay=0.1), confidence=0.9),
+    ])
+    for call in range(4):
+        result = recognizer.recognize(audio=None)
+        print(f"Call {call + 1} with abandoned Sphinx calls running  -> {result.text!r} from {result.tier} "
+              f"in {result.seconds * 1000:.0f} ms")
+    recognizer.close()
@@ -0,0 +1,259 @@
+import gzip
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from queue import Queue
+
+import speech_recognition as sr
+
+try:
+    import pocketsphinx
+except ImportError:
+    print("Warning: pocketsphinx not installed. Install with 'pip install pocketsphinx' for offline recognition.")
+    pocketsphinx = None
+
+# -------------------------------------------------------------
+## Offline Recognizer Pool (preloaded Sphinx models)
+# -------------------------------------------------------------
+# r.recognize_sphinx() builds a new decoder - and reloads the acoustic model,
+# the 70k-word language model and the dictionary - on EVERY call. Here:
+#   1. the model assets shipped with this chapter are unpacked ONCE into
+#      models/ (a marker file remembers which archive was unpacked), and the
+#      ARPA text language model is converted ONCE to the binary .lm.bin format
+#   2. decoders open the binary model files memory-mapped (mmap), so N
+#      decoders share one copy of the acoustic and language models in the
+#      page cache (an ARPA .lm cannot be mapped: every decoder parses it)
+#   3. N warm decoders wait in a pool; each request borrows one
+# transcribe_batch() runs many WAV files through the pool at once.
+
+CHAPTER_DIR = Path(__file__).parent
+MODEL_DIR = CHAPTER_DIR / "models"
+ACOUSTIC_ARCHIVE = CHAPTER_DIR / "cmusphinx-en-us-5.2.tar.gz"
+LANGUAGE_MODEL_ARCHIVE = CHAPTER_DIR / "en-70k-0.1.lm.gz"
+DICTIONARY = CHAPTER_DIR / "cmudict.dict"
+SAMPLE_RATE = 16000
+DEFAULT_POOL_SIZE = int(os.environ.get("JARVIS_SPHINX_DECODERS", "2"))
+
+
+class OfflineModelError(RuntimeError):
+    pass
+
+
+# --- Model Assets (unpacked once) ---
+
+def _check_not_lfs_pointer(path):
+    if not path.exists():
+        raise OfflineModelError(f"{path.name} is missing")
+    with open(path, "rb") as f:
+        if f.read(40).startswith(b"version https://git-lfs"):
+            raise OfflineModelError(f"{path.name} is a Git LFS pointer; run 'git lfs pull' to download it")
+
+
+def _is_current(marker, archive):
+    stamp = f"{archive.stat().st_size}:{archive.stat().st_mtime_ns}"
+    return marker.exists() and marker.read_text() == stamp, stamp
+
+
+def prepare_models(model_dir=MODEL_DIR):
+    """Unpacks the acoustic model and the language model if needed. Returns (hmm, lm, dict) paths."""
+    model_dir = Path(model_dir)
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    # Acoustic model: cmusphinx-en-us-5.2.tar.gz -> models/<folder inside the archive>/
+    marker = model_dir / ".acoustic_model"
+    current, stamp = _is_current(marker, ACOUSTIC_ARCHIVE) if ACOUSTIC_ARCHIVE.exists() else (False, "")
+    if not current:
+        _check_not_lfs_pointer(ACOUSTIC_ARCHIVE)
+        start = time.perf_counter()
+        with tarfile.open(ACOUSTIC_ARCHIVE) as archive:
+            top = {member.name.split("/")[0] for member in archive.getmembers()}
+            archive.extractall(model_dir, filter="data")
+        (model_dir / ".acoustic_folder").write_text(sorted(top)[0])
+        marker.write_text(stamp)
+        print(f"[Offline STT] Unpacked acoustic model in {time.perf_counter() - start:.1f} s")
+    hmm = model_dir / (model_dir / ".acoustic_folder").read_text()
+
+    # Language model: en-70k-0.1.lm.gz -> models/en-70k-0.1.lm (ARPA text) -> models/en-70k-0.1.lm.bin
+    arpa = model_dir / LANGUAGE_MODEL_ARCHIVE.stem
+    binary = arpa.with_name(arpa.name + ".bin")
+    marker = model_dir / ".language_model"
+    current, stamp = _is_current(marker, LANGUAGE_MODEL_ARCHIVE) if LANGUAGE_MODEL_ARCHIVE.exists() else (False, "")
+    if not current or not (binary.exists() or arpa.exists()):
+        _check_not_lfs_pointer(LANGUAGE_MODEL_ARCHIVE)
+        start = time.perf_counter()
+        binary.unlink(missing_ok=True)
+        with gzip.open(LANGUAGE_MODEL_ARCHIVE, "rb") as source, open(arpa, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        marker.write_text(stamp)
+        print(f"[Offline STT] Unpacked language model in {time.perf_counter() - start:.1f} s")
+    if not binary.exists() and _convert_lm_to_binary(arpa, binary):
+        arpa.unlink()               # The binary model replaces the 100+ MB text file
+    lm = binary if binary.exists() else arpa
+    if lm == arpa:
+        print("[Offline STT] Warning: using the ARPA language model; each decoder will parse it in full.")
+
+    _check_not_lfs_pointer(DICTIONARY)
+    return hmm, lm, DICTIONARY
+
+
+def _convert_lm_to_binary(arpa, binary):
+    """ARPA text -> binary .lm.bin, with pocketsphinx itself or sphinx_lm_convert. Returns True on success."""
+    temp = binary.with_name("tmp-" + binary.name)      # Keeps the .lm.bin suffix: both tools pick the format from it
+    start = time.perf_counter()
+    try:
+        if pocketsphinx is not None and hasattr(pocketsphinx, "NGramModel") and hasattr(pocketsphinx.NGramModel, "readfile"):
+            pocketsphinx.NGramModel.readfile(str(arpa)).write(str(temp))
+        elif shutil.which("sphinx_lm_convert"):
+            subprocess.run(["sphinx_lm_convert", "-i", str(arpa), "-o", str(temp)], check=True, capture_output=True)
+        else:
+            print("[Offline STT] Warning: neither pocketsphinx 5 nor sphinx_lm_convert is available "
+                  "to convert the language model to binary.")
+            return False
+        os.replace(temp, binary)
+    except Exception as e:
+        print(f"[Offline STT] Warning: could not convert the language model to binary: {e}")
+        temp.unlink(missing_ok=True)
+        return False
+    print(f"[Offline STT] Converted language model to binary in {time.perf_counter() - start:.1f} s")
+    return True
+
+
+def _new_decoder(hmm, lm, dictionary):
+    """One warm decoder with memory-mapped models (pocketsphinx 5 and the older SWIG API)."""
+    if pocketsphinx is None:
+        raise OfflineModelError("pocketsphinx is not installed")
+    if hasattr(pocketsphinx, "Config"):
+        config = pocketsphinx.Config(hmm=str(hmm), lm=str(lm), dict=str(dictionary), mmap=True, loglevel="FATAL")
+        return pocketsphinx.Decoder(config)
+    config = pocketsphinx.Decoder.default_config()
+    config.set_string("-hmm", str(hmm))
+    config.set_string("-lm", str(lm))
+    config.set_string("-dict", str(dictionary))
+    config.set_boolean("-mmap", True)
+    config.set_string("-logfn", os.devnull)
+    return pocketsphinx.Decoder(config)
+
+
+# --- The Decoder Pool ---
+
+class SphinxDecoderPool:
+    """N warm decoders. transcribe() borrows one, so up to N requests decode concurrently."""
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, model_dir=MODEL_DIR):
+        self.size = size
+        self.model_dir = model_dir
+        self.decoders = Queue()
+        self.started = False
+        self.load_seconds = None
+        self.error = None           # OfflineModelError from a background load
+        self._loader = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Unpacks the models (first run only) and loads N decoders. Raises OfflineModelError."""
+        with self._lock:
+            if self.started:
+                return
+            start = time.perf_counter()
+            hmm, lm, dictionary = prepare_models(self.model_dir)
+            for _ in range(self.size):
+                self.decoders.put(_new_decoder(hmm, lm, dictionary))
+            self.started = True
+            self.load_seconds = time.perf_counter() - start
+            print(f"[Offline STT] {self.size} decoders ready in {self.load_seconds:.1f} s")
+
+    def start_in_background(self):
+        """Loads the decoders on a daemon thread, so the caller never waits for the models."""
+        with self._lock:
+            if self.started or self._loader is not None:
+                return
+
+            def load():
+                try:
+                    self.start()
+                except OfflineModelError as e:
+                    self.error = e
+                    print(f"[Offline STT] Decoder pool unavailable: {e}")
+
+            self._loader = threading.Thread(target=load, name="sphinx-pool-loader", daemon=True)
+            self._loader.start()
+
+    def transcribe_pcm(self, pcm):
+        """16 kHz, 16-bit mono PCM bytes -> text ("" if nothing was recognized)."""
+        self.start()
+        decoder = self.decoders.get()
+        try:
+            decoder.start_utt()
+            decoder.process_raw(pcm, False, True)
+            decoder.end_utt()
+            hypothesis = decoder.hyp()
+            return hypothesis.hypstr if hypothesis else ""
+        finally:
+            self.decoders.put(decoder)
+
+    def recognize(self, audio_data, **options):
+        """Same role as r.recognize_sphinx(audio_data), usable as a HedgedRecognizer tier."""
+        text = self.transcribe_pcm(audio_data.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2))
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+    def transcribe_wav(self, path):
+        with wave.open(str(path), "rb") as wav:
+            channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+            pcm = wav.readframes(wav.getnframes())
+        if (channels, width, rate) != (1, 2, SAMPLE_RATE):
+            if channels != 1:
+                raise ValueError(f"{Path(path).name}: only mono WAV files are supported")
+            pcm = sr.AudioData(pcm, rate, width).get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+        return self.transcribe_pcm(pcm)
+
+    def transcribe_batch(self, paths):
+        """Transcribes many WAV files concurrently (one per warm decoder). Returns [(path, text or error)] in order."""
+        self.start()
+
+        def run(path):
+            try:
+                return path, self.transcribe_wav(path)
+            except Exception as e:
+                return path, e
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, paths))
+
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_decoder_pool():
+    """The process-wide pool (decoders load on first use)."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = SphinxDecoderPool()
+        return _shared_pool
+
+
+if __name__ == "__main__":
+    # Batch transcription: python offline_stt.py recording1.wav recording2.wav ...
+    pool = get_decoder_pool()
+    try:
+        pool.start()
+    except OfflineModelError as e:
+        print(f"Jarvis ERROR: Offline models are not available. {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = pool.transcribe_batch(sys.argv[1:])
+    for path, text in results:
+        print(f"{path}: {text}")
+    if results:
+        print(f"{len(results)} files in {time.perf_counter() - start:.2f} s with {pool.size} decoders")
@@ -0,0 +1,86 @@
+# Latency benchmark: one TextBlob per command (old) vs. the persistent JarvisAnalyzer.
+# Each mode runs in a FRESH interpreter so the "cold" first command is really cold.
+# Usage: python bench_nlp_analyzer.py
+
+import json
+import subprocess
+import sys
+import time
+
+COMMANDS = [
+    "Jarvis, I need to watch the best python tutorial video",
+    "search the web for the latest news about the mars rover",
+    "that was a terrible result, find me a better pizza recipe",
+    "play some relaxing jazz music on youtube",
+    "what is the weather forecast for new york tomorrow",
+]
+WARM_ROUNDS = 20
+
+
+def run_textblob():
+    from textblob import TextBlob
+
+    def analyze(command):
+        blob = TextBlob(command)
+        return blob.noun_phrases, blob.tags, blob.sentiment.polarity
+
+    return analyze, None
+
+
+def run_analyzer():
+    from nlp_analyzer import JarvisAnalyzer
+    analyzer = JarvisAnalyzer()
+    return analyzer.analyze, analyzer.warm_up
+
+
+def measure(mode):
+    setup_start = time.perf_counter()
+    analyze, warm_up = run_textblob() if mode == "textblob" else run_analyzer()
+    if warm_up:
+        warm_up()
+    startup_s = time.perf_counter() - setup_start
+
+    start = time.perf_counter()
+    analyze(COMMANDS[0])
+    cold_s = time.perf_counter() - start
+
+    unique_s = []
+    for command in COMMANDS[1:]:
+        start = time.perf_counter()
+        analyze(command)
+        unique_s.append(time.perf_counter() - start)
+
+    repeat_s = []
+    for _ in range(WARM_ROUNDS):
+        for command in COMMANDS:
+            start = time.perf_counter()
+            analyze(command)
+            repeat_s.append(time.perf_counter() - start)
+
+    return {
+        "startup_ms": startup_s * 1000,
+        "first_command_ms": cold_s * 1000,
+        "warm_unique_ms": sum(unique_s) / len(unique_s) * 1000,
+        "warm_repeat_ms": sum(repeat_s) / len(repeat_s) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(json.dumps(measure(sys.argv[1])))
+        sys.exit(0)
+
+    print(f"{'mode':<10} | {'startup':>10} | {'1st command':>12} | {'new command':>12} | {'repeat':>10}")
+    print("-" * 66)
+    for mode in ["textblob", "analyzer"]:
+        result = subprocess.run([sys.executable, __file__, mode], capture_output=True, text=True)
+        if result.returncode != 0:
+            # NLTK's missing-corpus errors end in a banner; report the line that names the problem
+            lines = [line.strip() for line in result.stderr.splitlines() if line.strip().strip("*")]
+            reason = next((line for line in lines if line.startswith("Resource")),
+                          next((line for line in lines if "Error" in line), lines[-1] if lines else ""))
+            print(f"{mode:<10} | failed: {reason}")
+            continue
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{mode:<10} | {stats['startup_ms']:>7.1f} ms | {stats['first_command_ms']:>9.1f} ms | "
+              f"{stats['warm_unique_ms']:>9.2f} ms | {stats['warm_repeat_ms']:>7.3f} ms")
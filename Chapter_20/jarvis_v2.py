@@ -1,5 +1,4 @@
-import time
-import subprocess
+from speech_host import get_speech_host, SpeechHostError
 import pyttsx3 
 import speech_recognition as sr
 import webbrowser
@@ -8,9 +7,9 @@ import os
 from google.cloud import speech 
 from google.api_core import exceptions as gce_exceptions 
 # -------------------------------------------------------------
-## 0. NEW: TextBlob Import for NLP
+## 0. NEW: TextBlob-based NLP Analyzer (models loaded once)
 # -------------------------------------------------------------
-from textblob import TextBlob 
+from nlp_analyzer import JarvisAnalyzer
 
 # -------------------------------------------------------------
 ## 1. Configuration Settings
@@ -28,16 +27,13 @@ engine.setProperty('rate', 150)
 engine.setProperty('volume', 0.9)
 
 def jarvis_speak(text, voice=None): 
-    """Handles text-to-speech output using PowerShell (Windows-only)."""
+    """Handles text-to-speech output through the persistent PowerShell speech host (Windows-only)."""
     print(f"Jarvis Output: {text} [Spoken]")
-    safe_text = text.replace("'", "''")
-    cmd = [
-        "powershell", "-NoProfile", "-Command", 
-        f"Add-Type -AssemblyName System.Speech; $speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
-        f"$speak.Speak('{safe_text}')"
-    ]
-    subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) 
-    time.sleep(len(text) / 200) 
+    # NOTE: The host is Windows-only; on macOS/Linux point JARVIS_SPEECH_HOST at standin_speech_host.py.
+    try:
+        get_speech_host().say(text)   # Returns on the host's DONE acknowledgement
+    except SpeechHostError as e:
+        print(f"Jarvis ERROR: Speech host unavailable. Error: {e}")
 
 def set_jarvis_voice(user_voice="Zira"):
     """Returns a default voice name for the system to use."""
@@ -181,16 +177,19 @@ def execute_youtube_search(text, voice_name):
 ## 7. NEW: Intelligent Command Processor (SECTION 2.4 - FINAL SOLUTION)
 # -------------------------------------------------------------
 
+# Loaded once at start-up and shared by every command (warmed up in main()).
+ANALYZER = JarvisAnalyzer(cache_size=256)
+
 def parse_command_for_intent(command, voice_name): 
 
-    blob = TextBlob(command)
+    analysis = ANALYZER.analyze(command)
     command_lower = command.lower()
 
     # Define the exclusion list globally for both steps 1 and 2
     EXCLUSION_WORDS = ["jarvis", "search", "result", "terrible", "execute", "that", "was", "a", "an", "the", "for", "i", "need", "to", "watch"]
 
     # 1. Extract and Filter Key Phrases (Standard TextBlob Noun Phrases)
-    key_phrases_raw = [str(p).lower() for p in blob.noun_phrases] 
+    key_phrases_raw = list(analysis.noun_phrases) 
     
     # Filter out phrases that contain exclusion words (Fixes Bug 3: Excluding 'search')
     # This prevents command words from polluting the initial search_query if TextBlob captures them.
@@ -208,7 +207,7 @@ def parse_command_for_intent(command, voice_name):
     # and the command is long, we use POS tagging as a fallback to capture adjectives.
     if len(search_query.split()) < 3 and len(command_lower.split()) > 4:
             
-        tokens_and_tags = blob.tags
+        tokens_and_tags = analysis.tags
         smart_query_tokens = []
 
         for i, (token, tag) in enumerate(tokens_and_tags):
@@ -226,7 +225,7 @@ def parse_command_for_intent(command, voice_name):
             search_query = " ".join(smart_query_tokens)
 
     # 3. Check Sentiment
-    sentiment_score = blob.sentiment.polarity 
+    sentiment_score = analysis.polarity 
     if sentiment_score < -0.3:
         jarvis_speak("I apologize for any issue. I will try to find a better result for you.", 
                       voice_name)
@@ -254,6 +253,7 @@ CURRENT_LANGUAGE = "en-US"
 
 def main():
     voice_name = set_jarvis_voice("David")
+    ANALYZER.warm_up()  # Pay the model loading cost now, not on the first command
     jarvis_speak("System check complete. Jarvis is now ready.", voice_name)
     
     while True: 
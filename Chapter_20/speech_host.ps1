@@ -0,0 +1,56 @@
+# Jarvis speech host: ONE PowerShell process and ONE SpeechSynthesizer for the whole session.
+# Line protocol (UTF-8, one command per line on stdin, one reply per line on stdout):
+#   -> READY                       (sent once, when the synthesizer is loaded)
+#   <- SAY <id> <text>             -> DONE <id>            (after the sentence has been spoken)
+#   <- VOICE <id> <voice name>     -> DONE <id> <selected voice>
+#   <- QUIT                        (host exits)
+#   Any failure                    -> ERR <id> <message>
+
+[Console]::InputEncoding = [System.Text.Encoding]::UTF8
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+
+Add-Type -AssemblyName System.Speech
+$speak = New-Object System.Speech.Synthesis.SpeechSynthesizer
+$speak.SetOutputToDefaultAudioDevice()
+
+function Send-Reply($reply) {
+    [Console]::Out.WriteLine($reply)
+    [Console]::Out.Flush()
+}
+
+Send-Reply "READY"
+
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($null -eq $line -or $line -eq "QUIT") { break }
+
+    $parts = $line.Split(" ", 3)
+    $command = $parts[0]
+    $id = if ($parts.Length -gt 1) { $parts[1] } else { "0" }
+    $argument = if ($parts.Length -gt 2) { $parts[2] } else { "" }
+
+    try {
+        switch ($command) {
+            "SAY" {
+                $speak.Speak($argument)
+                Send-Reply "DONE $id"
+            }
+            "VOICE" {
+                # Same fallback as the original one-shot command: David -> first voice, others -> second.
+                $available = @($speak.GetInstalledVoices() | ForEach-Object { $_.VoiceInfo.Name })
+                if ($available -contains $argument) {
+                    $speak.SelectVoice($argument)
+                } else {
+                    $fallback = if ($argument.ToLower().Contains("david")) { 0 } else { 1 }
+                    $speak.SelectVoice($available[[Math]::Min($fallback, $available.Length - 1)])
+                }
+                Send-Reply "DONE $id $($speak.Voice.Name)"
+            }
+            default {
+                Send-Reply "ERR $id unknown command $command"
+            }
+        }
+    } catch {
+        Send-Reply "ERR $id $($_.Exception.Message -replace '\r?\n', ' ')"
+    }
+}
@@ -0,0 +1,176 @@
+import atexit
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from queue import Queue, Empty
+
+# -------------------------------------------------------------
+## Persistent Speech Host (replaces one PowerShell per sentence)
+# -------------------------------------------------------------
+# PowerShell starts ONCE, loads System.Speech ONCE and keeps one
+# SpeechSynthesizer. Python sends one command per line over stdin and waits
+# for an explicit "DONE <id>" instead of guessing with time.sleep(len(text)/200).
+# The protocol is documented in speech_host.ps1; standin_speech_host.py speaks
+# the same protocol for macOS/Linux and tests:
+#   JARVIS_SPEECH_HOST="python3 standin_speech_host.py"
+
+HOST_SCRIPT = Path(__file__).parent / "speech_host.ps1"
+DEFAULT_HOST_COMMAND = ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", str(HOST_SCRIPT)]
+START_TIMEOUT_SECONDS = 20.0
+SECONDS_PER_CHAR_LIMIT = 0.2       # Generous upper bound on speech duration, only used as a timeout
+
+
+class SpeechHostError(RuntimeError):
+    pass
+
+
+class SpeechHost:
+    """One long-running synthesis process. say() blocks until the host acknowledges the sentence."""
+
+    def __init__(self, command=None):
+        if command is None:
+            override = os.environ.get("JARVIS_SPEECH_HOST")
+            command = shlex.split(override, posix=os.name != "nt") if override else DEFAULT_HOST_COMMAND
+        self.command = command
+        self.process = None
+        self.voice = None
+        self._replies = Queue()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    # --- Process lifecycle ---
+
+    def start(self):
+        start = time.perf_counter()
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            cwd=Path(__file__).parent,
+        )
+        self._replies = Queue()
+        threading.Thread(target=self._read_replies, args=(self.process, self._replies), daemon=True).start()
+
+        if self._wait_for(lambda line: line == "READY", START_TIMEOUT_SECONDS) is None:
+            self.close()
+            raise SpeechHostError("speech host did not report READY")
+        self.voice = None
+        print(f"Jarvis: Speech host ready in {(time.perf_counter() - start) * 1000:.0f} ms.")
+
+    @staticmethod
+    def _read_replies(process, replies):
+        for line in process.stdout:
+            replies.put(line.rstrip("\r\n"))
+        replies.put(None)   # EOF: the host died or exited
+
+    def _wait_for(self, accept, timeout):
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            try:
+                line = self._replies.get(timeout=remaining)
+            except Empty:
+                return None
+            if line is None:
+                raise SpeechHostError("speech host exited")
+            if accept(line):
+                return line
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None:
+                self.process.stdin.write("QUIT\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=2)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.process.kill()
+        self.process = None
+
+    # --- Requests ---
+
+    def _request(self, command, argument, timeout):
+        """Sends one command line and waits for its DONE/ERR. Restarts a dead host once."""
+        argument = " ".join(argument.split())    # The protocol is one line per command
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if not self.is_alive():
+                        self.start()
+                    self._next_id += 1
+                    request_id = str(self._next_id)
+                    self.process.stdin.write(f"{command} {request_id} {argument}\n")
+                    self.process.stdin.flush()
+                    reply = self._wait_for(lambda line: line.split(" ", 2)[1:2] == [request_id], timeout)
+                except (OSError, ValueError, SpeechHostError) as e:
+                    if attempt == 1:
+                        raise SpeechHostError(f"speech host failed: {e}") from e
+                    print(f"Jarvis: Speech host stopped ({e}). Restarting it.")
+                    self.close()
+                    continue
+
+                if reply is None:
+                    raise SpeechHostError(f"no acknowledgement for {command} within {timeout:.0f} s")
+                status, _, detail = reply.partition(f" {request_id}")
+                if status == "ERR":
+                    raise SpeechHostError(detail.strip())
+                return detail.strip()
+
+    def say(self, text):
+        """Speaks text and returns once the host has finished speaking it."""
+        if not text.strip():
+            return
+        self._request("SAY", text, timeout=10 + len(text) * SECONDS_PER_CHAR_LIMIT)
+
+    def set_voice(self, voice):
+        """Selects a voice (only talks to the host when the voice actually changes)."""
+        if voice and voice != self.voice:
+            selected = self._request("VOICE", voice, timeout=10)
+            self.voice = voice
+            return selected
+        return None
+
+
+_shared_host = None
+_shared_lock = threading.Lock()
+
+
+def get_speech_host():
+    """The process-wide host, started on first use and closed at exit."""
+    global _shared_host
+    with _shared_lock:
+        if _shared_host is None:
+            _shared_host = SpeechHost()
+            atexit.register(_shared_host.close)
+        return _shared_host
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly).
+    # On macOS/Linux it uses the stand-in host that speaks the same protocol.
+    command = None
+    if os.name != "nt" and not os.environ.get("JARVIS_SPEECH_HOST"):
+        command = [sys.executable, str(Path(__file__).parent / "standin_speech_host.py")]
+
+    host = SpeechHost(command)
+    host.start()
+    print(f"Voice: {host.set_voice('Microsoft David Desktop - English (United States)')}")
+    for sentence in ["Awaiting command.", "It's 10 o'clock, and the file is \"done\".", "Third sentence, same process."]:
+        start = time.perf_counter()
+        host.say(sentence)
+        print(f"Acknowledged after {(time.perf_counter() - start) * 1000:.0f} ms: {sentence}")
+    host.close()
@@ -1,6 +1,5 @@
 import os
-import pvporcupine
-from pvrecorder import PvRecorder
+from wake_word_service import WakeWordService
 import pyttsx3
 import threading 
 import speech_recognition as sr 
@@ -33,56 +32,44 @@ def jarvis_speak(text):
 ACCESS_KEY = os.environ.get("PICOVOICE_ACCESS_KEY")
 WAKE_WORD = "jarvis" 
 
+wake_service = None  # ONE detector + ONE audio stream for the whole process
+
 def wake_word_loop():
+    global wake_service
     
     if not ACCESS_KEY:
         print("Jarvis ERROR: PICOVOICE_ACCESS_KEY environment variable not set.")
         return None
         
-    try:
-        porcupine = pvporcupine.create(
-            access_key=ACCESS_KEY,
-            keywords=[WAKE_WORD]
-        )
-    
-    except Exception as e:
-        print(f"Jarvis ERROR: Failed to initialize Porcupine. Error: {e}")
-        return None
+    if wake_service is None:
+        service = WakeWordService(ACCESS_KEY, WAKE_WORD)
+        try:
+            service.start()
+        except Exception as e:
+            print(f"Jarvis ERROR: Failed to initialize Porcupine. Error: {e}")
+            return None
+        wake_service = service
 
-    # Initialize the audio recorder
-    recorder = PvRecorder(
-        frame_length=porcupine.frame_length,
-        device_index=-1 
-    )
-    recorder.start()
     print(f"🔊 Listening passively for '{WAKE_WORD}'...")
-    
-    try:
-        while True:  
-            pcm = recorder.read()  
-            keyword_index = porcupine.process(pcm)              
-            if keyword_index >= 0:
-                print(f"Wake Word Detected: {WAKE_WORD.upper()}!")                  
-                tts_thread = threading.Thread(
-                    target=jarvis_speak, 
-                    args=("At your service. How may I help?",)
-                )
-                tts_thread.start()
-                break 
-    finally:         
-        porcupine.delete()    
-    return recorder 
+    wake_service.wait_for_wake_word()
+    print(f"Wake Word Detected: {WAKE_WORD.upper()}!")                  
+    tts_thread = threading.Thread(
+        target=jarvis_speak, 
+        args=("At your service. How may I help?",)
+    )
+    tts_thread.start()
+    return wake_service 
     
 
 # -------------------------------------------------------------
 ## Main Execution (Live STT)
 # -------------------------------------------------------------
 
-def listen_for_command(recorder, recognizer):
+def listen_for_command(wake_word_service, recognizer):
   
-    if not recorder:
+    if not wake_word_service:
         return None    
-    recorder.stop()
+    wake_word_service.pause()   # Frees the microphone; the detector stays loaded
     
     with sr.Microphone() as source:
         print("--- JARVIS: Active Listening State. Speak Now... ---")
@@ -109,26 +96,32 @@ def listen_for_command(recorder, recognizer):
 def main():  
     
     r = sr.Recognizer()   
-    active_recorder = wake_word_loop()     
-    if active_recorder is None:
-        print(" Fatal Error: " \
-              "Could not initialize wake word or audio recorder. Exiting.")
-        return
-    
-    
-    print("\n--- Transitioning to Active Command Listener ---")    
-    command_text = listen_for_command(active_recorder, r)    
-    if command_text:
-        print(f" FINAL COMMAND RECEIVED: {command_text}")
-    else:
-        print(" Command processing failed or was empty.")        
-    
     try:
-        active_recorder.delete()
-    except Exception as e:
-        print(f"Warning: Could not delete recorder object. {e}")
+        # Every cycle reuses the same detector and audio stream: nothing is rebuilt between commands.
+        while True:
+            active_service = wake_word_loop()     
+            if active_service is None:
+                print(" Fatal Error: " \
+                      "Could not initialize wake word or audio recorder. Exiting.")
+                return
+            if active_service.last_rearm_seconds is not None:
+                print(f"[Wake Word] Re-armed {active_service.last_rearm_seconds * 1000:.1f} ms after the last command")
+            
+            print("\n--- Transitioning to Active Command Listener ---")    
+            command_text = listen_for_command(active_service, r)    
+            if command_text:
+                print(f" FINAL COMMAND RECEIVED: {command_text}")
+                if "exit" in command_text or "shutdown" in command_text:
+                    break
+            else:
+                print(" Command processing failed or was empty.")        
+    except KeyboardInterrupt:
+        print("\n--- Interrupted ---")
+    finally:
+        if wake_service:
+            wake_service.close()
         
-    print("--- Test Scenario Complete ---")
+    print("--- Session Complete ---")
 
 
 if __name__ == "__main__":
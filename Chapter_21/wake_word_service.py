@@ -0,0 +1,95 @@
+import time
+
+import pvporcupine
+from pvrecorder import PvRecorder
+
+# --- The Persistent Wake Word Service ---
+# ONE Porcupine detector and ONE PvRecorder for the whole session.
+# Old cycle: create Porcupine -> open the recorder -> detect -> delete both.
+# New cycle: resume -> detect -> pause (while the command is heard) -> resume.
+# Model loading and audio device setup are paid once. pause() only stops
+# feeding frames to the detector: the audio stream keeps running (shared-mode
+# devices let sr.Microphone open the same mic meanwhile), so resume() just
+# drops the frames captured during the command and is live again at once.
+
+MAX_STALE_FRAMES = 2000         # Upper bound on frames dropped by resume(), whatever the buffer size
+
+
+class WakeWordService:
+    """Owns the wake word detector and its audio stream. Use it from one thread (the main loop)."""
+
+    def __init__(self, access_key, keyword, device_index=-1, detector_factory=None, recorder_factory=None):
+        self.access_key = access_key
+        self.keyword = keyword
+        self.device_index = device_index
+        self.detector_factory = detector_factory or pvporcupine.create
+        self.recorder_factory = recorder_factory or PvRecorder
+        self.porcupine = None
+        self.recorder = None
+        self.listening = False
+        self.detections = 0
+        self.init_seconds = None
+        self.last_rearm_seconds = None
+        self._rearm_started = None
+
+    def start(self):
+        """Loads the model and opens the audio device (once). Raises on failure."""
+        if self.porcupine is not None:
+            return
+        start = time.perf_counter()
+        self.porcupine = self.detector_factory(access_key=self.access_key, keywords=[self.keyword])
+        try:
+            self.recorder = self.recorder_factory(frame_length=self.porcupine.frame_length, device_index=self.device_index)
+            self.recorder.start()
+        except Exception:
+            self.close()
+            raise
+        self.listening = True
+        self.init_seconds = time.perf_counter() - start
+        print(f"[Wake Word] Detector and audio stream ready in {self.init_seconds * 1000:.0f} ms")
+
+    def pause(self):
+        """Stops feeding the detector while the command is heard; the stream and the detector stay live."""
+        self.listening = False
+
+    def resume(self):
+        if self.recorder and not self.listening:
+            self._rearm_started = time.perf_counter()
+            self._drop_stale_frames()
+            self.listening = True
+
+    def _drop_stale_frames(self):
+        """Frames buffered while paused (the command itself) must not reach the detector."""
+        frame_seconds = self.porcupine.frame_length / self.porcupine.sample_rate
+        for _ in range(MAX_STALE_FRAMES):
+            start = time.perf_counter()
+            self.recorder.read()
+            if time.perf_counter() - start >= frame_seconds / 2:
+                return          # This read waited for new audio: the buffer is drained
+
+    def wait_for_wake_word(self):
+        """Blocks until the wake word is heard. Returns the keyword index."""
+        self.start()
+        self.resume()
+        while True:
+            pcm = self.recorder.read()
+            keyword_index = self.porcupine.process(pcm)
+            if self._rearm_started is not None:
+                # Re-arm latency: resume() until the detector has processed live audio again
+                self.last_rearm_seconds = time.perf_counter() - self._rearm_started
+                self._rearm_started = None
+            if keyword_index >= 0:
+                self.detections += 1
+                return keyword_index
+
+    def close(self):
+        if self.recorder:
+            try:
+                self.recorder.delete()
+            except Exception as e:
+                print(f"Warning: Could not delete recorder object. {e}")
+        if self.porcupine:
+            self.porcupine.delete()
+        self.recorder = None
+        self.porcupine = None
+        self.listening = False
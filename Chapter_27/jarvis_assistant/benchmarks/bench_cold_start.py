@@ -0,0 +1,73 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_cold_start.py
+# Reports the skill import cost at start-up using 'python -X importtime'.
+# Run from the jarvis-assistant folder: python benchmarks/bench_cold_start.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+# BEFORE: what main.py used to import eagerly at the top of the file.
+EAGER_IMPORTS = (
+    "from skills.pdf_parser import pdf_parse\n"
+    "from skills.pdf_ocr import image_ocr\n"
+    "from skills.yt_tools import yt_inspect, yt_summarize\n"
+    "from skills.yt_tools_archival import yt_saveaudio, yt_savevideo\n"
+    "from skills.web_tools import scrape_url_for_selector\n"
+    "from skills.dynamic_tools import scrape_dynamic_site\n"
+)
+
+# AFTER: the lazy registry only creates proxies.
+LAZY_IMPORTS = (
+    "from core.skill_registry import SkillRegistry\n"
+    "registry = SkillRegistry()\n"
+    "for target in ['skills.pdf_parser:pdf_parse', 'skills.pdf_ocr:image_ocr',\n"
+    "               'skills.yt_tools:yt_inspect', 'skills.yt_tools:yt_summarize',\n"
+    "               'skills.yt_tools_archival:yt_saveaudio', 'skills.yt_tools_archival:yt_savevideo',\n"
+    "               'skills.web_tools:scrape_url_for_selector', 'skills.dynamic_tools:scrape_dynamic_site']:\n"
+    "    registry.lazy(target)\n"
+)
+
+
+def measure_import_time(code):
+    """
+    Runs the code in a fresh interpreter with -X importtime and returns
+    (total_import_ms, slowest_modules, error_text).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        if not cumulative.isdigit():
+            continue
+        # Top-level imports have no leading indentation in the module column
+        raw_name = line.split("|")[2]
+        if raw_name.startswith(" ") and not raw_name.startswith("  "):
+            top_level.append((int(cumulative), name))
+
+    total_ms = sum(us for us, _ in top_level) / 1000
+    slowest = sorted(top_level, reverse=True)[:5]
+    error = result.stderr.strip().splitlines()[-1] if result.returncode != 0 else None
+    return total_ms, slowest, error
+
+
+if __name__ == "__main__":
+    # Interpreter start-up (site, encodings, ...) is paid either way.
+    baseline_ms, _, _ = measure_import_time("pass")
+
+    for label, code in [("BEFORE (eager)", EAGER_IMPORTS), ("AFTER (lazy)", LAZY_IMPORTS)]:
+        total_ms, slowest, error = measure_import_time(code)
+        print(f"\n--- {label}: {total_ms - baseline_ms:.1f} ms of skill imports ---")
+        for us, name in slowest:
+            print(f"   {us / 1000:>8.1f} ms  {name}")
+        if error:
+            print(f"   (stopped early: {error})")
@@ -0,0 +1,79 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_http_client.py
+# Requests/sec against a local HTTP/1.1 server:
+#   requests.get  - the old pattern, a new connection for every call
+#   shared client - skills.http_client (keep-alive pools, gzip)
+# Each mode runs sequentially and with WORKERS threads (like a multi-page scrape).
+# The page is ~60 KB of HTML, gzip-compressed when the client asks for it.
+# Run from the jarvis-assistant folder: python benchmarks/bench_http_client.py
+
+import gzip
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from skills.http_client import HttpClient
+
+REQUESTS = 300
+WORKERS = 8
+PAGE = ("<html><body>" + "".join(f"<h2 class='widget-title'>Headline {i}</h2><p>Story text {i}.</p>"
+                                 for i in range(1500)) + "</body></html>").encode()
+PAGE_GZIP = gzip.compress(PAGE)
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"          # Keep-alive, like real web servers
+    disable_nagle_algorithm = True         # Headers and body are separate writes
+    bytes_sent = 0
+
+    def do_GET(self):
+        compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+        body = PAGE_GZIP if compressed else PAGE
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+        PageHandler.bytes_sent += len(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(label, get, url, workers):
+    PageHandler.bytes_sent = 0
+    start = time.perf_counter()
+    if workers == 1:
+        for _ in range(REQUESTS):
+            get(url).content
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda _: get(url).content, range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<16} x{workers:<2} {REQUESTS / elapsed:8.0f} req/s | "
+          f"{PageHandler.bytes_sent / REQUESTS / 1024:6.1f} KB on the wire per request")
+    return REQUESTS / elapsed
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/page.html"
+
+    client = HttpClient()
+    try:
+        for workers in (1, WORKERS):
+            # Plain requests.get() still sends Accept-Encoding: gzip, so this isolates connection reuse
+            before = run("requests.get", lambda u: requests.get(u, timeout=10), url, workers)
+            after = run("shared client", client.get, url, workers)
+            print(f"{'':<20} speed-up: {after / before:.1f}x\n")
+    finally:
+        client.close()
+        server.shutdown()
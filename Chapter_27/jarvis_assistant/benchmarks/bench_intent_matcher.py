@@ -0,0 +1,80 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_intent_matcher.py
+# Compares the old linear SKILL_MAP scan against the compiled IntentMatcher.
+# Run from the jarvis-assistant folder: python benchmarks/bench_intent_matcher.py
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.intent_matcher import IntentMatcher
+
+TRIGGER_COUNTS = [20, 500, 5000]
+COMMANDS_PER_RUN = 2000
+REPEATS = 5
+
+
+def _dummy_skill(command):
+    return True
+
+
+def build_skill_map(count, rng):
+    """Creates 'count' unique two/three word trigger phrases."""
+    skill_map = {}
+    while len(skill_map) < count:
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+                 for _ in range(rng.randint(2, 3))]
+        skill_map[" ".join(words)] = _dummy_skill
+    return skill_map
+
+
+def build_commands(skill_map, rng):
+    """Half of the commands contain a trigger, the other half are misses."""
+    triggers = list(skill_map)
+    commands = []
+    for i in range(COMMANDS_PER_RUN):
+        if i % 2 == 0:
+            commands.append(f"jarvis please {rng.choice(triggers)} for me right now")
+        else:
+            commands.append("jarvis please tell me something i have not taught you yet")
+    return commands
+
+
+def linear_route(skill_map, command):
+    """The original parse_command_for_intent loop."""
+    for keyword, skill_function in skill_map.items():
+        if keyword in command:
+            return keyword, skill_function
+    return None
+
+
+def time_per_command(route, commands):
+    """Best-of-REPEATS average time per command, in microseconds."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for command in commands:
+            route(command)
+        best = min(best, time.perf_counter() - start)
+    return best / len(commands) * 1_000_000
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    print(f"{'triggers':>9} | {'linear (us)':>12} | {'matcher (us)':>12} | {'build (ms)':>10} | {'speedup':>7}")
+    print("-" * 62)
+
+    for count in TRIGGER_COUNTS:
+        skill_map = build_skill_map(count, rng)
+        commands = build_commands(skill_map, rng)
+
+        build_start = time.perf_counter()
+        matcher = IntentMatcher(skill_map)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        linear_us = time_per_command(lambda c: linear_route(skill_map, c), commands)
+        matcher_us = time_per_command(matcher.match, commands)
+
+        print(f"{count:>9} | {linear_us:>12.2f} | {matcher_us:>12.2f} | {build_ms:>10.1f} | {linear_us / matcher_us:>6.1f}x")
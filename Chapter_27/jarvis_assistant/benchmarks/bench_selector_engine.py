@@ -0,0 +1,111 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_selector_engine.py
+# parse_data() engines on saved HTML pages of different sizes:
+#   BeautifulSoup - the old path, BeautifulSoup(html, 'lxml').select(selector)
+#   lxml tree     - skills.selector_engine, compiled selector on lxml's tree
+#   lxml stream   - the same selector, streamed (simple selectors only)
+# Reports throughput (MB of HTML per second) and the peak memory the extraction
+# added. Every measurement runs in a fresh process, so peaks do not hide each other.
+# Run from the jarvis-assistant folder:
+#   python benchmarks/bench_selector_engine.py path/to/pages/*.html
+# Without arguments it uses data/html_fixtures/*.html, or synthetic pages if that folder is empty.
+
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import resource
+except ImportError:
+    resource = None             # Windows: throughput only
+
+FIXTURE_DIR = Path(__file__).parent.parent / "data" / "html_fixtures"
+SELECTORS = ["h2.widget-title", "p, h1, h2, h3, li", "div.card > p a"]
+REPEATS = 3
+MIN_SECONDS = 1.0               # Stop repeating once a mode has run this long
+SYNTHETIC_CARDS = {"small.html": 150, "medium.html": 1500, "large.html": 15000, "huge.html": 60000}
+
+
+def write_synthetic_fixtures(folder):
+    """News-site-like pages (cards with headlines, links, inline scripts), from ~60 KB to ~25 MB."""
+    rnd = random.Random(7)
+    paths = []
+    for name, cards in SYNTHETIC_CARDS.items():
+        parts = ["<!DOCTYPE html><html><head><title>News</title><style>.card{margin:0}</style></head><body>"]
+        for i in range(cards):
+            words = " ".join(rnd.choice(["market", "city", "team", "storm", "vote", "launch"]) for _ in range(rnd.randint(20, 60)))
+            parts.append(f"<div class='card item-{i % 7}'><h2 class='widget-title'>Headline {i} &amp; more</h2>"
+                         f"<p>{words} <a href='/story/{i}'>Read more</a></p><!-- ad slot -->"
+                         f"<ul><li>Tag {i % 13}</li><li>Tag {i % 17}</li></ul><script>track({i})</script></div>")
+        parts.append("</body></html>")
+        path = Path(folder) / name
+        path.write_text("".join(parts), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024     # macOS reports bytes, Linux KB
+
+
+def measure(path, selector, engine):
+    """Runs in a fresh worker process: (best seconds, added peak bytes or None, items)."""
+    from bs4 import BeautifulSoup
+    from skills.selector_engine import compile_selector
+
+    html = Path(path).read_text(encoding="utf-8", errors="replace")
+    compiled = compile_selector(selector)
+    if engine == "BeautifulSoup":
+        def run():
+            return [tag.text.strip() for tag in BeautifulSoup(html, 'lxml').select(selector)]
+    else:
+        def run():
+            return compiled.extract(html, stream=engine == "lxml stream")
+
+    baseline = _peak_rss_bytes()
+    times = []
+    while len(times) < REPEATS and sum(times) < MIN_SECONDS:
+        start = time.perf_counter()
+        items = run()
+        times.append(time.perf_counter() - start)
+    peak = _peak_rss_bytes()
+    return min(times), (peak - baseline if baseline is not None else None), len(items)
+
+
+def main(paths):
+    from skills.selector_engine import compile_selector
+
+    print(f"{'fixture':<16} {'size':>8}  {'selector':<19} {'engine':<14} {'MB/s':>7} {'peak MB':>8} {'items':>6}")
+    for path in paths:
+        size_mb = path.stat().st_size / (1024 * 1024)
+        for selector in SELECTORS:
+            engines = ["BeautifulSoup", "lxml tree"]
+            if compile_selector(selector).simple:
+                engines.append("lxml stream")
+            baseline_speed = None
+            for engine in engines:
+                with ProcessPoolExecutor(max_workers=1) as worker:
+                    seconds, peak, items = worker.submit(measure, str(path), selector, engine).result()
+                speed = size_mb / seconds
+                baseline_speed = baseline_speed or speed
+                peak_text = f"{peak / (1024 * 1024):8.1f}" if peak is not None else f"{'n/a':>8}"
+                print(f"{path.name:<16} {size_mb:6.2f}MB  {selector:<19} {engine:<14} {speed:7.1f} {peak_text} {items:6}"
+                      + (f"   {speed / baseline_speed:.0f}x" if engine != "BeautifulSoup" else ""))
+        print()
+
+
+if __name__ == "__main__":
+    fixtures = [Path(arg) for arg in sys.argv[1:]] or sorted(FIXTURE_DIR.glob("*.html"))
+    if fixtures:
+        main(fixtures)
+    else:
+        with tempfile.TemporaryDirectory() as folder:
+            print("No fixtures given: using synthetic pages.\n")
+            main(write_synthetic_fixtures(folder))
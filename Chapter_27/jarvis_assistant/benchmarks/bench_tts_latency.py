@@ -0,0 +1,106 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_tts_latency.py
+# Queue-to-first-audio latency: one disposable pyttsx3 engine per sentence (old
+# tts_worker) versus the worker's PersistentSpeechEngine, and a 2,000-character
+# response spoken as one utterance versus sentence-streamed.
+# "First audio" is the driver's 'started-utterance' event.
+# Needs pyttsx3 and a working speech driver (espeak / nsss / sapi5) - it really speaks.
+# Run from the jarvis-assistant folder: python benchmarks/bench_tts_latency.py
+
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.tts_engine import PersistentSpeechEngine
+from core.speech_stream import SpeechStream
+
+SENTENCES = [
+    "At your service.",
+    "Scraping the web page now.",
+    "I found seven items.",
+    "The video is three minutes long.",
+    "Download complete.",
+    "I am sorry, I did not recognize that command.",
+]
+
+LONG_RESPONSE = ("Here is what the document says. The first page introduces the project, "
+                 "its goals, and the people behind it; the second describes the budget in detail. ") * 14
+LONG_RESPONSE = LONG_RESPONSE[:2000]
+
+SYSTEM_OS = platform.system()
+DRIVER = 'nsss' if SYSTEM_OS == "Darwin" else ('sapi5' if SYSTEM_OS == "Windows" else 'espeak')
+
+
+def disposable_first_audio(text):
+    """The old path: init -> say -> startLoop(False) for every sentence."""
+    import pyttsx3
+
+    started = []
+    queued_at = time.perf_counter()
+    engine = pyttsx3.init(DRIVER)
+    engine.connect('started-utterance', lambda name: started.append(time.perf_counter()))
+    engine.say(text)
+    engine.startLoop(False)
+    deadline = queued_at + 10
+    while not started and time.perf_counter() < deadline:
+        engine.iterate()
+        time.sleep(0.01)
+    time.sleep(0.5)  # The old fixed sleep
+    engine.endLoop()
+    engine.stop()
+    del engine
+    return started[0] - queued_at if started else None
+
+
+def persistent_first_audio(speaker, text):
+    queued_at = time.perf_counter()
+    speaker.speak(text)
+    return speaker.last_started_at - queued_at if speaker.last_started_at else None
+
+
+def long_response_first_audio(speaker, streamed):
+    """Speaks LONG_RESPONSE as one chunk or as a sentence stream, cancelling after the first chunk starts."""
+    if streamed:
+        stream = SpeechStream(LONG_RESPONSE)
+    else:
+        stream = SpeechStream(LONG_RESPONSE, max_chars=len(LONG_RESPONSE), first_chunk_chars=len(LONG_RESPONSE))
+    # Only time-to-first-audio matters here, so stop as soon as audio begins.
+    speaker.speak_chunks(stream.chunks, is_cancelled=lambda: stream.first_audio_at is not None,
+                         on_chunk_started=stream.mark_chunk_started)
+    return stream.time_to_first_audio
+
+
+def report(label, samples):
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        print(f"{label:<12} no 'started-utterance' events received")
+        return
+    print(f"{label:<12} first audio: median {statistics.median(samples) * 1000:7.1f} ms | "
+          f"max {max(samples) * 1000:7.1f} ms | n={len(samples)}")
+
+
+if __name__ == "__main__":
+    try:
+        import pyttsx3  # noqa: F401
+    except ImportError:
+        print("pyttsx3 is not installed; this benchmark needs a real speech driver.")
+        raise SystemExit(1)
+
+    print(f"Driver: {DRIVER}")
+    report("disposable", [disposable_first_audio(text) for text in SENTENCES])
+
+    speaker = PersistentSpeechEngine(DRIVER)
+    persistent = [persistent_first_audio(speaker, text) for text in SENTENCES]
+    speaker.shutdown()
+    report("persistent", persistent)
+    # The first persistent sentence pays the one-off engine build; the rest show the steady state.
+    report("  (warm)", persistent[1:])
+
+    print(f"\n{len(LONG_RESPONSE)}-character response:")
+    speaker = PersistentSpeechEngine(DRIVER)
+    speaker.speak("Warming up.")
+    report("one chunk", [long_response_first_audio(speaker, streamed=False) for _ in range(3)])
+    report("streamed", [long_response_first_audio(speaker, streamed=True) for _ in range(3)])
+    speaker.shutdown()
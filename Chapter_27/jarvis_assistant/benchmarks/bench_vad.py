@@ -0,0 +1,181 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_vad.py
+# Streaming VAD vs recognizer.listen() on recorded commands (16-bit mono WAV).
+# For every fixture it replays the audio frame by frame through StreamingVad and reports:
+#   end after - how long after the last speech frame the command was cut off
+#               (listen() needs pause_threshold = 0.8 s of quiet)
+#   upload    - seconds of audio sent to the recognizer, trimmed vs untrimmed
+# When the fixture's folder has an expected.json ({file: {"speech_start": s, "speech_end": s}}),
+# the cut-off and both trim windows (streaming and trim_silence) are checked against it,
+# and the run exits with status 1 if any fixture fails.
+# Run from the jarvis-assistant folder:
+#   python benchmarks/bench_vad.py path/to/recordings/*.wav
+# Without arguments it uses data/vad_fixtures/*.wav. Those fixtures are SYNTHETIC
+# (speech-like harmonic bursts and hiss, not real recordings); regenerate them with:
+#   python benchmarks/bench_vad.py --write-fixtures
+
+import json
+import math
+import random
+import sys
+import wave
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.speech_cache import load_wav
+from core.vad import END_SILENCE_SECONDS, PAD_SECONDS, StreamingVad, trim_silence
+
+FIXTURE_DIR = Path(__file__).parent.parent / "data" / "vad_fixtures"
+EXPECTED_FILE = "expected.json"
+FRAME_LENGTH = 512
+ENERGY_THRESHOLD = 300
+LISTEN_PAUSE_SECONDS = 0.8       # speech_recognition's default pause_threshold
+TOLERANCE_SECONDS = 0.1          # Allowed error on a speech edge: about 3 frames
+
+# (seconds, kind) segments; "voiced" ~ a vowel, "fricative" ~ a weak "s", "click" ~ a desk tap
+FIXTURE_LAYOUTS = {
+    "short_command.wav": [(0.5, "silence"), (0.6, "voiced"), (1.0, "silence")],
+    "two_words.wav": [(0.3, "silence"), (0.4, "voiced"), (0.2, "silence"), (0.5, "voiced"), (1.0, "silence")],
+    "trailing_fricative.wav": [(0.4, "silence"), (0.45, "voiced"), (0.25, "fricative"), (1.0, "silence")],
+    "click_then_command.wav": [(0.3, "silence"), (0.03, "click"), (0.8, "silence"), (0.7, "voiced"), (1.0, "silence")],
+}
+
+
+def _segment(kind, seconds, rate, rnd):
+    count = int(seconds * rate)
+    if kind == "voiced":
+        # 120 Hz glottal pulse train through two vowel-like formants, with a syllable envelope
+        harmonics = [(k, 1.0 / k + 0.8 * math.exp(-((120 * k - 700) / 150) ** 2) + 0.5 * math.exp(-((120 * k - 1200) / 200) ** 2))
+                     for k in range(1, 25)]
+        scale = 3500 / sum(weight for _, weight in harmonics)
+        ramp = int(0.03 * rate)
+        samples = []
+        for i in range(count):
+            envelope = min(1.0, i / ramp, (count - i) / ramp) * (0.75 + 0.25 * math.sin(2 * math.pi * 4 * i / rate))
+            samples.append(envelope * scale * sum(weight * math.sin(2 * math.pi * 120 * k * i / rate) for k, weight in harmonics))
+        return samples
+    if kind == "fricative":
+        # Weak, high-pitched noise: below ENERGY_THRESHOLD, but with a high zero-crossing rate
+        noise = [rnd.gauss(0, 180) for _ in range(count + 1)]
+        return [noise[i + 1] - noise[i] for i in range(count)]
+    if kind == "click":
+        return [6000 * math.exp(-i / (0.004 * rate)) * (1 if i % 2 else -1) for i in range(count)]
+    return [0.0] * count
+
+
+def write_synthetic_fixtures(folder, rate=16000):
+    """Writes the FIXTURE_LAYOUTS WAV files plus expected.json (speech edges), reproducibly."""
+    rnd = random.Random(18)
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    expected = {}
+    paths = []
+    for name, parts in FIXTURE_LAYOUTS.items():
+        samples, position, speech = [], 0.0, []
+        for seconds, kind in parts:
+            samples.extend(_segment(kind, seconds, rate, rnd))
+            if kind in ("voiced", "fricative"):
+                speech.append((position, position + seconds))
+            position += seconds
+        pcm = array('h', (max(-32768, min(32767, int(value + rnd.gauss(0, 80)))) for value in samples))  # Background hiss
+        path = folder / name
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(pcm.tobytes())
+        expected[name] = {"speech_start": round(speech[0][0], 3), "speech_end": round(speech[-1][1], 3)}
+        paths.append(path)
+    (folder / EXPECTED_FILE).write_text(json.dumps(
+        {"_note": "Synthetic fixtures written by benchmarks/bench_vad.py --write-fixtures, not real speech.", **expected},
+        indent=2) + "\n")
+    return paths
+
+
+def load_expected(path):
+    expected_file = path.parent / EXPECTED_FILE
+    if not expected_file.exists():
+        return None
+    return json.loads(expected_file.read_text()).get(path.name)
+
+
+def check(expected, events, window, offline_window):
+    """Failure messages for one fixture (empty if it passed)."""
+    start, end = expected["speech_start"], expected["speech_end"]
+    failures = []
+    if events["end"] is None:
+        failures.append("no end of speech detected")
+    elif not end <= events["end"] <= end + END_SILENCE_SECONDS + TOLERANCE_SECONDS:
+        failures.append(f"cut off at {events['end']:.2f} s, expected {end:.2f}-{end + END_SILENCE_SECONDS + TOLERANCE_SECONDS:.2f} s")
+    if abs(events["start"] - start) > TOLERANCE_SECONDS:
+        failures.append(f"speech start detected at {events['start']:.2f} s, expected {start:.2f} s")
+    for label, (kept_start, kept_end) in (("streaming", window), ("trim_silence", offline_window)):
+        # The kept audio must hold all the speech, and no more than the padding around it
+        if kept_start > start or kept_end < end:
+            failures.append(f"{label} window {kept_start:.2f}-{kept_end:.2f} s clips the speech ({start:.2f}-{end:.2f} s)")
+        elif start - kept_start > PAD_SECONDS + TOLERANCE_SECONDS or kept_end - end > PAD_SECONDS + TOLERANCE_SECONDS:
+            failures.append(f"{label} window {kept_start:.2f}-{kept_end:.2f} s keeps too much silence around {start:.2f}-{end:.2f} s")
+    return failures
+
+
+def replay(path):
+    """Returns (seconds saved vs listen(), seconds trimmed, failures), or None if the file cannot be used."""
+    clip = load_wav(path)
+    if clip.channels != 1 or clip.sample_width != 2:
+        print(f"{path.name}: skipped (needs 16-bit mono)")
+        return None
+    samples = array('h', clip.pcm)
+    vad = StreamingVad(clip.sample_rate, FRAME_LENGTH, ENERGY_THRESHOLD)
+    events = {"start": None, "end": None}
+    end_frame = None
+    for index in range(0, len(samples) - FRAME_LENGTH + 1, FRAME_LENGTH):
+        event = vad.push(samples[index:index + FRAME_LENGTH])
+        if event == "start":
+            events["start"] = index / clip.sample_rate      # A reset after a click is followed by a new start
+        elif event == "end":
+            end_frame = index // FRAME_LENGTH
+            events["end"] = (index + FRAME_LENGTH) / clip.sample_rate
+            break
+
+    total_seconds = len(samples) / clip.sample_rate
+    if not vad.in_speech:
+        print(f"{path.name:<28} no speech detected ({total_seconds:.2f} s)")
+        return None
+    first_kept_frame = vad.frames_pushed - len(vad.frames) + max(vad.first_speech - vad.pad_frames, 0)
+    last_speech_frame = vad.frames_pushed - len(vad.frames) + vad.last_speech
+    end_after = (end_frame - last_speech_frame) * vad.frame_seconds if end_frame else float("nan")
+    kept = len(vad.utterance()) * vad.frame_seconds
+    window = (first_kept_frame * vad.frame_seconds, first_kept_frame * vad.frame_seconds + kept)
+    offline_start, offline_end = trim_silence(clip.pcm, clip.sample_rate, FRAME_LENGTH, ENERGY_THRESHOLD)
+    offline_window = (offline_start / 2 / clip.sample_rate, offline_end / 2 / clip.sample_rate)
+
+    expected = load_expected(path)
+    failures = check(expected, events, window, offline_window) if expected else []
+    status = ("FAIL" if failures else "ok") if expected else "-"
+    print(f"{path.name:<28} end after {end_after * 1000:6.0f} ms (listen: {LISTEN_PAUSE_SECONDS * 1000:.0f} ms) | "
+          f"upload {kept:5.2f} s of {total_seconds:5.2f} s | {status}")
+    for failure in failures:
+        print(f"    {failure}")
+    return LISTEN_PAUSE_SECONDS - end_after, total_seconds - kept, failures
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--write-fixtures"]:
+        for path in write_synthetic_fixtures(FIXTURE_DIR):
+            print(f"Wrote {path}")
+        sys.exit(0)
+
+    paths = [Path(arg) for arg in sys.argv[1:]] or sorted(FIXTURE_DIR.glob("*.wav"))
+    if not paths:
+        print(f"No WAV fixtures given and none in {FIXTURE_DIR}; run with --write-fixtures first.")
+        sys.exit(1)
+    results = [result for result in map(replay, paths) if result]
+
+    if results:
+        saved = sum(result[0] for result in results) / len(results)
+        trimmed = sum(result[1] for result in results) / len(results)
+        print(f"\nAverage: recognition starts {saved * 1000:.0f} ms sooner, {trimmed:.2f} s less audio uploaded per command")
+    failed = sum(1 for result in results if result[2])
+    if failed:
+        print(f"{failed} of {len(results)} fixtures failed their expected speech window")
+        sys.exit(1)
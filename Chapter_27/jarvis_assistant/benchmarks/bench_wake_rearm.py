@@ -0,0 +1,64 @@
+# CODE LOCATION: jarvis-assistant/benchmarks/bench_wake_rearm.py
+# Re-arm latency between commands: how long until the wake word detector is
+# processing live audio again after a command was handled.
+#   rebuild - the old cycle: pvporcupine.create + new PvRecorder + start, deleted afterwards
+#   resume  - the WakeWordService cycle: pause() for the command, then resume();
+#             the capture thread never stopped, so the next ring frame is live audio
+# Needs PICOVOICE_ACCESS_KEY and a microphone (nothing has to be said).
+# Run from the jarvis-assistant folder: python benchmarks/bench_wake_rearm.py
+
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pvporcupine
+from pvrecorder import PvRecorder
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.wake_word import WakeWordService
+
+CYCLES = 10
+WAKE_WORD = "jarvis"
+
+
+def rebuild_cycle(access_key):
+    start = time.perf_counter()
+    porcupine = pvporcupine.create(access_key=access_key, keywords=[WAKE_WORD])
+    recorder = PvRecorder(frame_length=porcupine.frame_length, device_index=-1)
+    recorder.start()
+    porcupine.process(recorder.read())
+    elapsed = time.perf_counter() - start
+    recorder.delete()
+    porcupine.delete()
+    return elapsed
+
+
+def resume_cycle(service):
+    service.pause()
+    start = time.perf_counter()
+    service.resume()
+    service.porcupine.process(service.ring.reader().read())
+    return time.perf_counter() - start
+
+
+def report(label, samples):
+    print(f"{label:<8} median {statistics.median(samples) * 1000:8.1f} ms | "
+          f"max {max(samples) * 1000:8.1f} ms | n={len(samples)}")
+
+
+if __name__ == "__main__":
+    access_key = os.environ.get("PICOVOICE_ACCESS_KEY")
+    if not access_key:
+        print("PICOVOICE_ACCESS_KEY is not set; this benchmark needs the real detector and a microphone.")
+        raise SystemExit(1)
+
+    report("rebuild", [rebuild_cycle(access_key) for _ in range(CYCLES)])
+
+    service = WakeWordService(access_key, WAKE_WORD)
+    service.start()
+    try:
+        report("resume", [resume_cycle(service) for _ in range(CYCLES)])
+    finally:
+        service.close()
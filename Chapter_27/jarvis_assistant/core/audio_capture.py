@@ -0,0 +1,184 @@
+# CODE LOCATION: jarvis-assistant/core/audio_capture.py
+
+import math
+import threading
+import time
+from array import array
+
+import speech_recognition as sr
+
+try:
+    import numpy as np
+except ImportError:
+    print("Warning: numpy not installed. Install with 'pip install numpy' for faster frame energy.")
+    np = None
+
+# --- One Shared Audio Capture Stream ---
+# ONE capture thread reads the microphone (PvRecorder) and writes 16-bit PCM
+# frames into a ring buffer. The wake word detector and the command recognizer
+# are both just readers with their own cursor, so:
+#   * the microphone is opened once, never re-opened for sr.Microphone()
+#   * the recognizer can start from a pre-roll taken from the buffer, so
+#     "Jarvis, read pdf" spoken in one breath is not cut off.
+# The ring has a single writer that never waits for readers (no lock): a
+# reader that falls more than 'capacity' frames behind skips ahead.
+
+READ_POLL_SECONDS = 0.005
+
+
+def frame_rms(frame):
+    """Root-mean-square energy of one 16-bit frame (same scale as Recognizer.energy_threshold)."""
+    if not frame:
+        return 0.0
+    if np is not None:
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float64)
+        return float(np.sqrt(np.mean(samples * samples)))
+    return math.sqrt(sum(sample * sample for sample in frame) / len(frame))
+
+
+class PcmRingBuffer:
+    """Single-writer ring of PCM frames (array('h')). Sequence numbers grow forever."""
+
+    def __init__(self, capacity, frame_length, sample_rate=16000):
+        self.capacity = capacity
+        self.frame_length = frame_length
+        self.sample_rate = sample_rate
+        self.slots = [None] * capacity
+        self.write_seq = 0          # Frames ever written; only the capture thread changes it
+        self.closed = False
+
+    @property
+    def frame_seconds(self):
+        return self.frame_length / self.sample_rate
+
+    def frames_for(self, seconds):
+        return max(int(round(seconds / self.frame_seconds)), 1)
+
+    def write(self, frame):
+        self.slots[self.write_seq % self.capacity] = frame
+        self.write_seq += 1         # Publish only after the slot is filled
+
+    def oldest_readable(self):
+        # The writer's next slot is the oldest frame's slot, so one slot is kept as a margin.
+        return max(self.write_seq - self.capacity + 1, 0)
+
+    def reader(self, start_seq=None):
+        """A new consumer cursor; by default it starts at the newest audio."""
+        return RingReader(self, self.write_seq if start_seq is None else start_seq)
+
+    def close(self):
+        self.closed = True
+
+
+class RingReader:
+    """One consumer's cursor into a PcmRingBuffer."""
+
+    def __init__(self, ring, start_seq):
+        self.ring = ring
+        self.position = max(start_seq, ring.oldest_readable())
+        self.skipped = 0
+
+    def read(self, timeout=None):
+        """Next frame, or None on timeout / when the capture stopped."""
+        ring = self.ring
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            if self.position >= ring.write_seq:
+                if ring.closed or (deadline is not None and time.perf_counter() >= deadline):
+                    return None
+                time.sleep(READ_POLL_SECONDS)
+                continue
+
+            oldest = ring.oldest_readable()
+            if self.position < oldest:
+                self.skipped += oldest - self.position
+                self.position = oldest
+            frame = ring.slots[self.position % ring.capacity]
+            if self.position >= ring.oldest_readable():   # Not overwritten while we read it
+                self.position += 1
+                return frame
+
+
+class AudioCapture:
+    """The single capture thread: recorder.read() -> ring.write(), until stop()."""
+
+    def __init__(self, recorder, ring, noise_floor=None):
+        self.recorder = recorder
+        self.ring = ring
+        self.noise_floor = noise_floor     # Optional NoiseFloorEstimator, fed every frame
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        if self.running:
+            return
+        self.recorder.start()
+        self.running = True
+        self.thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.thread.start()
+
+    def _capture_loop(self):
+        while self.running:
+            try:
+                frame = array('h', self.recorder.read())
+                self.ring.write(frame)
+                if self.noise_floor:
+                    self.noise_floor.update(frame)
+            except Exception as e:
+                if self.running:
+                    print(f"[Audio Capture] Recorder stopped: {e}")
+                break
+        self.ring.close()
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=1)
+        try:
+            self.recorder.stop()
+        except Exception:
+            pass
+
+
+class _RingStream:
+    """The file-like 'stream' speech_recognition reads from (size is in samples)."""
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.pending = b""
+
+    def read(self, size):
+        wanted = size * 2
+        while len(self.pending) < wanted:
+            frame = self.reader.read(timeout=2.0)
+            if frame is None:
+                raise OSError("audio capture stopped")
+            self.pending += frame.tobytes()
+        data, self.pending = self.pending[:wanted], self.pending[wanted:]
+        return data
+
+
+class RingBufferSource(sr.AudioSource):
+    """An sr.AudioSource over the shared ring, starting at any sequence number (pre-roll)."""
+
+    def __init__(self, ring, start_seq=None):
+        self.ring = ring
+        self.start_seq = start_seq
+        self.SAMPLE_RATE = ring.sample_rate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = ring.frame_length
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = _RingStream(self.ring.reader(self.start_seq))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stream = None
+
+    def read_frame(self, timeout=None):
+        """Next whole frame (array('h')) for frame-level consumers such as the VAD."""
+        if self.stream.pending:
+            frame, self.stream.pending = array('h', self.stream.pending), b""
+            return frame
+        return self.stream.reader.read(timeout)
@@ -0,0 +1,113 @@
+# CODE LOCATION: jarvis-assistant/core/command_parser.py
+
+import re
+from dataclasses import dataclass, field
+
+# --- The Command Pre-Parser ---
+# Runs ONCE per utterance. Every handler receives the same immutable Command,
+# so no handler re-runs its own regexes or reads the clipboard again.
+
+URL_PATTERN = re.compile(r'https?://[^\s"\']+')
+YOUTUBE_PATTERN = re.compile(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})')
+SELECTOR_PATTERN = re.compile(r'["\']([^"\']+)["\']')
+FILE_PATTERN = re.compile(r'(?<![\w/.:-])([\w\-./\\]+\.(?:pdf|png|jpe?g|tiff?))\b', re.IGNORECASE)
+
+
+class LazyClipboard:
+    """
+    Reads the clipboard only if a handler asks for it, and at most once.
+    'source' is anything with a paste() method (pyperclip, or a replay fake).
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._text = None
+        self._urls = None
+        self._youtube_urls = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = ""
+            if self.source:
+                try:
+                    self._text = self.source.paste() or ""
+                except Exception as e:
+                    print(f"Warning: Could not read clipboard. Error: {e}")
+        return self._text
+
+    @property
+    def urls(self):
+        if self._urls is None:
+            self._urls = tuple(URL_PATTERN.findall(self.text))
+        return self._urls
+
+    @property
+    def youtube_urls(self):
+        if self._youtube_urls is None:
+            self._youtube_urls = tuple(match.group(0) for match in YOUTUBE_PATTERN.finditer(self.text))
+        return self._youtube_urls
+
+
+@dataclass(frozen=True)
+class Command:
+    """Everything Jarvis extracted from one utterance."""
+    text: str
+    urls: tuple = ()
+    youtube_urls: tuple = ()
+    youtube_ids: tuple = ()
+    selectors: tuple = ()
+    files: tuple = ()
+    clipboard: LazyClipboard = field(default=None, compare=False, repr=False)
+
+    def __contains__(self, phrase):
+        return phrase in self.text
+
+    def __str__(self):
+        return self.text
+
+    @property
+    def selector(self):
+        return self.selectors[0] if self.selectors else None
+
+    @property
+    def clipboard_urls(self):
+        return self.clipboard.urls if self.clipboard else ()
+
+    @property
+    def clipboard_youtube_urls(self):
+        return self.clipboard.youtube_urls if self.clipboard else ()
+
+
+def parse_command(text, clipboard_source=None):
+    """Builds a Command from the recognized text in a single pre-parse pass."""
+    if isinstance(text, Command):
+        return text
+
+    youtube_matches = list(YOUTUBE_PATTERN.finditer(text))
+    return Command(
+        text=text,
+        urls=tuple(URL_PATTERN.findall(text)),
+        youtube_urls=tuple(match.group(0) for match in youtube_matches),
+        youtube_ids=tuple(match.group(1) for match in youtube_matches),
+        selectors=tuple(SELECTOR_PATTERN.findall(text)),
+        files=tuple(FILE_PATTERN.findall(text)),
+        clipboard=LazyClipboard(clipboard_source),
+    )
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    class DemoClipboard:
+        def paste(self):
+            print("   (clipboard read)")
+            return "https://youtu.be/px2hdZJLC3A"
+
+    command = parse_command(
+        "scrape web https://www.python.org https://example.com 'h2.widget-title' then read report.pdf",
+        DemoClipboard(),
+    )
+    print(command)
+    print(f"Selector: {command.selector}")
+    print(f"Clipboard YouTube URLs: {command.clipboard_youtube_urls}")
+    print(f"Clipboard URLs (memoized, no second read): {command.clipboard_urls}")
@@ -0,0 +1,190 @@
+# CODE LOCATION: jarvis-assistant/core/fuzzy_index.py
+
+import re
+import time
+
+# --- The Fuzzy Trigger Index (STT Misrecognition Fallback) ---
+# "red pdf" -> "read pdf", "scrap web" -> "scrape web".
+# Built ONCE from the SKILL_MAP. Only consulted AFTER exact matching fails,
+# so the common path pays nothing. Two precomputed lookups feed candidates:
+#   1. Character trigram inverted lists (spelling-level mistakes)
+#   2. Soundex keys per phrase (sound-alike words)
+# Candidates are then verified with edit distance to produce a confidence.
+
+MIN_DICE = 0.45                     # Trigram overlap needed before we compute edit distance
+URL_OR_QUOTED = re.compile(r'https?://\S+|["\'][^"\']*["\']')
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"), "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+
+
+def soundex(word):
+    """Classic 4-character Soundex code ('read' and 'red' -> 'R300')."""
+    word = word.lower()
+    if not word:
+        return ""
+    first = word[0]
+    code = first.upper()
+    previous = SOUNDEX_CODES.get(first, "")
+    for char in word[1:]:
+        digit = SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def phonetic_key(phrase):
+    return " ".join(soundex(word) for word in phrase.split())
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance with a single rolling row."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,                          # deletion
+                current[j - 1] + 1,                       # insertion
+                previous[j - 1] + (char_a != char_b),     # substitution
+            ))
+        previous = current
+    return previous[-1]
+
+
+class FuzzyTriggerIndex:
+    """
+    Approximate lookup of SKILL_MAP triggers inside a recognized command.
+    best_match() returns (keyword, handler, confidence) or None.
+    handler_confidence: {handler name: min confidence} raises the bar for
+    skills that download, save or scrape, so a near miss never runs them.
+    """
+
+    def __init__(self, skill_map, min_confidence=0.75, max_candidates=8, handler_confidence=None):
+        self.min_confidence = min_confidence
+        self.max_candidates = max_candidates
+        self.handler_confidence = dict(handler_confidence or {})
+        self.triggers = []          # index -> (keyword, handler)
+        self.gram_counts = []       # index -> number of trigrams in the keyword
+        self.trigram_index = {}     # trigram -> set of trigger indexes
+        self.phonetic_index = {}    # phonetic key -> set of trigger indexes
+        self.window_sizes = set()
+
+        for keyword, handler in skill_map.items():
+            keyword = " ".join(WORD_PATTERN.findall(keyword.lower()))
+            index = len(self.triggers)
+            self.triggers.append((keyword, handler))
+            self.window_sizes.add(len(keyword.split()))
+            keyword_grams = trigrams(keyword)
+            self.gram_counts.append(len(keyword_grams))
+            for gram in keyword_grams:
+                self.trigram_index.setdefault(gram, set()).add(index)
+            self.phonetic_index.setdefault(phonetic_key(keyword), set()).add(index)
+
+    def _windows(self, text):
+        """All word n-grams of the command with the same length as some trigger."""
+        words = WORD_PATTERN.findall(URL_OR_QUOTED.sub(" ", text.lower()))
+        for size in self.window_sizes:
+            for start in range(len(words) - size + 1):
+                yield " ".join(words[start:start + size])
+
+    def _score(self, window, index, phonetic_hit):
+        keyword = self.triggers[index][0]
+        distance = edit_distance(window, keyword)
+        confidence = 1.0 - distance / max(len(window), len(keyword))
+        if phonetic_hit:
+            # Sounds the same: close half of the remaining gap to certainty
+            confidence += (1.0 - confidence) / 2
+        return confidence
+
+    def required_confidence(self, handler):
+        return max(self.min_confidence, self.handler_confidence.get(getattr(handler, "__name__", ""), 0.0))
+
+    def _best(self, text):
+        """(closest trigger, closest trigger that clears its own threshold); either may be None."""
+        best = None
+        eligible = None
+        for window in self._windows(text):
+            # Candidate generation: shared trigrams (inverted lists) + phonetic key
+            window_grams = trigrams(window)
+            overlap = {}
+            for gram in window_grams:
+                for index in self.trigram_index.get(gram, ()):
+                    overlap[index] = overlap.get(index, 0) + 1
+
+            phonetic_hits = self.phonetic_index.get(phonetic_key(window), set())
+            for index in phonetic_hits:
+                overlap.setdefault(index, 0)
+
+            # Cheap filters before the (expensive) edit distance:
+            #  * Dice similarity of trigram sets must be plausible
+            #  * the length gap alone must not already rule the trigger out
+            candidates = []
+            for index, shared in overlap.items():
+                dice = 2 * shared / (len(window_grams) + self.gram_counts[index])
+                length_gap = abs(len(window) - len(self.triggers[index][0])) / max(len(window), 1)
+                if index in phonetic_hits or (dice >= MIN_DICE and length_gap <= 1 - self.min_confidence):
+                    candidates.append((dice, index))
+            candidates.sort(reverse=True)
+
+            for _, index in candidates[:self.max_candidates]:
+                confidence = self._score(window, index, index in phonetic_hits)
+                keyword, handler = self.triggers[index]
+                if best is None or confidence > best[2]:
+                    best = (keyword, handler, confidence)
+                if confidence >= self.required_confidence(handler) and (eligible is None or confidence > eligible[2]):
+                    eligible = (keyword, handler, confidence)
+        return best, eligible
+
+    def best_match(self, text):
+        """The closest trigger that clears its handler's threshold, or None."""
+        return self._best(text)[1]
+
+    def near_miss(self, text):
+        """
+        A trigger that would have matched at min_confidence but is held back by a
+        stricter handler threshold: worth a "Did you mean ...?", not worth running.
+        """
+        best, eligible = self._best(text)
+        if eligible is None and best and best[2] >= self.min_confidence:
+            return best
+        return None
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    def handle_web_scrape(command): pass
+    def handle_pdf_parse(command): pass
+    def handle_pdf_ocr(command): pass
+
+    def handle_yt_savevideo(command): pass
+
+    index = FuzzyTriggerIndex({
+        "scrape web": handle_web_scrape,
+        "read pdf": handle_pdf_parse,
+        "read document": handle_pdf_parse,
+        "ocr pdf": handle_pdf_ocr,
+        "download video": handle_yt_savevideo,
+    }, handler_confidence={"handle_web_scrape": 0.9, "handle_yt_savevideo": 0.9})
+
+    for test_command in ["red pdf", "scrap web https://example.com", "please reed document", "make me a sandwich", "download file"]:
+        start = time.perf_counter()
+        result = index.best_match(test_command)
+        elapsed_us = (time.perf_counter() - start) * 1_000_000
+        label = f"{result[0]} ({result[2]:.2f})" if result else None
+        near = index.near_miss(test_command) if not result else None
+        hint = f", did you mean '{near[0]}' ({near[2]:.2f})?" if near else ""
+        print(f"'{test_command}' -> {label}{hint} in {elapsed_us:.0f} us")
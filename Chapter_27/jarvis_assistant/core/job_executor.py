@@ -0,0 +1,239 @@
+# CODE LOCATION: jarvis-assistant/core/job_executor.py
+
+import importlib
+import itertools
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# --- The Skill Job Executor ---
+# Skills run in the background so the wake word loop can re-arm straight away.
+#   * Thread pool  -> I/O-bound skills (yt-dlp downloads, scraping, Chrome).
+#   * Process pool -> CPU-bound backends (OCR, PDF parsing), see run_cpu().
+# Under the 'spawn' start method (the Windows/macOS default) every process pool
+# worker re-imports the parent script as __mp_main__ and then the target's module.
+# The parent script must therefore be import-safe (main.py keeps TTS and the mic
+# under main()), and targets belong in small modules such as skills/*: a
+# 'main:...' target would import the whole assistant a second time per worker.
+# Only the last max_finished_jobs finished jobs are kept for inspection.
+
+UNSAFE_TARGET_MODULES = ("main", "__main__")
+
+
+def _run_target(target, args, kwargs):
+    """Runs 'module:function' inside a worker process (must be picklable)."""
+    module_name, _, function_name = target.partition(":")
+    function = getattr(importlib.import_module(module_name), function_name)
+    return function(*args, **kwargs)
+
+
+def check_cpu_target(target):
+    """Returns target if a worker process can import it safely, else raises ValueError."""
+    module_name, _, function_name = target.partition(":") if isinstance(target, str) else ("", "", "")
+    if not module_name or not function_name:
+        raise ValueError(f"CPU job target must be a 'module:function' string, got {target!r}")
+    if module_name in UNSAFE_TARGET_MODULES:
+        raise ValueError(f"CPU job target {target!r}: worker processes would re-run {module_name}'s start-up code. "
+                         f"Move the function into a side-effect-free module (e.g. skills/).")
+    return target
+
+
+class Job:
+    """Book-keeping for one dispatched skill call."""
+
+    def __init__(self, job_id, skill_name, function, args, kwargs, callback):
+        self.id = job_id
+        self.skill_name = skill_name
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.callback = callback
+        self.status = "queued"      # queued -> running -> done | failed (or cancelled)
+        self.result = None
+        self.error = None
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def duration(self):
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def __repr__(self):
+        return f"<Job #{self.id} {self.skill_name} ({self.status})>"
+
+
+class JobExecutor:
+    """
+    Dispatches skill handlers to worker pools and tracks them by job ID.
+
+    skill_limits: {skill_name: max_running}. Extra jobs for a busy skill wait
+    in that skill's own queue, so two video downloads never run at once.
+    on_complete: called as on_complete(job) after every job finishes or fails.
+    max_finished_jobs: finished jobs kept in self.jobs; older ones are dropped.
+    """
+
+    def __init__(self, io_workers=4, cpu_workers=None, skill_limits=None, on_complete=None, max_finished_jobs=100):
+        self.io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="jarvis-skill")
+        self.cpu_workers = cpu_workers
+        self._cpu_pool = None  # Created on first CPU job (process start-up is not free)
+        self.skill_limits = dict(skill_limits or {})
+        self.on_complete = on_complete
+
+        self.jobs = {}
+        self.last_job_id = 0
+        self.max_finished_jobs = max_finished_jobs
+        self._finished = deque()    # IDs of finished jobs still in self.jobs, oldest first
+        self._ids = itertools.count(1)
+        self._running = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    # --- Dispatch ---
+
+    def submit(self, skill_name, function, *args, callback=None, **kwargs):
+        """Queues function(*args, **kwargs) and returns its job ID immediately."""
+        with self._lock:
+            job = Job(next(self._ids), skill_name, function, args, kwargs, callback)
+            self.jobs[job.id] = job
+            self.last_job_id = job.id
+
+            limit = self.skill_limits.get(skill_name)
+            running = self._running.get(skill_name, 0)
+            if limit is not None and running >= limit:
+                self._pending.setdefault(skill_name, deque()).append(job)
+                print(f"[JobExecutor] Job #{job.id} ({skill_name}) queued: {running}/{limit} already running.")
+                return job.id
+
+            self._running[skill_name] = running + 1
+
+        self._start(job)
+        return job.id
+
+    def _start(self, job):
+        print(f"[JobExecutor] Job #{job.id} ({job.skill_name}) dispatched.")
+        try:
+            self.io_pool.submit(self._run, job)
+        except RuntimeError:
+            # The executor was shut down while this job was waiting for its slot
+            job.status = "cancelled"
+            self._release(job)
+
+    def _run(self, job):
+        job.status = "running"
+        job.started_at = time.perf_counter()
+        try:
+            job.result = job.function(*job.args, **job.kwargs)
+            job.status = "done"
+        except Exception as e:
+            job.error = e
+            job.status = "failed"
+            print(f"[JobExecutor] Job #{job.id} ({job.skill_name}) failed: {e}")
+            traceback.print_exc()
+        finally:
+            job.finished_at = time.perf_counter()
+
+        for callback in (job.callback, self.on_complete):
+            if callback:
+                try:
+                    callback(job)
+                except Exception as e:
+                    print(f"[JobExecutor] Completion callback error for job #{job.id}: {e}")
+
+        self._release(job)
+
+    def _release(self, job):
+        """Frees the skill's slot and starts the next waiting job, if any."""
+        next_job = None
+        with self._lock:
+            self._finished.append(job.id)
+            while len(self._finished) > self.max_finished_jobs:
+                self.jobs.pop(self._finished.popleft(), None)
+            pending = self._pending.get(job.skill_name)
+            if pending:
+                next_job = pending.popleft()
+            else:
+                self._running[job.skill_name] -= 1
+
+        if next_job:
+            self._start(next_job)
+
+    def run_cpu(self, target, *args, **kwargs):
+        """
+        Runs a CPU-bound backend in the process pool and waits for the result.
+        'target' is a 'module:function' string or a LazySkill (uses its .target).
+        Call this from inside a job so only the worker thread waits, never the main loop.
+        """
+        target = check_cpu_target(getattr(target, "target", target))
+        with self._lock:
+            if self._cpu_pool is None:
+                self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self._cpu_pool.submit(_run_target, target, args, kwargs).result()
+
+    # --- Inspection & Shutdown ---
+
+    def status(self, job_id):
+        job = self.jobs.get(job_id)
+        return job.status if job else None
+
+    def active_jobs(self):
+        with self._lock:
+            jobs = list(self.jobs.values())     # Worker threads add and prune entries concurrently
+        return [job for job in jobs if job.status in ("queued", "running")]
+
+    def shutdown(self, wait=False):
+        """Stops the pools. With wait=True, queued jobs are drained first."""
+        while wait and self.active_jobs():
+            time.sleep(0.05)
+        self.io_pool.shutdown(wait=wait, cancel_futures=not wait)
+        if self._cpu_pool:
+            self._cpu_pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class InlineExecutor(JobExecutor):
+    """
+    Same interface as JobExecutor, but every job runs on the caller's thread.
+    Used by the replay harness, where each command must finish (and be timed)
+    before the next one starts.
+    """
+
+    def __init__(self, on_complete=None):
+        super().__init__(io_workers=1, on_complete=on_complete)
+
+    def _start(self, job):
+        self._run(job)
+
+    def run_cpu(self, target, *args, **kwargs):
+        if hasattr(target, "target"):
+            check_cpu_target(target.target)     # Same rule as the process pool, so replays catch it too
+        if callable(target):
+            return target(*args, **kwargs)
+        return _run_target(check_cpu_target(target), args, kwargs)
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    def fake_download(name):
+        time.sleep(0.5)
+        return f"{name}.mp4"
+
+    def report(job):
+        print(f"   -> Job #{job.id} {job.status}: {job.result} ({job.duration:.2f}s)")
+
+    executor = JobExecutor(skill_limits={"download video": 1}, on_complete=report)
+
+    start = time.perf_counter()
+    for video in ["first", "second"]:
+        executor.submit("download video", fake_download, video)
+    print(f"Dispatch returned after {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    print(f"math:factorial(20) in a worker process -> {executor.run_cpu('math:factorial', 20)}")
+    try:
+        executor.run_cpu("main:handle_pdf_parse", "data/sample.pdf")
+    except ValueError as e:
+        print(f"Rejected: {e}")
+    executor.shutdown(wait=True)
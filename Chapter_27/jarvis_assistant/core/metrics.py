@@ -0,0 +1,168 @@
+# CODE LOCATION: jarvis-assistant/core/metrics.py
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# --- Pipeline Latency Metrics ---
+# wake -> listen -> recognize -> route -> skill -> speak
+# Every stage records into an in-memory HDR-style histogram: exact below 128 us,
+# then log-linear buckets with ~1% relative error. Memory stays tiny and
+# p50/p99 are cheap, no matter how many samples we record.
+
+SUB_BUCKET_BITS = 7                 # 2^7 = 128 linear sub-buckets per power of two
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LatencyHistogram:
+    """HDR-style histogram of durations, stored in integer microseconds."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket_of(value_us):
+        """Returns (shift, top): the value lies in [top << shift, (top + 1) << shift)."""
+        if value_us < SUB_BUCKET_COUNT:
+            return 0, value_us
+        shift = value_us.bit_length() - SUB_BUCKET_BITS
+        return shift, value_us >> shift
+
+    def record(self, seconds):
+        value_us = max(int(seconds * 1_000_000), 0)
+        key = self._bucket_of(value_us)
+        with self._lock:
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+            self.count += 1
+            self.total_us += value_us
+            self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+            self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def percentile(self, quantile):
+        """Returns the duration (seconds) at the given quantile (0.0 - 1.0)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(round(quantile * self.count)))
+            seen = 0
+            for shift, top in sorted(self.buckets):
+                seen += self.buckets[(shift, top)]
+                if seen >= rank:
+                    # Middle of the bucket, clamped to what we actually observed
+                    low = top << shift
+                    high = ((top + 1) << shift) - 1
+                    value_us = min(max((low + high) // 2, self.min_us), self.max_us)
+                    return value_us / 1_000_000
+            return self.max_us / 1_000_000
+
+    def summary(self, quantiles=DEFAULT_QUANTILES):
+        result = {
+            "count": self.count,
+            "mean_s": (self.total_us / self.count / 1_000_000) if self.count else 0.0,
+            "min_s": (self.min_us or 0) / 1_000_000,
+            "max_s": (self.max_us or 0) / 1_000_000,
+        }
+        for quantile in quantiles:
+            result[f"p{quantile * 100:g}_s"] = self.percentile(quantile)
+        return result
+
+
+class PipelineMetrics:
+    """Named stage histograms plus a span/timer API to fill them."""
+
+    def __init__(self, prefix="jarvis"):
+        self.prefix = prefix
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, stage):
+        with self._lock:
+            if stage not in self.histograms:
+                self.histograms[stage] = LatencyHistogram()
+            return self.histograms[stage]
+
+    def record(self, stage, seconds):
+        self.histogram(stage).record(seconds)
+
+    @contextmanager
+    def span(self, stage):
+        """
+        Times a block of code:
+            with metrics.span("listen.capture"):
+                audio = recognizer.listen(source)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def timed(self, stage):
+        """Decorator version of span()."""
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    # --- Export ---
+
+    def snapshot(self, quantiles=DEFAULT_QUANTILES):
+        return {stage: self.histograms[stage].summary(quantiles) for stage in sorted(self.histograms)}
+
+    def to_json(self, quantiles=DEFAULT_QUANTILES):
+        return json.dumps(self.snapshot(quantiles), indent=2)
+
+    def to_prometheus(self, quantiles=DEFAULT_QUANTILES):
+        """Prometheus text exposition format, one summary per stage."""
+        name = f"{self.prefix}_stage_latency_seconds"
+        lines = [
+            f"# HELP {name} Latency of each voice pipeline stage.",
+            f"# TYPE {name} summary",
+        ]
+        for stage in sorted(self.histograms):
+            histogram = self.histograms[stage]
+            for quantile in quantiles:
+                lines.append(f'{name}{{stage="{stage}",quantile="{quantile:g}"}} {histogram.percentile(quantile):.6f}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total_us / 1_000_000:.6f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Writes JSON for '.json' paths, Prometheus text for anything else."""
+        text = self.to_json() if str(path).endswith(".json") else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"[Metrics] Latency report written to {path}")
+
+    def print_report(self):
+        print("\n--- PIPELINE LATENCY (p50 / p99) ---")
+        for stage, stats in self.snapshot().items():
+            print(f"{stage:<28} n={stats['count']:<6} p50={stats['p50_s'] * 1000:>10.3f} ms   p99={stats['p99_s'] * 1000:>10.3f} ms")
+        print("-----------------------------------")
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    import random
+
+    metrics = PipelineMetrics()
+    for _ in range(10000):
+        metrics.record("route", random.uniform(0.00001, 0.00005))
+        metrics.record("listen.recognize", random.gauss(0.8, 0.1))
+
+    with metrics.span("skill.demo"):
+        time.sleep(0.05)
+
+    metrics.print_report()
+    print(metrics.to_prometheus())
@@ -0,0 +1,105 @@
+# CODE LOCATION: jarvis-assistant/core/skill_registry.py
+
+import importlib
+import threading
+import time
+
+# --- The Lazy Skill Registry ---
+# Heavy skill backends (selenium, PyMuPDF, pytesseract, pdf2image) are only
+# imported the first time Jarvis actually needs them, so start-up stays instant.
+
+
+class LazySkill:
+    """
+    A callable stand-in for a 'module:function' skill backend.
+    The module is imported on the first call (or during prewarm) and cached.
+    """
+
+    def __init__(self, target):
+        module_name, _, function_name = target.partition(":")
+        if not module_name or not function_name:
+            raise ValueError(f"Skill target must look like 'module:function', got '{target}'")
+
+        self.target = target
+        self.module_name = module_name
+        self.function_name = function_name
+        self.__name__ = function_name
+        self.prewarm = True
+        self._function = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self):
+        return self._function is not None
+
+    def resolve(self):
+        """Imports the backing module once and returns the real function."""
+        if self._function is None:
+            with self._lock:
+                if self._function is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self.module_name)
+                    self._function = getattr(module, self.function_name)
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    print(f"[SkillRegistry] Loaded {self.target} in {elapsed_ms:.0f} ms")
+        return self._function
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "lazy"
+        return f"<LazySkill {self.target} ({state})>"
+
+
+class SkillRegistry:
+    """Keeps track of every lazy skill so they can be pre-warmed together."""
+
+    def __init__(self):
+        self.skills = {}
+        self._prewarm_thread = None
+
+    def lazy(self, target, prewarm=True):
+        """
+        Registers (or returns the existing) LazySkill for 'module:function'.
+        prewarm=False keeps it out of prewarm(), e.g. for backends that only
+        ever run inside a worker process.
+        """
+        if target not in self.skills:
+            self.skills[target] = LazySkill(target)
+            self.skills[target].prewarm = prewarm
+        return self.skills[target]
+
+    def _prewarm_all(self):
+        for skill in list(self.skills.values()):
+            if not skill.prewarm:
+                continue
+            try:
+                skill.resolve()
+            except Exception as e:
+                # A missing optional dependency only matters when the skill is used.
+                print(f"[SkillRegistry] Prewarm skipped {skill.target}: {e}")
+
+    def prewarm(self, background=True):
+        """
+        Imports all registered skills. In background mode this runs once on a
+        daemon thread so the caller (the wake word loop) is never blocked.
+        """
+        if not background:
+            self._prewarm_all()
+            return None
+
+        if self._prewarm_thread is None:
+            self._prewarm_thread = threading.Thread(target=self._prewarm_all, daemon=True)
+            self._prewarm_thread.start()
+            print(f"[SkillRegistry] Pre-warming {len(self.skills)} skills in the background...")
+        return self._prewarm_thread
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    registry = SkillRegistry()
+    dumps = registry.lazy("json:dumps")
+    print(dumps)
+    print(dumps({"status": "online"}))
+    print(dumps)
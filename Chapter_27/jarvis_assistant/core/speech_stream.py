@@ -0,0 +1,112 @@
+# CODE LOCATION: jarvis-assistant/core/speech_stream.py
+
+import re
+import threading
+import time
+from collections import deque
+
+# --- Sentence-Streaming Speech ---
+# A long response (a PDF opening, a transcript summary) is split into short
+# speakable chunks. The first chunk is kept extra short so Jarvis starts
+# talking almost immediately; the chunks are queued on the TTS engine back to
+# back, and the whole stream can be cancelled between (or during) chunks.
+
+FIRST_CHUNK_CHARS = 80      # Small first chunk = fast time-to-first-audio
+MAX_CHUNK_CHARS = 220
+
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+CLAUSE_BREAK = re.compile(r'(?<=[,;:])\s+')
+
+
+def _split_long(piece, limit):
+    """Breaks one sentence at clause marks, then at word boundaries, into parts of at most 'limit' chars."""
+    parts = []
+    for clause in CLAUSE_BREAK.split(piece):
+        if len(clause) <= limit:
+            parts.append(clause)
+            continue
+        line = ""
+        for word in clause.split():
+            if line and len(line) + 1 + len(word) > limit:
+                parts.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        if line:
+            parts.append(line)
+    return parts
+
+
+def split_for_speech(text, max_chars=MAX_CHUNK_CHARS, first_chunk_chars=FIRST_CHUNK_CHARS):
+    """
+    Splits text into speakable chunks: whole sentences where they fit, clauses
+    or word runs where they do not. Short neighbouring sentences are merged.
+    """
+    chunks = []
+    pending = deque(SENTENCE_BREAK.split(" ".join(text.split())))
+    while pending:
+        piece = pending.popleft()
+        if not piece:
+            continue
+
+        limit = max_chars if chunks else first_chunk_chars
+        if len(piece) > limit:
+            head, *rest = _split_long(piece, limit)
+            if rest:
+                pending.appendleft(" ".join(rest))
+            piece = head
+
+        last_limit = max_chars if len(chunks) > 1 else first_chunk_chars
+        if chunks and len(chunks[-1]) + 1 + len(piece) <= last_limit:
+            chunks[-1] = f"{chunks[-1]} {piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+class SpeechStream:
+    """One queued response, pre-split into chunks. Any thread may cancel() it."""
+
+    def __init__(self, text, max_chars=MAX_CHUNK_CHARS, first_chunk_chars=FIRST_CHUNK_CHARS):
+        self.text = text
+        self.chunks = split_for_speech(text, max_chars, first_chunk_chars)
+        self.queued_at = time.perf_counter()
+        self.first_audio_at = None
+        self.chunks_started = 0
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def mark_chunk_started(self, index):
+        """Called by the TTS engine each time a chunk starts playing."""
+        if self.first_audio_at is None:
+            self.first_audio_at = time.perf_counter()
+        self.chunks_started = index + 1
+
+    def mark_done(self):
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """Blocks until the stream finished playing (or was cancelled)."""
+        return self._done.wait(timeout)
+
+    @property
+    def time_to_first_audio(self):
+        if self.first_audio_at is None:
+            return None
+        return self.first_audio_at - self.queued_at
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    summary = ("welcome back to the channel, today we are testing how Jarvis speaks long answers. " * 25).strip()
+    stream = SpeechStream(summary)
+    print(f"{len(summary)} chars -> {len(stream.chunks)} chunks")
+    for chunk in stream.chunks[:4]:
+        print(f"   [{len(chunk):3}] {chunk}")
@@ -0,0 +1,203 @@
+# CODE LOCATION: jarvis-assistant/core/vad.py
+
+import time
+
+import speech_recognition as sr
+
+from core.audio_capture import frame_rms, np
+
+# --- Streaming Voice Activity Detection ---
+# recognizer.listen() waits for pause_threshold (0.8 s) of quiet plus its own
+# buffering before recognition can start, and uploads the silence around the
+# command too. This VAD classifies every frame as it arrives from the ring:
+#   speech  = energy above the threshold, OR quieter but with a high
+#             zero-crossing rate ("s", "f", "sh" are weak but noisy)
+#   end     = END_SILENCE_SECONDS of confident silence after enough speech
+# The utterance is trimmed to the speech plus a little padding, so the STT
+# request is shorter and starts sooner.
+
+END_SILENCE_SECONDS = 0.4       # Trailing silence that ends the command
+MIN_SPEECH_SECONDS = 0.15       # Shorter bursts are clicks, not commands
+PAD_SECONDS = 0.15              # Kept before/after the speech so words are not clipped
+FRICATIVE_ENERGY_RATIO = 0.5    # Weak frames still count as speech if they are noisy enough...
+FRICATIVE_ZCR = 0.25            # ...i.e. at least this fraction of samples crosses zero
+
+
+def zero_crossing_rate(frame):
+    """Fraction of neighbouring samples with different signs."""
+    if len(frame) < 2:
+        return 0.0
+    if np is not None:
+        samples = np.frombuffer(frame, dtype=np.int16)
+        return float(np.count_nonzero(np.signbit(samples[1:]) != np.signbit(samples[:-1]))) / (len(samples) - 1)
+    crossings = sum(1 for a, b in zip(frame, frame[1:]) if (a < 0) != (b < 0))
+    return crossings / (len(frame) - 1)
+
+
+def frame_features(pcm, frame_length):
+    """(rms, zcr) for every whole frame of 16-bit mono PCM bytes, vectorized when NumPy is available."""
+    if np is not None:
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        frames = samples[:len(samples) // frame_length * frame_length].reshape(-1, frame_length)
+        values = frames.astype(np.float64)
+        rms = np.sqrt(np.mean(values * values, axis=1))
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_length - 1)
+        return list(zip(rms.tolist(), zcr.tolist()))
+
+    from array import array
+    samples = array('h', pcm[:len(pcm) // 2 * 2])
+    frames = [samples[i:i + frame_length] for i in range(0, len(samples) - frame_length + 1, frame_length)]
+    return [(frame_rms(frame), zero_crossing_rate(frame)) for frame in frames]
+
+
+def is_speech(rms, zcr, energy_threshold):
+    if rms > energy_threshold:
+        return True
+    return rms > energy_threshold * FRICATIVE_ENERGY_RATIO and zcr > FRICATIVE_ZCR
+
+
+class StreamingVad:
+    """Frame-by-frame speech detector. push() returns 'start', 'end' or None."""
+
+    def __init__(self, sample_rate, frame_length, energy_threshold):
+        self.frame_seconds = frame_length / sample_rate
+        self.energy_threshold = energy_threshold
+        self.end_frames = max(int(round(END_SILENCE_SECONDS / self.frame_seconds)), 1)
+        self.min_speech_frames = max(int(round(MIN_SPEECH_SECONDS / self.frame_seconds)), 1)
+        self.pad_frames = int(round(PAD_SECONDS / self.frame_seconds))
+        self.frames = []
+        self.frames_pushed = 0
+        self.first_speech = None      # Index into self.frames
+        self.last_speech = None
+        self.speech_frames = 0
+        self.ended = False
+
+    @property
+    def in_speech(self):
+        return self.first_speech is not None
+
+    def push(self, frame):
+        if self.ended:
+            return None
+        self.frames.append(frame)
+        self.frames_pushed += 1
+        index = len(self.frames) - 1
+        speech = is_speech(frame_rms(frame), zero_crossing_rate(frame), self.energy_threshold)
+
+        if not self.in_speech:
+            if not speech:
+                # Only the padding before the speech is worth keeping
+                del self.frames[:max(len(self.frames) - self.pad_frames, 0)]
+                return None
+            self.first_speech = self.last_speech = index
+            self.speech_frames = 1
+            return "start"
+
+        if speech:
+            self.last_speech = index
+            self.speech_frames += 1
+            return None
+
+        if index - self.last_speech >= self.end_frames:
+            if self.speech_frames < self.min_speech_frames:
+                self._reset()          # A click or a cough: keep waiting for the command
+                return None
+            self.ended = True
+            return "end"
+        return None
+
+    def _reset(self):
+        self.frames = self.frames[-self.pad_frames:] if self.pad_frames else []
+        self.first_speech = self.last_speech = None
+        self.speech_frames = 0
+
+    def utterance(self):
+        """The speech frames plus padding, with leading and trailing silence trimmed."""
+        if not self.in_speech:
+            return []
+        start = max(self.first_speech - self.pad_frames, 0)
+        return self.frames[start:self.last_speech + self.pad_frames + 1]
+
+    def trimmed_seconds(self):
+        return (self.frames_pushed - len(self.utterance())) * self.frame_seconds
+
+
+def trim_silence(pcm, sample_rate, frame_length, energy_threshold):
+    """Offline version for recorded audio (e.g. WAV fixtures): returns (start, end) byte offsets of the speech."""
+    features = frame_features(pcm, frame_length)
+    speech = [index for index, (rms, zcr) in enumerate(features) if is_speech(rms, zcr, energy_threshold)]
+
+    # Same rules as StreamingVad: bursts split by END_SILENCE_SECONDS of quiet are separate,
+    # and bursts with fewer than MIN_SPEECH_SECONDS of speech are clicks, not commands
+    frame_seconds = frame_length / sample_rate
+    end_frames = max(int(round(END_SILENCE_SECONDS / frame_seconds)), 1)
+    min_speech_frames = max(int(round(MIN_SPEECH_SECONDS / frame_seconds)), 1)
+    bursts = []
+    for index in speech:
+        if bursts and index - bursts[-1][-1] < end_frames:
+            bursts[-1].append(index)
+        else:
+            bursts.append([index])
+    speech = [index for burst in bursts if len(burst) >= min_speech_frames for index in burst]
+    if not speech:
+        return 0, 0
+    pad = int(round(PAD_SECONDS * sample_rate / frame_length))
+    frame_bytes = frame_length * 2
+    start = max(speech[0] - pad, 0) * frame_bytes
+    end = min((speech[-1] + pad + 1) * frame_bytes, len(pcm))
+    return start, end
+
+
+def capture_utterance(source, energy_threshold, timeout=5, phrase_time_limit=8):
+    """
+    Replaces recognizer.listen() on a RingBufferSource: returns sr.AudioData with only
+    the trimmed speech, as soon as trailing silence is confident.
+    """
+    vad = StreamingVad(source.SAMPLE_RATE, source.CHUNK, energy_threshold)
+    started = time.perf_counter()
+    speech_started = None
+    while True:
+        frame = source.read_frame(timeout=2.0)
+        if frame is None:
+            raise OSError("audio capture stopped")
+        event = vad.push(frame)
+        now = time.perf_counter()
+        if event == "start":
+            speech_started = now
+        elif event == "end":
+            break
+        if speech_started is None and timeout and now - started > timeout:
+            raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+        if speech_started is not None and phrase_time_limit and now - speech_started > phrase_time_limit:
+            break
+
+    frames = vad.utterance()
+    print(f"[VAD] {len(frames) * vad.frame_seconds:.2f} s of speech kept, {vad.trimmed_seconds():.2f} s of silence trimmed")
+    return sr.AudioData(b"".join(frame.tobytes() for frame in frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly).
+    # It imports core.*, so run it from the jarvis-assistant folder as a module: python -m core.vad
+    import math
+    import random
+    from array import array
+
+    rate, length = 16000, 512
+
+    def tone(seconds, amplitude):
+        return [int(amplitude * math.sin(2 * math.pi * 220 * i / rate) + random.gauss(0, 60)) for i in range(int(seconds * rate))]
+
+    # 0.6 s silence, 0.8 s "speech", 1.0 s silence
+    samples = array('h', tone(0.6, 0) + tone(0.8, 4000) + tone(1.0, 0))
+    frames = [samples[i:i + length] for i in range(0, len(samples) - length + 1, length)]
+
+    vad = StreamingVad(rate, length, energy_threshold=300)
+    for index, frame in enumerate(frames):
+        event = vad.push(frame)
+        if event:
+            print(f"{event:>5} at {index * length / rate:.2f} s")
+    print(f"kept {len(vad.utterance()) * vad.frame_seconds:.2f} s, trimmed {vad.trimmed_seconds():.2f} s")
+    start, end = trim_silence(samples.tobytes(), rate, length, 300)
+    print(f"offline trim: {start / 2 / rate:.2f} s -> {end / 2 / rate:.2f} s")
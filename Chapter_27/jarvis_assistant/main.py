@@ -1,59 +1,106 @@
 
 import os
-import pvporcupine
-from pvrecorder import PvRecorder
 import threading 
 import speech_recognition as sr
 
 import platform 
 from pathlib import Path
-from queue import Queue
+from queue import Queue, Empty
 import time
 import traceback
-import re 
+import atexit
 try:
     import pyperclip
 except ImportError:
     print("Warning: pyperclip not installed. Install with 'pip install pyperclip' for clipboard integration.")
     pyperclip = None
 
-# --- MODULAR SKILL IMPORTS ---
-from skills.pdf_parser import pdf_parse
-from skills.pdf_ocr import image_ocr
-from skills.yt_tools import yt_inspect, yt_summarize
-from skills.yt_tools_archival import yt_saveaudio, yt_savevideo
-from skills.web_tools import scrape_url_for_selector
-# NEW: Import the Dynamic Archivist Tool
-from skills.dynamic_tools import scrape_dynamic_site 
+# --- CORE SERVICES ---
+from core.intent_matcher import IntentMatcher
+from core.skill_registry import SkillRegistry
+from core.job_executor import JobExecutor
+from core.metrics import PipelineMetrics
+from core.command_parser import URL_PATTERN, parse_command
+from core.fuzzy_index import FuzzyTriggerIndex
+from core.tts_engine import PersistentSpeechEngine
+from core.speech_stream import SpeechStream
+from core.speech_cache import SpeechCache, play_clip
+from core.wake_word import WakeWordService
+from core.vad import capture_utterance
+from core.noise_floor import CALIBRATION_SECONDS
+
+# --- PIPELINE LATENCY METRICS ---
+# Set JARVIS_METRICS_FILE to 'latency.json' (JSON) or 'latency.prom' (Prometheus text)
+# to keep the p50/p99 report when Jarvis shuts down.
+PIPELINE_METRICS = PipelineMetrics()
+METRICS_FILE = os.environ.get("JARVIS_METRICS_FILE")
+
+# --- MODULAR SKILL IMPORTS (LAZY) ---
+# Each backend is imported on first use, so selenium, PyMuPDF, pytesseract and
+# pdf2image no longer load before the wake word loop is listening.
+SKILL_REGISTRY = SkillRegistry()
+PREWARM_SKILLS = os.environ.get("JARVIS_PREWARM_SKILLS", "1") == "1"
+
+# CPU-bound backends run in the JobExecutor's process pool, so the main process never imports them.
+pdf_parse = SKILL_REGISTRY.lazy("skills.pdf_parser:pdf_parse", prewarm=False)
+image_ocr = SKILL_REGISTRY.lazy("skills.pdf_ocr:image_ocr", prewarm=False)
+yt_inspect = SKILL_REGISTRY.lazy("skills.yt_tools:yt_inspect")
+yt_summarize = SKILL_REGISTRY.lazy("skills.yt_tools:yt_summarize")
+yt_saveaudio = SKILL_REGISTRY.lazy("skills.yt_tools_archival:yt_saveaudio")
+yt_savevideo = SKILL_REGISTRY.lazy("skills.yt_tools_archival:yt_savevideo")
+scrape_url_for_selector = SKILL_REGISTRY.lazy("skills.web_tools:scrape_url_for_selector")
+scrape_list = SKILL_REGISTRY.lazy("skills.batch_scraper:scrape_list")
+save_scrape_results = SKILL_REGISTRY.lazy("skills.batch_scraper:save_results")
+# NEW: The Dynamic Archivist Tool
+scrape_dynamic_site = SKILL_REGISTRY.lazy("skills.dynamic_tools:scrape_dynamic_site")
 
 # --- CONDITIONAL IMPORTS ---
+# Nothing below starts an engine or exits: process-pool workers (spawn, the
+# Windows/macOS default) re-import this file as __mp_main__, so every
+# side effect lives in initialize_tts_global() and main().
 SYSTEM_OS = platform.system()
 if SYSTEM_OS == "Windows":
     try:
         import win32com.client
-        print("TTS Backend: win32com (Windows)")
     except ImportError:
-        print("FATAL ERROR: win32com.client not found. Install with 'pip install pywin32'")
-        exit()
+        win32com = None
     tts_engine_win = None
     engine_driver_name = 'sapi5'
+    WIN32_SPEAK_TIMEOUT_MS = 30000  # Upper bound for SAPI's WaitUntilDone
     speech_queue = Queue()
 else:
-    import pyttsx3
-    print(f"TTS Backend: pyttsx3 ({SYSTEM_OS})")
-    tts_engine = None
     speech_queue = Queue()
     if SYSTEM_OS == "Darwin":
         engine_driver_name = 'nsss'
     else:
         engine_driver_name = 'espeak'
 
+active_speech_stream = None  # The SpeechStream the TTS worker is playing right now
+tts_ready = threading.Event()  # Set by the TTS worker once it can speak
+
+# --- RENDERED-SPEECH CACHE ---
+# Fixed phrases are rendered to WAV once (while the worker is idle) and then
+# replayed straight to the audio device, so the wake acknowledgement is instant.
+SPEECH_CACHE_DIR = Path(__file__).parent / "data" / "speech_cache"
+CACHED_PHRASES = (
+    "At your service. How may I help?",
+    "I am sorry, I did not recognize that command.",
+    "Found a URL on the clipboard.",
+    "Found a YouTube link on your clipboard.",
+    "Please copy a valid YouTube link to your clipboard and try again, or include the link in your command.",
+)
+speech_cache = None  # Created by the TTS worker once the voice and rate are known
+
 # --- 1. TTS INITIALIZATION (OS Specific) ---
 
 def initialize_tts_global():
-    global tts_engine, tts_engine_win
+    global tts_engine_win
 
     if SYSTEM_OS == "Windows":
+        if win32com is None:
+            print("FATAL ERROR: win32com.client not found. Install with 'pip install pywin32'")
+            exit()
+        print("TTS Backend: win32com (Windows)")
         try:
             tts_engine_win = win32com.client.Dispatch("SAPI.SpVoice")
             tts_engine_win.Rate = 0 
@@ -62,91 +109,165 @@ def initialize_tts_global():
             print(f"CRITICAL TTS FAILURE (win32com): {e}")
             tts_engine_win = None
     else:
-        try:
-            tts_engine = pyttsx3.init(engine_driver_name)
-            rate = tts_engine.getProperty('rate')
-            tts_engine.setProperty('rate', rate)
-            print("pyttsx3 Global Engine properties set to default rate.")
-        except Exception as e:
-            print(f"Jarvis TTS Error: Failed to initialize pyttsx3 engine. Error: {e}") 
-            tts_engine = None
+        # No engine here: the TTS worker builds and owns its pyttsx3 engine (PersistentSpeechEngine).
+        print(f"TTS Backend: pyttsx3 ({SYSTEM_OS})")
 
-initialize_tts_global()
+# Headless mode (replay harness, CI): no audio device, speech goes to the console.
+HEADLESS_MODE = os.environ.get("JARVIS_HEADLESS") == "1"
 
 
 # --- 2. TTS WORKER THREAD (OS Specific Logic) ---
 
-def _speak_pyttsx3(text):
-    """(macOS/Linux) Non-blocking pyttsx3 disposable engine logic."""
-    temp_engine = None
-    try:
-        temp_engine = pyttsx3.init(engine_driver_name)
-        temp_engine.setProperty('rate', tts_engine.getProperty('rate'))
-        
-        temp_engine.say(text)
-        temp_engine.startLoop(False) 
-        time.sleep(0.5) 
-        
-    except Exception as e:
-        print(f"[TTS Worker Error - pyttsx3]: {e}")
-        traceback.print_exc()
-    finally:
-        if temp_engine:
-            try:
-                temp_engine.stop() 
-                del temp_engine
-            except:
-                pass
-
-def _speak_win32com(text):
-    """(Windows) Truly asynchronous win32com speak logic."""
+def _speak_pyttsx3(speaker, stream):
+    """(macOS/Linux) Streams the chunks through the worker's persistent engine."""
+    speaker.speak_chunks(stream.chunks, is_cancelled=lambda: stream.cancelled,
+                         on_chunk_started=stream.mark_chunk_started)
+
+def _speak_win32com(stream):
+    """(Windows) Asynchronous win32com speak, one chunk at a time, waiting on SAPI's own completion."""
     if tts_engine_win:
         try:
-            tts_engine_win.Speak(text, 1)
-            time.sleep(2)
+            for index, chunk in enumerate(stream.chunks):
+                if stream.cancelled:
+                    break
+                tts_engine_win.Speak(chunk, 1)
+                stream.mark_chunk_started(index)
+                waited_ms = 0
+                while not tts_engine_win.WaitUntilDone(100):
+                    waited_ms += 100
+                    if stream.cancelled or waited_ms >= WIN32_SPEAK_TIMEOUT_MS:
+                        tts_engine_win.Speak("", 3)  # Async + purge: stops the current chunk
+                        break
             
         except Exception as e:
             print(f"[TTS Worker Error - win32com]: {e}")
             traceback.print_exc()
 
+def _render_win32com(text, path):
+    """(Windows) Renders text into a WAV file through a SAPI file stream."""
+    file_stream = win32com.client.Dispatch("SAPI.SpFileStream")
+    file_stream.Open(str(path), 3)  # SSFMCreateForWrite
+    previous_output = tts_engine_win.AudioOutputStream
+    tts_engine_win.AudioOutputStream = file_stream
+    try:
+        tts_engine_win.Speak(text, 0)
+    finally:
+        file_stream.Close()
+        tts_engine_win.AudioOutputStream = previous_output
+
+def _create_speech_cache(speaker):
+    """Builds the rendered-speech cache for the active voice/rate. Returns (cache, render_function)."""
+    try:
+        if SYSTEM_OS == "Windows":
+            cache = SpeechCache(SPEECH_CACHE_DIR, voice=tts_engine_win.Voice.Id, rate=tts_engine_win.Rate)
+            render = _render_win32com
+        else:
+            cache = SpeechCache(SPEECH_CACHE_DIR, voice=speaker.voice_id(), rate=speaker.rate)
+            render = speaker.render_to_file
+    except Exception as e:
+        print(f"[TTS Worker] Speech cache disabled: {e}")
+        return None, None
+
+    if not cache.can_play:
+        print("[TTS Worker] Speech cache disabled: no audio playback backend.")
+        return None, None
+    cache.queue_prerender(CACHED_PHRASES)
+    return cache, render
+
 def tts_worker():
     """Generic worker that delegates to the correct OS-specific speaker."""
+    global active_speech_stream, speech_cache
     print("[TTS Worker] Started and waiting for speech...")
+    # The worker thread owns ONE long-lived engine (pyttsx3 engines are not shared across threads).
+    speaker = None
+    if SYSTEM_OS != "Windows":
+        speaker = PersistentSpeechEngine(engine_driver_name)
+        try:
+            speaker.start()
+        except Exception as e:
+            print(f"Jarvis TTS Error: Failed to initialize pyttsx3 engine. Error: {e}")
+            return
+    speech_cache, render = _create_speech_cache(speaker)
+    tts_ready.set()
+
     while True:
-        text = speech_queue.get()
-        if text is None:
+        # Idle time is used to pre-render cached phrases, one at a time, so speech always goes first.
+        if speech_cache and speech_cache.has_pending() and speech_queue.empty():
+            speech_cache.render_pending(render, max_items=1)
+            continue
+        try:
+            stream = speech_queue.get(timeout=1.0)
+        except Empty:
+            continue
+        if stream is None:
             break
         
-        print(f"[TTS Worker] Received: {text[:50]}...")
+        PIPELINE_METRICS.record("tts.queue_wait", time.perf_counter() - stream.queued_at)
+        if stream.cancelled:
+            stream.mark_done()
+            speech_queue.task_done()
+            continue
+
+        print(f"[TTS Worker] Received: {stream.text[:50]}... ({len(stream.chunks)} chunks)")
+        active_speech_stream = stream
         
-        if SYSTEM_OS == "Windows":
-            _speak_win32com(text)
+        clip = speech_cache.get(stream.text) if speech_cache else None
+        if clip:
+            # Cache hit: straight to the audio device, the TTS engine is not touched.
+            with PIPELINE_METRICS.span("tts.cached_playback"):
+                stream.mark_chunk_started(0)
+                play_clip(clip, is_cancelled=lambda: stream.cancelled)
         else:
-            _speak_pyttsx3(text)
+            with PIPELINE_METRICS.span("tts.synthesis"):
+                if SYSTEM_OS == "Windows":
+                    _speak_win32com(stream)
+                else:
+                    _speak_pyttsx3(speaker, stream)
+
+        if stream.time_to_first_audio is not None:
+            PIPELINE_METRICS.record("tts.first_audio", stream.time_to_first_audio)
             
-        print("[TTS Worker] Speech command sent!")
+        active_speech_stream = None
+        stream.mark_done()
+        print("[TTS Worker] Speech finished.")
         speech_queue.task_done()
 
+    if speaker:
+        speaker.shutdown()
+
 
 def start_tts_worker():
     """Start the TTS worker thread."""
-    if SYSTEM_OS == "Windows" and tts_engine_win or SYSTEM_OS != "Windows" and tts_engine:
+    if SYSTEM_OS != "Windows" or tts_engine_win:
         worker = threading.Thread(target=tts_worker, daemon=True)
         worker.start()
-        time.sleep(0.2)
+        tts_ready.wait(timeout=5.0)
         print("TTS Worker Thread Started")
 
 
 def jarvis_speak(text): 
-    """Queue text for non-blocking speech."""
+    """Queue text for non-blocking, sentence-streamed speech. Returns the SpeechStream (or None)."""
     print(f"\n[JARVIS]: {text}\n")
-    is_engine_ready = (SYSTEM_OS == "Windows" and tts_engine_win) or (SYSTEM_OS != "Windows" and tts_engine)
-
-    if is_engine_ready:
+    if tts_ready.is_set():
         print(f"[Main] Queuing: {text[:30]}... (Queue size: {speech_queue.qsize()})")
-        speech_queue.put(text)
+        stream = SpeechStream(text)
+        speech_queue.put(stream)
+        return stream
     else: 
         print(f"[JARVIS SPEAKS (Fallback)]: {text}")
+        return None
+
+
+def cancel_speech():
+    """Stops the response being spoken and drops everything still queued (barge-in)."""
+    with speech_queue.mutex:
+        pending = [stream for stream in speech_queue.queue if stream is not None]
+    current = active_speech_stream
+    if current:
+        pending.append(current)
+    for stream in pending:
+        stream.cancel()
+    return len(pending)
 
 
 # -------------------------------------------------------------
@@ -156,68 +277,90 @@ def jarvis_speak(text):
 ACCESS_KEY = os.environ.get("PICOVOICE_ACCESS_KEY")
 WAKE_WORD = "jarvis" 
 
+wake_service = None  # The persistent WakeWordService (one detector + one audio stream)
+
 def wake_word_loop():
+    """Blocks until the wake word is heard. Returns the persistent WakeWordService (or None on failure)."""
+    global wake_service
 
     if not ACCESS_KEY:
         print("Jarvis ERROR: PICOVOICE_ACCESS_KEY environment variable not set.")
         return None
     
-    try:
-        porcupine = pvporcupine.create(
-            access_key=ACCESS_KEY,
-            keywords=[WAKE_WORD]
-        )
+    if wake_service is None:
+        wake_service = WakeWordService(ACCESS_KEY, WAKE_WORD)
+        try:
+            wake_service.start()
+        except Exception as e:
+            print(f"Jarvis ERROR: Failed to initialize Porcupine. Error: {e}")
+            wake_service = None
+            return None
+        PIPELINE_METRICS.record("wake.init", wake_service.init_seconds)
 
-    except Exception as e:
-        print(f"Jarvis ERROR: Failed to initialize Porcupine. Error: {e}")
-        return None
+        # Optional: load the heavy skill libraries while we wait for the wake word.
+        if PREWARM_SKILLS:
+            SKILL_REGISTRY.prewarm(background=True)
 
-    recorder = PvRecorder(
-        frame_length=porcupine.frame_length,
-        device_index=-1 
-    )
-    recorder.start()
     print(f"Listening passively for '{WAKE_WORD}'...")
+    with PIPELINE_METRICS.span("wake.detect"):
+        wake_service.wait_for_wake_word()
+    if wake_service.last_rearm_seconds is not None:
+        PIPELINE_METRICS.record("wake.rearm", wake_service.last_rearm_seconds)
+        wake_service.last_rearm_seconds = None
 
-    try:
-        while True: 
-            pcm = recorder.read() 
-            keyword_index = porcupine.process(pcm)   
-            if keyword_index >= 0:
-                print(f"Wake Word Detected: {WAKE_WORD.upper()}!")
-                break 
-    finally:   
-        porcupine.delete()  
-    return recorder 
+    print(f"Wake Word Detected: {WAKE_WORD.upper()}!")
+    # Barge-in: the user wants to talk, so stop any long answer mid-stream.
+    if cancel_speech():
+        print("[Main] Speech interrupted by the wake word.")
+    return wake_service 
 
 
 # -------------------------------------------------------------
 ## Main Execution (Live STT)
 # -------------------------------------------------------------
 
-def listen_for_command(recorder, recognizer):
-
-    if not recorder:
+def listen_for_command(wake_word_service, recognizer, one_breath=False):
+    """
+    Hears the command from the SAME audio stream the wake word came from.
+    one_breath: the user kept talking after the wake word, so start from the
+    pre-roll in the ring buffer (no acknowledgement, no calibration pause).
+    """
+    if not wake_word_service:
         return None 
-    recorder.stop()
+    wake_word_service.pause()  # The detector stops consuming; the capture stream keeps running
 
-    print("--- Waiting for speech to complete...")
-    speech_queue.join() 
-    time.sleep(0.3)
+    if not one_breath:
+        print("--- Waiting for speech to complete...")
+        with PIPELINE_METRICS.span("listen.wait_for_tts"):
+            speech_queue.join() 
+            time.sleep(0.3)
 
-    with sr.Microphone() as source:
+    # Starting at the newest audio after the acknowledgement means Jarvis never hears itself.
+    with wake_word_service.command_source(preroll=one_breath) as source:
         print("--- JARVIS: Active Listening State. Speak Now... ---")
-        recognizer.adjust_for_ambient_noise(source) 
+        # The capture thread tracks the noise floor all the time, so there is no
+        # blocking calibration window here (only while the estimate warms up).
+        with PIPELINE_METRICS.span("listen.calibration"):
+            if not wake_word_service.noise_floor.apply(recognizer):
+                recognizer.adjust_for_ambient_noise(source, duration=CALIBRATION_SECONDS) 
         
         try:   
-            audio = recognizer.listen(source, timeout=5, phrase_time_limit=8)   
-            command = recognizer.recognize_google(audio)
+            with PIPELINE_METRICS.span("listen.capture"):
+                audio = capture_utterance(source, recognizer.energy_threshold, timeout=5, phrase_time_limit=8)   
+            with PIPELINE_METRICS.span("listen.recognize"):
+                command = recognizer.recognize_google(audio)
             print("--- JARVIS: Processing audio... ---")
-            return command.lower()
+            command = command.lower()
+            if command.startswith(WAKE_WORD):   # The pre-roll can catch the tail of the wake word
+                command = command[len(WAKE_WORD):].lstrip(" ,")
+            return command
             
         except sr.WaitTimeoutError:
             print("--- Timeout: No command heard. ---")
             return None
+        except OSError as e:
+            print(f"--- Audio stream stopped: {e} ---")
+            return None
         except sr.UnknownValueError:
             print("--- Unknown Value: Could not understand audio. ---")
             return None
@@ -229,31 +372,22 @@ def listen_for_command(recorder, recognizer):
 # -------------------------------------------------------------
 ## WEB SCRAPING SKILLS (STATIC AND DYNAMIC)
 # -------------------------------------------------------------
-WEB_URL_REGEX = r'https?://[^\s"\']+'
-WEB_SELECTOR_REGEX = r'["\']([^"\']+)["\']' 
 
 def handle_web_scrape(command):
     """
-    Uses regex to extract the URL and an OPTIONAL CSS selector from the command.
+    Takes the URL(s) and an OPTIONAL CSS selector from the pre-parsed command.
     Uses a sensible default selector if none is provided.
+    Several URLs in one command are scraped one after another.
     """
-    url_match = re.search(WEB_URL_REGEX, command)
-    full_url = url_match.group(0) if url_match else None
+    urls = command.urls
     
-    if not full_url and pyperclip:
-        try:
-            clipboard_content = pyperclip.paste()
-            clipboard_match = re.search(WEB_URL_REGEX, clipboard_content)
-            if clipboard_match:
-                full_url = clipboard_match.group(0)
-                jarvis_speak("Found a URL on the clipboard.")
-        except:
-            pass
+    if not urls and command.clipboard_urls:
+        urls = command.clipboard_urls[:1]
+        jarvis_speak("Found a URL on the clipboard.")
             
-    selector_match = re.search(WEB_SELECTOR_REGEX, command)
-    selector = selector_match.group(1) if selector_match else None
+    selector = command.selector
     
-    if not full_url:
+    if not urls:
         jarvis_speak("I could not find a URL in your command or on the clipboard.")
         return False
         
@@ -261,6 +395,13 @@ def handle_web_scrape(command):
         selector = 'p, h1, h2, h3, li' 
         jarvis_speak("No specific selector was provided. I will attempt to extract main headings, paragraphs, and list items.")
         
+    for full_url in urls:
+        _scrape_and_report(full_url, selector)
+    
+    return True
+
+def _scrape_and_report(full_url, selector):
+    """Scrapes one URL and speaks/prints the results."""
     jarvis_speak(f"Starting ethical web scrape on the provided URL, looking for the element: {selector}.")
     
     elements = scrape_url_for_selector(full_url, selector)
@@ -293,8 +434,41 @@ def handle_web_scrape(command):
             if text:
                 print(f"{i}. {text[:100]}...")
         print("-----------------------------------")
-    
-    return True
+
+SCRAPE_LIST_FILE = Path(__file__).parent / "data" / "scrape_list.txt"
+
+def handle_scrape_list(command):
+    """
+    Scrapes a whole list of URLs concurrently: the URLs in the command (two or more),
+    else every URL on the clipboard, else the ones in data/scrape_list.txt.
+    Progress is printed as each page finishes; the full results are saved as JSON.
+    """
+    urls = list(command.urls)
+    if len(urls) < 2 and command.clipboard_urls:
+        urls = list(dict.fromkeys(urls + list(command.clipboard_urls)))
+    if len(urls) < 2 and SCRAPE_LIST_FILE.exists():
+        urls = list(dict.fromkeys(urls + URL_PATTERN.findall(SCRAPE_LIST_FILE.read_text(encoding="utf-8"))))
+
+    if not urls:
+        jarvis_speak(f"I found no URLs in your command, on the clipboard, or in {SCRAPE_LIST_FILE.name}.")
+        return False
+
+    selector = command.selector or 'h1, h2, h3'
+    jarvis_speak(f"Scraping {len(urls)} pages for {selector}. I will tell you when they are all done.")
+
+    def report_progress(result):
+        status = f"{len(result.items)} items" if result.ok else result.error
+        print(f"[ScrapeList] {result.seconds:5.2f} s  {status:<24} {result.url}")
+
+    results = scrape_list(urls, selector, on_result=report_progress)
+    saved_to = save_scrape_results(results, selector)
+    succeeded = sum(result.ok for result in results)
+    items = sum(len(result.items) for result in results)
+    summary = f"Finished. {succeeded} of {len(results)} pages scraped, {items} items extracted."
+    if succeeded < len(results):
+        summary += f" {len(results) - succeeded} pages failed or were denied by robots.txt."
+    jarvis_speak(f"{summary} The full data is saved in {saved_to.name}.")
+    return succeeded > 0
 
 # --- NEW SKILL INTEGRATION: DYNAMIC SCRAPING HANDLER ---
 def handle_dynamic_scrape(command):
@@ -302,22 +476,14 @@ def handle_dynamic_scrape(command):
     Handles JavaScript-heavy sites by launching a headless browser.
     Extracts text, links, and automatically archives media.
     """
-    url_match = re.search(WEB_URL_REGEX, command)
-    full_url = url_match.group(0) if url_match else None
+    full_url = command.urls[0] if command.urls else None
     
     # Clipboard Fallback
-    if not full_url and pyperclip:
-        try:
-            clipboard_content = pyperclip.paste()
-            clipboard_match = re.search(WEB_URL_REGEX, clipboard_content)
-            if clipboard_match:
-                full_url = clipboard_match.group(0)
-                jarvis_speak("Found a URL on the clipboard for deep search.")
-        except:
-            pass
+    if not full_url and command.clipboard_urls:
+        full_url = command.clipboard_urls[0]
+        jarvis_speak("Found a URL on the clipboard for deep search.")
             
-    selector_match = re.search(WEB_SELECTOR_REGEX, command)
-    selector = selector_match.group(1) if selector_match else None
+    selector = command.selector
     
     if not full_url:
         jarvis_speak("Please provide a URL or copy one to your clipboard for a deep search.")
@@ -360,6 +526,9 @@ def handle_dynamic_scrape(command):
 
 def handle_pdf_parse(command, file_name="data/sample.pdf"):
     """Reads PDF using the fast, standard text parser (pdf_parse)."""
+    pdf_files = [name for name in command.files if name.lower().endswith(".pdf")]
+    if pdf_files:
+        file_name = f"data/{Path(pdf_files[0]).name}"
     file_path = Path(__file__).parent / file_name
 
     if not file_path.exists():
@@ -368,7 +537,7 @@ def handle_pdf_parse(command, file_name="data/sample.pdf"):
     
     jarvis_speak(f"Parsing the clean document, {file_path.name}. Please wait.")
 
-    clean_text = pdf_parse(str(file_path))
+    clean_text = JOB_EXECUTOR.run_cpu(pdf_parse, str(file_path))
 
     if not clean_text or len(clean_text.strip()) < 50:
         jarvis_speak("Standard parser could not extract meaningful text. Try using the 'OCR' command.")
@@ -385,6 +554,8 @@ def handle_pdf_parse(command, file_name="data/sample.pdf"):
 
 def handle_pdf_ocr(command, file_name="data/scanned_sample.png"):
     """Reads PDF using the slow, image-based OCR method (image_ocr)."""
+    if command.files:
+        file_name = f"data/{Path(command.files[0]).name}"
     file_path = Path(__file__).parent / file_name
 
     if not file_path.exists():
@@ -393,7 +564,7 @@ def handle_pdf_ocr(command, file_name="data/scanned_sample.png"):
     
     jarvis_speak(f"Starting OCR process on {file_path.name}. This may take a moment.")
 
-    ocr_text = image_ocr(str(file_path))
+    ocr_text = JOB_EXECUTOR.run_cpu(image_ocr, str(file_path))
 
     if not ocr_text or len(ocr_text.strip()) < 50:
         jarvis_speak("OCR failed to extract meaningful text. Check your Tesseract/Poppler installation.")
@@ -417,22 +588,15 @@ def handle_yt_inspect(command):
     Extracts metadata from a YouTube URL found in the command text, 
     falling back to checking the system clipboard.
     """
-    url_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', command)
     full_url = None
     
-    if url_match:
-        full_url = url_match.group(0)
-    elif pyperclip:
-        try:
-            clipboard_content = pyperclip.paste()
-            clipboard_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', clipboard_content)
-            if clipboard_match:
-                full_url = clipboard_match.group(0)
-                jarvis_speak("Found a YouTube link on your clipboard. Proceeding with inspection.")
-            else:
-                print("LOGIC: Clipboard content was not a YouTube URL.")
-        except Exception as e:
-            print(f"Warning: Could not read clipboard. Error: {e}")
+    if command.youtube_urls:
+        full_url = command.youtube_urls[0]
+    elif command.clipboard_youtube_urls:
+        full_url = command.clipboard_youtube_urls[0]
+        jarvis_speak("Found a YouTube link on your clipboard. Proceeding with inspection.")
+    else:
+        print("LOGIC: Clipboard content was not a YouTube URL.")
 
     if not full_url:
         jarvis_speak("Please copy a valid YouTube link to your clipboard and try again, or include the link in your command.")
@@ -463,20 +627,13 @@ def handle_yt_summarize(command, lang="en"):
     Extracts the full transcript from a YouTube URL found in the command text,
     with clipboard fallback.
     """
-    url_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', command)
     full_url = None
     
-    if url_match:
-        full_url = url_match.group(0)
-    elif pyperclip:
-        try:
-            clipboard_content = pyperclip.paste()
-            clipboard_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', clipboard_content)
-            if clipboard_match:
-                full_url = clipboard_match.group(0)
-                jarvis_speak("Found a YouTube link on your clipboard.")
-        except:
-            pass
+    if command.youtube_urls:
+        full_url = command.youtube_urls[0]
+    elif command.clipboard_youtube_urls:
+        full_url = command.clipboard_youtube_urls[0]
+        jarvis_speak("Found a YouTube link on your clipboard.")
 
     if not full_url:
         jarvis_speak("Please copy a valid YouTube link to your clipboard and try again, or include the link in your command.")
@@ -504,20 +661,13 @@ def handle_yt_saveaudio(command):
     Downloads the audio of a YouTube video using the URL found in the 
     command text or clipboard, and archives it as an MP3.
     """
-    url_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', command)
     full_url = None
     
-    if url_match:
-        full_url = url_match.group(0)
-    elif pyperclip:
-        try:
-            clipboard_content = pyperclip.paste()
-            clipboard_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', clipboard_content)
-            if clipboard_match:
-                full_url = clipboard_match.group(0)
-                jarvis_speak("Found a YouTube link on your clipboard. Starting audio download.")
-        except Exception as e:
-            print(f"Warning: Could not read clipboard. Error: {e}")
+    if command.youtube_urls:
+        full_url = command.youtube_urls[0]
+    elif command.clipboard_youtube_urls:
+        full_url = command.clipboard_youtube_urls[0]
+        jarvis_speak("Found a YouTube link on your clipboard. Starting audio download.")
 
     if not full_url:
         jarvis_speak("Please copy a valid YouTube link to your clipboard and try again, or include the link in your command.")
@@ -540,20 +690,13 @@ def handle_yt_savevideo(command):
     Downloads the video of a YouTube video using the URL found in the 
     command text or clipboard, and archives it as an MP4.
     """
-    url_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', command)
     full_url = None
     
-    if url_match:
-        full_url = url_match.group(0)
-    elif pyperclip:
-        try:
-            clipboard_content = pyperclip.paste()
-            clipboard_match = re.search(r'https?://(?:www\.)?(?:youtu\.be/|youtube\.com/(?:watch\?v=|embed/|v/))([\w-]{11})', clipboard_content)
-            if clipboard_match:
-                full_url = clipboard_match.group(0)
-                jarvis_speak("Found a YouTube link on your clipboard. Starting video download.")
-        except Exception as e:
-            print(f"Warning: Could not read clipboard. Error: {e}")
+    if command.youtube_urls:
+        full_url = command.youtube_urls[0]
+    elif command.clipboard_youtube_urls:
+        full_url = command.clipboard_youtube_urls[0]
+        jarvis_speak("Found a YouTube link on your clipboard. Starting video download.")
 
     if not full_url:
         jarvis_speak("Please copy a valid YouTube link to your clipboard and try again, or include the link in your command.")
@@ -580,6 +723,8 @@ SKILL_MAP = {
     "scrape web": handle_web_scrape,
     "get web data": handle_web_scrape,
     "extract data": handle_web_scrape,
+    "scrape list": handle_scrape_list,
+    "scrape all": handle_scrape_list,
 
     # NEW SKILL TRIGGERS: DYNAMIC SCRAPING
     "research": handle_dynamic_scrape,      
@@ -606,28 +751,91 @@ SKILL_MAP = {
     "archive video": handle_yt_savevideo,
 }
 
+# Compiled ONCE at startup: one pass per command, longest trigger wins.
+INTENT_MATCHER = IntentMatcher(SKILL_MAP)
+# Fallback for STT slips ("red pdf", "scrap web"), only used when exact matching fails.
+# Skills that download, save or scrape need a much closer match: "download file"
+# must not quietly become "download video" (0.79). Near misses get a question instead.
+SIDE_EFFECT_FUZZY_CONFIDENCE = 0.9
+FUZZY_INDEX = FuzzyTriggerIndex(SKILL_MAP, min_confidence=0.75, handler_confidence={
+    name: SIDE_EFFECT_FUZZY_CONFIDENCE for name in (
+        "handle_web_scrape", "handle_scrape_list", "handle_dynamic_scrape",
+        "handle_yt_saveaudio", "handle_yt_savevideo",
+    )
+})
+
+
+# -------------------------------------------------------------
+## Background Skill Execution
+# -------------------------------------------------------------
+
+# Heavy skills get one slot each, so two downloads (or two Chrome instances)
+# never compete for the same link.
+SKILL_CONCURRENCY_LIMITS = {
+    "handle_yt_saveaudio": 1,
+    "handle_yt_savevideo": 1,
+    "handle_dynamic_scrape": 1,
+    "handle_scrape_list": 1,
+    "handle_pdf_ocr": 1,
+}
+
+def on_skill_complete(job):
+    """Completion callback: handlers speak their own results, we report failures."""
+    PIPELINE_METRICS.record("skill.queue_wait", job.started_at - job.submitted_at)
+    PIPELINE_METRICS.record(f"skill.{job.skill_name}", job.duration)
+    if job.status == "failed":
+        jarvis_speak(f"I am sorry, background task number {job.id} ran into an error: {job.error}")
+    else:
+        print(f"[Jobs] Job #{job.id} ({job.skill_name}) finished in {job.duration:.1f}s")
+
+JOB_EXECUTOR = JobExecutor(
+    io_workers=4,
+    skill_limits=SKILL_CONCURRENCY_LIMITS,
+    on_complete=on_skill_complete,
+)
 
 # -------------------------------------------------------------
 ## Intent Router (The Scalable Function)
 # -------------------------------------------------------------
 
+@PIPELINE_METRICS.timed("route")
 def parse_command_for_intent(command):
     """
     Dynamically routes the user command to the appropriate skill function
-    based on the Centralized Skill Map.
+    based on the Centralized Skill Map. The most specific (longest) trigger wins.
+    The skill runs on the JobExecutor, so this returns as soon as it is dispatched.
     """
     if command is None:
         return False
     
+    # Single pre-parse pass: URLs, YouTube IDs, selectors, files, lazy clipboard.
+    command = parse_command(command, clipboard_source=pyperclip)
+    
     if "how may i help" in command or "at your service" in command:
         print(f"LOGIC: Ignoring self-referential command: '{command}'")
         return True
 
-    for keyword, skill_function in SKILL_MAP.items():
-        if keyword in command:
-            print(f"LOGIC: Matched keyword '{keyword}'. Executing {skill_function.__name__}...")
-            skill_function(command) 
-            return True
+    match = INTENT_MATCHER.match(command.text)
+    if match:
+        keyword, skill_function = match
+        print(f"LOGIC: Matched keyword '{keyword}'. Dispatching {skill_function.__name__}...")
+        JOB_EXECUTOR.submit(skill_function.__name__, skill_function, command)
+        return True
+
+    fuzzy_match = FUZZY_INDEX.best_match(command.text)
+    if fuzzy_match:
+        keyword, skill_function, confidence = fuzzy_match
+        print(f"LOGIC: Fuzzy matched '{keyword}' (confidence {confidence:.2f}). Dispatching {skill_function.__name__}...")
+        jarvis_speak(f"I heard something close to {keyword}. Running that now.")
+        JOB_EXECUTOR.submit(skill_function.__name__, skill_function, command)
+        return True
+
+    near_miss = FUZZY_INDEX.near_miss(command.text)
+    if near_miss:
+        keyword, skill_function, confidence = near_miss
+        print(f"LOGIC: '{keyword}' only matched at {confidence:.2f}; not running {skill_function.__name__} without a clearer command.")
+        jarvis_speak(f"Did you mean {keyword}? Please say it again clearly to run it.")
+        return False
             
     jarvis_speak("I am sorry, I did not recognize that command.")
     return False
@@ -637,32 +845,50 @@ def parse_command_for_intent(command):
 ## Main Execution
 # -------------------------------------------------------------
 
+def report_pipeline_metrics():
+    """Prints p50/p99 per stage on shutdown and optionally writes them to disk."""
+    if not PIPELINE_METRICS.histograms:
+        return
+    PIPELINE_METRICS.print_report()
+    if wake_service and wake_service.noise_floor.applied:
+        wake_service.noise_floor.report()
+    if METRICS_FILE:
+        PIPELINE_METRICS.dump(METRICS_FILE)
+
 def main():
-    start_tts_worker()
+    atexit.register(report_pipeline_metrics)
+    if not HEADLESS_MODE:
+        initialize_tts_global()
+        start_tts_worker()
     r = sr.Recognizer()
 
-    while True:
-        active_recorder = wake_word_loop() 
-        if active_recorder is None:
-            print("Fatal Error: Could not initialize wake word or audio recorder.")
-            speech_queue.put(None)
-            return
-        
-        jarvis_speak("At your service. How may I help?")
-        
-        print("\n--- Transitioning to Active Command Listener ---") 
-        command_text = listen_for_command(active_recorder, r) 
-        
-        if command_text:
-            print(f"FINAL COMMAND RECEIVED: {command_text}")
-            parse_command_for_intent(command_text)
-        else:
-            print("Command processing failed or was empty.") 
-        
-        try:
-            active_recorder.delete()
-        except Exception as e:
-            print(f"Warning: Could not delete recorder object. {e}")
+    try:
+        while True:
+            active_wake_service = wake_word_loop() 
+            if active_wake_service is None:
+                print("Fatal Error: Could not initialize wake word or audio recorder.")
+                JOB_EXECUTOR.shutdown()
+                speech_queue.put(None)
+                return
+            
+            # "Jarvis, read pdf" in one breath: skip the acknowledgement and keep listening.
+            active_wake_service.noise_floor.apply(r)
+            one_breath = active_wake_service.speech_follows_wake_word(r.energy_threshold)
+            if not one_breath:
+                jarvis_speak("At your service. How may I help?")
+            
+            print("\n--- Transitioning to Active Command Listener ---") 
+            command_text = listen_for_command(active_wake_service, r, one_breath) 
+            
+            if command_text:
+                print(f"FINAL COMMAND RECEIVED: {command_text}")
+                parse_command_for_intent(command_text)
+            else:
+                print("Command processing failed or was empty.") 
+            # No teardown here: the next wake_word_loop() simply resumes the same detector.
+    finally:
+        if wake_service:
+            wake_service.close()
 
 
 if __name__ == "__main__":
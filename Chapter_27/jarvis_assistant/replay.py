@@ -0,0 +1,253 @@
+# CODE LOCATION: jarvis-assistant/replay.py
+# Headless replay harness: drives the intent router and skills from a JSONL file
+# of already-transcribed commands. No microphone, no Picovoice key, no speakers.
+#
+# Usage (from the jarvis-assistant folder):
+#   python replay.py data/replay_commands.jsonl
+#   python replay.py data/replay_commands.jsonl --repeat 50 --report replay_report.json
+#   python replay.py data/replay_commands.jsonl --real-skills   (hits the network / disk)
+#
+# Each JSONL line: {"command": "scrape web https://example.com", "expected": "handle_web_scrape",
+#                   "clipboard": "optional clipboard text"}
+# "expected" is the handler name, or null when Jarvis should NOT recognize the command.
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Must be set before main.py is imported: skip the TTS engine and skill pre-warm.
+os.environ.setdefault("JARVIS_HEADLESS", "1")
+os.environ.setdefault("JARVIS_PREWARM_SKILLS", "0")
+
+import main as jarvis
+from core.job_executor import InlineExecutor
+from core.skill_registry import LazySkill
+
+
+# --- Stand-ins for audio and the clipboard ---
+
+class SpeechCollector:
+    """Replaces jarvis_speak: keeps every sentence instead of speaking it."""
+
+    def __init__(self):
+        self.lines = []
+
+    def speak(self, text):
+        self.lines.append(text)
+
+    def drain(self):
+        lines, self.lines = self.lines, []
+        return lines
+
+
+class FakeClipboard:
+    """Replaces pyperclip: paste() returns whatever the replay record provides."""
+
+    def __init__(self):
+        self.content = ""
+
+    def paste(self):
+        return self.content
+
+
+# --- Local fakes for the skill backends (no network, no Chrome, no yt-dlp) ---
+
+def fake_scrape_url_for_selector(url, selector):
+    return [f"Headline {i} for {selector} on {url}" for i in range(1, 8)]
+
+def fake_scrape_dynamic_site(url, selector):
+    return [{'text': f"Card {i}", 'link': f"{url}#{i}", 'image_url': None, 'local_path': None} for i in range(1, 6)]
+
+def fake_scrape_list(urls, selector, concurrency=None, per_host=None, on_result=None):
+    results = []
+    for url in urls:
+        result = SimpleNamespace(url=url, items=[f"Headline {i} for {selector}" for i in range(1, 4)],
+                                 error=None, seconds=0.01, ok=True)
+        if on_result:
+            on_result(result)
+        results.append(result)
+    return results
+
+def fake_save_scrape_results(results, selector):
+    return Path("data/scraped_data/replay_scrape_list.json")     # Nothing is written
+
+def fake_pdf_parse(file_path):
+    return "This replayed document has a clean, readable first page. " * 20
+
+def fake_image_ocr(file_path):
+    return "This replayed scan was recognized by the fake OCR engine. " * 20
+
+def fake_yt_inspect(url):
+    return {"title": "Replay Test Video", "duration": "3:14", "channel": "Jarvis Labs", "thumbnail_url": "N/A"}
+
+def fake_yt_summarize(url, lang="en"):
+    return "welcome back to the channel today we are testing the replay harness " * 30
+
+def fake_yt_saveaudio(url):
+    return Path("data/archive_media/replay_test.mp3")
+
+def fake_yt_savevideo(url):
+    return Path("data/archive_media/replay_test.mp4")
+
+FAKE_BACKENDS = {
+    "scrape_url_for_selector": fake_scrape_url_for_selector,
+    "scrape_dynamic_site": fake_scrape_dynamic_site,
+    "scrape_list": fake_scrape_list,
+    "save_scrape_results": fake_save_scrape_results,
+    "pdf_parse": fake_pdf_parse,
+    "image_ocr": fake_image_ocr,
+    "yt_inspect": fake_yt_inspect,
+    "yt_summarize": fake_yt_summarize,
+    "yt_saveaudio": fake_yt_saveaudio,
+    "yt_savevideo": fake_yt_savevideo,
+}
+
+
+class MissingFake:
+    """Stands in for a registry skill with no entry in FAKE_BACKENDS: records the call and fails it."""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.__name__ = name
+        self.calls = calls
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(self.name)
+        raise RuntimeError(f"'{self.name}' has no fake in FAKE_BACKENDS; a replay must stay offline")
+
+
+def load_commands(path):
+    """Reads replay records, skipping blank lines and '#' comments."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"[Replay] Skipping line {line_number}: {e}")
+                continue
+            if "command" not in record:
+                print(f"[Replay] Skipping line {line_number}: no 'command' field")
+                continue
+            records.append(record)
+    return records
+
+
+class ReplayHarness:
+    """Swaps Jarvis's audio, clipboard and (optionally) skill backends for local stand-ins."""
+
+    def __init__(self, use_fakes=True, backends=None):
+        self.speech = SpeechCollector()
+        self.clipboard = FakeClipboard()
+        self.metrics = jarvis.PIPELINE_METRICS
+        self.executor = InlineExecutor(on_complete=jarvis.on_skill_complete)
+
+        jarvis.jarvis_speak = self.speech.speak
+        jarvis.pyperclip = self.clipboard
+        jarvis.JOB_EXECUTOR = self.executor
+
+        overrides = dict(FAKE_BACKENDS) if use_fakes else {}
+        overrides.update(backends or {})
+        for name, function in overrides.items():
+            setattr(jarvis, name, function)
+
+        # Any lazy skill left unfaked would hit the network or disk: make it fail loudly instead.
+        self.unfaked_calls = []
+        if use_fakes:
+            for name, value in vars(jarvis).items():
+                if isinstance(value, LazySkill):
+                    setattr(jarvis, name, MissingFake(name, self.unfaked_calls))
+
+    def run_one(self, record):
+        self.clipboard.content = record.get("clipboard", "")
+        last_job_before = self.executor.last_job_id
+        unfaked_before = len(self.unfaked_calls)
+
+        start = time.perf_counter()
+        jarvis.parse_command_for_intent(record["command"].lower())
+        elapsed = time.perf_counter() - start
+
+        job = self.executor.jobs.get(last_job_before + 1)     # The first job this command dispatched
+        routed = job.skill_name if job else None
+
+        result = {
+            "command": record["command"],
+            "routed": routed,
+            "status": job.status if job else "unrecognized",
+            "seconds": elapsed,
+            "speech": self.speech.drain(),
+            "unfaked": self.unfaked_calls[unfaked_before:],
+        }
+        if "expected" in record:
+            result["expected"] = record["expected"]
+            result["ok"] = routed == record["expected"]
+        return result
+
+    def run(self, records, repeat=1):
+        results = []
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for record in records:
+                results.append(self.run_one(record))
+        total_seconds = time.perf_counter() - start
+
+        misroutes = [r for r in results if r.get("ok") is False]
+        failures = [r for r in results if r["status"] == "failed"]
+        unfaked = [r for r in results if r["unfaked"]]
+        return {
+            "commands": len(results),
+            "seconds": total_seconds,
+            "commands_per_sec": len(results) / total_seconds if total_seconds else 0.0,
+            "labelled": sum(1 for r in results if "ok" in r),
+            "misroutes": misroutes,
+            "failures": failures,
+            "unfaked": unfaked,
+            "stages": self.metrics.snapshot(),
+        }
+
+
+def print_summary(summary):
+    print("\n" + "=" * 60)
+    print("  JARVIS REPLAY REPORT")
+    print("=" * 60)
+    print(f"Commands replayed : {summary['commands']}")
+    print(f"Throughput        : {summary['commands_per_sec']:.1f} commands/sec")
+    print(f"Mis-routes        : {len(summary['misroutes'])} of {summary['labelled']} labelled")
+    print(f"Skill failures    : {len(summary['failures'])}")
+    print(f"Unfaked backends  : {len(summary['unfaked'])}")
+
+    for miss in summary["misroutes"][:10]:
+        print(f"   MISROUTE: '{miss['command']}' -> {miss['routed']} (expected {miss['expected']})")
+    for failure in summary["failures"][:10]:
+        print(f"   FAILED:   '{failure['command']}' -> {failure['routed']}")
+    for record in summary["unfaked"][:10]:
+        print(f"   UNFAKED:  '{record['command']}' -> {', '.join(record['unfaked'])} (add it to FAKE_BACKENDS)")
+
+    jarvis.PIPELINE_METRICS.print_report()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay transcribed commands through Jarvis without audio hardware.")
+    parser.add_argument("commands", help="JSONL file of commands to replay")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the whole file this many times")
+    parser.add_argument("--real-skills", action="store_true", help="Use the real skill backends instead of local fakes")
+    parser.add_argument("--report", help="Write the full summary as JSON to this path")
+    args = parser.parse_args()
+
+    harness = ReplayHarness(use_fakes=not args.real_skills)
+    summary = harness.run(load_commands(args.commands), repeat=args.repeat)
+    print_summary(summary)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"[Replay] Full report written to {args.report}")
+
+    # Mis-routes, and skills that escaped to the real backends, make the run fail, so this can gate a CI job.
+    raise SystemExit(1 if summary["misroutes"] or summary["unfaked"] else 0)
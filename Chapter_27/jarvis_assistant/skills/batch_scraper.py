@@ -0,0 +1,199 @@
+# CODE LOCATION: jarvis-assistant/skills/batch_scraper.py
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+from skills.selector_engine import select_text
+from skills.web_tools import check_robots_txt, fetch_html, parse_data
+
+# --- Concurrent Multi-URL Scraping ---
+# scrape_url_for_selector() handles one URL at a time; a pasted list of 500
+# headlines pages would take minutes. scrape_many() runs the same three steps
+# (robots -> fetch -> parse) for many URLs under asyncio:
+#   * at most 'concurrency' pages in flight, and at most 'per_host' per site
+#   * the blocking steps reuse the existing layers (robots cache, crawl-delay
+#     limiter, HTTP cache, pooled keep-alive client) on a thread pool
+#   * parsing is CPU work, so it runs in a warm process pool, off the event loop
+#     (small lists parse on the thread pool; spawning workers would cost more).
+#     Workers start from a clean forkserver (spawn on Windows) and only run
+#     selector_engine.select_text, so they never open the robots/HTTP caches
+#     or start the assistant's TTS engine
+#   * results are yielded as soon as each page is done, not at the end
+
+DEFAULT_CONCURRENCY = 16
+PER_HOST_LIMIT = 2
+PROCESS_POOL_MIN_URLS = 8        # Below this, starting worker processes costs more than it saves
+URL_PATTERN = re.compile(r'https?://[^\s"\'<>]+')
+ARCHIVE_DIR = Path(__file__).parent.parent / "data" / "scraped_data"
+
+
+@dataclass
+class ScrapeResult:
+    url: str
+    items: list = field(default_factory=list)
+    error: str = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def read_url_list(text):
+    """All distinct URLs in a text (clipboard contents or a file), in order."""
+    return list(dict.fromkeys(match.rstrip(".,;)") for match in URL_PATTERN.findall(text)))
+
+
+def save_results(results, selector):
+    """Writes all results to data/scraped_data/scrape_list_<timestamp>.json and returns the path."""
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    path = ARCHIVE_DIR / f"scrape_list_{datetime.now():%Y%m%d_%H%M%S}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"selector": selector, "results": [asdict(result) for result in results]}, f, indent=2, ensure_ascii=False)
+    return path
+
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """The process-wide parser pool, started on first use and kept warm (None if it cannot start)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            try:
+                # Never 'fork': Jarvis has TTS and audio threads running that a forked child would inherit half-way
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                _parse_pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 2, 4),
+                                                  mp_context=multiprocessing.get_context(method))
+            except (OSError, ValueError) as e:
+                print(f"[BatchScraper] Process pool unavailable ({e}); parsing on threads.")
+                _parse_pool = False
+        return _parse_pool or None
+
+
+def _discard_parse_pool():
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = False         # Do not keep retrying a pool that cannot start
+
+
+async def scrape_many(urls, selector, concurrency=DEFAULT_CONCURRENCY, per_host=PER_HOST_LIMIT):
+    """Async generator: yields a ScrapeResult for every URL, in completion order."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    host_slots = {}
+
+    parse_pool = get_parse_pool() if len(urls) >= PROCESS_POOL_MIN_URLS else None
+
+    async def parse(fetch_pool, html):
+        nonlocal parse_pool
+        if parse_pool:
+            try:
+                items = await loop.run_in_executor(parse_pool, select_text, html, selector)
+                print(f"[WebTool] Extracted {len(items)} elements using selector: '{selector}'")
+                return items
+            except (BrokenProcessPool, RuntimeError) as e:
+                # E.g. a script without an "if __name__ == '__main__':" guard on Windows/macOS
+                print(f"[BatchScraper] Parser processes failed ({str(e).strip().splitlines()[0]}); parsing on threads.")
+                if parse_pool is _parse_pool:
+                    _discard_parse_pool()
+                parse_pool = None
+            except Exception as e:
+                print(f"[WebTool] Parsing error with selector '{selector}': {e}")     # As parse_data() does
+                return []
+        return await loop.run_in_executor(fetch_pool, parse_data, html, selector)
+
+    async def scrape_one(url, fetch_pool):
+        host = urlparse(url).netloc.lower()
+        host_slot = host_slots.setdefault(host, asyncio.Semaphore(per_host))
+        async with host_slot:       # Wait for the site first, so no global slot is held idle
+            async with slots:
+                start = time.perf_counter()
+                try:
+                    is_allowed, crawl_delay = await loop.run_in_executor(fetch_pool, check_robots_txt, url)
+                    if not is_allowed:
+                        return ScrapeResult(url, error="denied by robots.txt", seconds=time.perf_counter() - start)
+                    html = await loop.run_in_executor(fetch_pool, fetch_html, url, crawl_delay)
+                    if not html:
+                        return ScrapeResult(url, error="fetch failed", seconds=time.perf_counter() - start)
+                    items = await parse(fetch_pool, html)
+                    return ScrapeResult(url, items, seconds=time.perf_counter() - start)
+                except Exception as e:
+                    return ScrapeResult(url, error=str(e), seconds=time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="scrape") as fetch_pool:
+        tasks = [asyncio.create_task(scrape_one(url, fetch_pool)) for url in urls]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def scrape_list(urls, selector, concurrency=DEFAULT_CONCURRENCY, per_host=PER_HOST_LIMIT, on_result=None):
+    """Blocking wrapper for skills and the CLI. on_result(result) is called as each page finishes."""
+    async def collect():
+        results = []
+        async for result in scrape_many(urls, selector, concurrency, per_host):
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
+
+    return asyncio.run(collect())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape a list of URLs for one CSS selector.")
+    parser.add_argument("--file", help="Text file with URLs (default: read the clipboard)")
+    parser.add_argument("--selector", default="h1, h2, h3", help="CSS selector to extract")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--per-host", type=int, default=PER_HOST_LIMIT)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            urls = read_url_list(f.read())
+    else:
+        import pyperclip
+        urls = read_url_list(pyperclip.paste() or "")
+    if not urls:
+        print("No URLs found.")
+        return
+
+    def show(result):
+        status = f"{len(result.items)} items" if result.ok else result.error
+        print(f"[BatchScraper] {result.seconds:5.2f} s  {status:<24} {result.url}")
+
+    start = time.perf_counter()
+    results = scrape_list(urls, args.selector, args.concurrency, args.per_host, on_result=show)
+    succeeded = sum(result.ok for result in results)
+    print(f"\n{succeeded}/{len(results)} pages scraped in {time.perf_counter() - start:.1f} s, "
+          f"{sum(len(result.items) for result in results)} items extracted")
+
+
+if __name__ == "__main__":
+    # Run from the jarvis-assistant folder:
+    #   python -m skills.batch_scraper --file urls.txt --selector "h2.widget-title"
+    #   python -m skills.batch_scraper --selector "h2"        (URLs from the clipboard)
+    main()
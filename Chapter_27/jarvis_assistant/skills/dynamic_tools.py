@@ -1,7 +1,6 @@
 # CODE LOCATION: jarvis-assistant/skills/dynamic_tools.py
 
 import time
-import requests
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -12,6 +11,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
+from skills.http_client import get_http_client
+
 # --- Configuration & Archive Setup ---
 ARCHIVE_DIR = Path(__file__).parent.parent / "data" / "scraped_data"
 ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
@@ -25,7 +26,8 @@ def download_media(url, folder, filename):
         safe_name = "".join(x for x in filename if x.isalnum() or x in "._- ").strip()
         save_path = folder / f"{safe_name}.jpg"
 
-        response = requests.get(url, timeout=10)
+        # Images from one page share a host: the pooled client reuses the connection
+        response = get_http_client().get(url, timeout=10)
         if response.status_code == 200:
             with open(save_path, "wb") as f:
                 f.write(response.content)
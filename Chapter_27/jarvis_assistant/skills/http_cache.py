@@ -0,0 +1,213 @@
+# CODE LOCATION: jarvis-assistant/skills/http_cache.py
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+# --- The Conditional-GET Response Cache ---
+# "Scrape web" on the same page used to download the whole page every time.
+# Responses are now kept on disk (gzip-compressed), keyed by URL:
+#   fresh (Cache-Control max-age / Expires)   -> served from disk, no network at all
+#   stale but has ETag / Last-Modified        -> revalidated with If-None-Match /
+#                                                If-Modified-Since; a 304 has no body
+#   no-store                                  -> never written to disk
+#   no-cache                                  -> stored, but always revalidated
+# The folder is bounded by size; the least recently used pages are evicted first.
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+INDEX_FILE = "index.json"
+
+
+def _cache_control(headers):
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def freshness_lifetime(headers, now):
+    """Seconds the response may be served without asking the server (0 = always revalidate)."""
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return 0
+    for name in ("s-maxage", "max-age"):
+        if directives.get(name, "").isdigit():
+            return int(directives[name])
+    if headers.get("Expires"):
+        try:
+            return max(parsedate_to_datetime(headers["Expires"]).timestamp() - now, 0)
+        except (TypeError, ValueError):
+            return 0                # An invalid Expires means "already expired"
+    return 0
+
+
+class CacheEntry:
+    """Metadata of one cached response; the body lives in <key>.gz."""
+
+    def __init__(self, url, key, size, expires_at, etag=None, last_modified=None,
+                 content_type="", encoding=None, last_used=None):
+        self.url = url
+        self.key = key
+        self.size = size
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.encoding = encoding
+        self.last_used = last_used or time.time()
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires_at
+
+    def validators(self):
+        """Headers for a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+class HttpCache:
+    """Size-bounded, LRU-evicted, on-disk cache of GET responses. Thread-safe."""
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.entries = {}
+        self.hits = 0               # Served from disk without any request
+        self.revalidated = 0        # 304 Not Modified: request sent, body not transferred
+        self.misses = 0             # Full download
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._load_index()
+        with self._lock:
+            self._evict()       # max_bytes may have been lowered since the last run
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key):
+        return self.cache_dir / f"{key}.gz"
+
+    def _load_index(self):
+        try:
+            with open(self.cache_dir / INDEX_FILE, encoding="utf-8") as f:
+                for data in json.load(f):
+                    entry = CacheEntry(**data)
+                    if self._body_path(entry.key).exists():
+                        self.entries[entry.url] = entry
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[HttpCache] Ignoring unreadable index in {self.cache_dir}: {e}")
+
+    def _save_index(self):
+        # Called with self._lock held
+        temp_path = self.cache_dir / f"{INDEX_FILE}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump([entry.to_dict() for entry in self.entries.values()], f)
+        os.replace(temp_path, self.cache_dir / INDEX_FILE)
+
+    def lookup(self, url):
+        """The cached entry for url (fresh or stale), or None."""
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry:
+                entry.last_used = time.time()
+            return entry
+
+    def read_text(self, entry):
+        try:
+            body = gzip.decompress(self._body_path(entry.key).read_bytes())
+        except (OSError, EOFError) as e:
+            print(f"[HttpCache] Dropping unreadable entry for {entry.url}: {e}")
+            self.remove(entry.url)
+            return None
+        return body.decode(entry.encoding or "utf-8", errors="replace")
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_not_modified(self, entry, headers):
+        """A 304 arrived: the stored body is still good; refresh its lifetime and validators."""
+        with self._lock:
+            self.revalidated += 1
+            now = time.time()
+            entry.expires_at = now + freshness_lifetime(headers, now)
+            entry.etag = headers.get("ETag", entry.etag)
+            entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+            self._save_index()
+
+    def store(self, url, response):
+        """Stores a 200 response unless it forbids caching or has no way to be reused."""
+        with self._lock:
+            self.misses += 1
+        headers = response.headers
+        now = time.time()
+        lifetime = freshness_lifetime(headers, now)
+        if "no-store" in _cache_control(headers):
+            return
+        if not lifetime and not (headers.get("ETag") or headers.get("Last-Modified")):
+            return                  # Could never be served or revalidated
+
+        key = self.key(url)
+        compressed = gzip.compress(response.content, compresslevel=6)
+        temp_path = self.cache_dir / f"{key}.tmp"
+        temp_path.write_bytes(compressed)
+        os.replace(temp_path, self._body_path(key))
+
+        with self._lock:
+            self.entries[url] = CacheEntry(
+                url, key, len(compressed), now + lifetime,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+                content_type=headers.get("Content-Type", ""),
+                encoding=response.encoding or response.apparent_encoding,   # What response.text used
+            )
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        # Called with self._lock held
+        total = sum(entry.size for entry in self.entries.values())
+        for entry in sorted(self.entries.values(), key=lambda entry: entry.last_used):
+            if total <= self.max_bytes:
+                break
+            del self.entries[entry.url]
+            self._body_path(entry.key).unlink(missing_ok=True)
+            total -= entry.size
+            self.evictions += 1
+
+    def remove(self, url):
+        with self._lock:
+            entry = self.entries.pop(url, None)
+            if entry:
+                self._body_path(entry.key).unlink(missing_ok=True)
+                self._save_index()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": sum(entry.size for entry in self.entries.values()),
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,220 @@
+# CODE LOCATION: jarvis-assistant/skills/robots_cache.py
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import urllib.robotparser
+from urllib.parse import urlparse
+
+# --- The robots.txt Cache ---
+# check_robots_txt() used to download robots.txt before EVERY scrape, doubling
+# the round trips to the same site. Policies are now cached per scheme+host:
+#   200      -> parsed rules, kept for ROBOTS_TTL
+#   404/4xx  -> "no robots.txt, everything allowed" (negative cache entry)
+#   401/403  -> "everything disallowed", like RobotFileParser.read()
+#   5xx      -> disallowed (RFC 9309 2.3.1.4), but only cached briefly (ERROR_TTL)
+#   down     -> allowed with a warning, also cached briefly
+# The cache can be persisted to a JSON file so a restart does not refetch.
+# HostRateLimiter spaces requests to a host by its Crawl-delay/Request-rate.
+
+ROBOTS_TTL = 24 * 3600       # Seconds a fetched robots.txt stays valid
+MISSING_TTL = 6 * 3600       # Seconds a 404 is remembered
+ERROR_TTL = 5 * 60           # Seconds before retrying a host whose robots.txt failed
+FETCH_TIMEOUT = 10
+
+
+def host_key(url):
+    """scheme://host[:port], the unit robots.txt applies to."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}"
+
+
+class RobotsPolicy:
+    """One host's robots.txt rules (or the lack of them)."""
+
+    def __init__(self, status, lines=(), fetched_at=None, expires_at=None):
+        self.status = status            # "ok", "missing", "denied" or "error"
+        self.lines = list(lines)
+        self.fetched_at = fetched_at or time.time()
+        self.expires_at = expires_at or self.fetched_at
+        self.parser = urllib.robotparser.RobotFileParser()
+        if status == "ok":
+            self.parser.parse(self.lines)
+        elif status == "denied":
+            self.parser.disallow_all = True
+        else:
+            self.parser.allow_all = True
+        self.parser.modified()          # can_fetch() refuses everything until a fetch time is set
+
+    @property
+    def expired(self):
+        return time.time() >= self.expires_at
+
+    def can_fetch(self, user_agent, url):
+        return self.parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent):
+        """Seconds to wait between requests: Crawl-delay, or derived from Request-rate."""
+        delay = self.parser.crawl_delay(user_agent)
+        if delay:
+            return float(delay)
+        rate = self.parser.request_rate(user_agent)
+        if rate and rate.requests:
+            return rate.seconds / rate.requests
+        return 0.0
+
+    def to_dict(self):
+        return {"status": self.status, "lines": self.lines,
+                "fetched_at": self.fetched_at, "expires_at": self.expires_at}
+
+
+class RobotsCache:
+    """Thread-safe robots.txt cache keyed by scheme+host, optionally persisted to a JSON file."""
+
+    def __init__(self, user_agent, cache_file=None, ttl=ROBOTS_TTL):
+        self.user_agent = user_agent
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.policies = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._host_locks = {}           # One fetch per host, even with concurrent scrapes
+        if cache_file:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                for key, data in json.load(f).items():
+                    policy = RobotsPolicy(**data)
+                    if not policy.expired:
+                        self.policies[key] = policy
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            print(f"[RobotsCache] Ignoring unreadable cache file {self.cache_file}: {e}")
+
+    def _save(self):
+        with self._lock:
+            data = {key: policy.to_dict() for key, policy in self.policies.items() if policy.status != "error"}
+        temp_path = f"{self.cache_file}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            print(f"[RobotsCache] Could not save {self.cache_file}: {e}")
+
+    def _fetch(self, key):
+        robots_url = f"{key}/robots.txt"
+        request = urllib.request.Request(robots_url, headers={"User-Agent": self.user_agent})
+        now = time.time()
+        try:
+            with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+                lines = response.read().decode("utf-8", errors="replace").splitlines()
+            return RobotsPolicy("ok", lines, now, now + self.ttl)
+        except urllib.error.HTTPError as e:
+            if e.code in (401, 403):
+                return RobotsPolicy("denied", (), now, now + self.ttl)
+            if 400 <= e.code < 500:
+                return RobotsPolicy("missing", (), now, now + MISSING_TTL)
+            # A server error means "unreachable": treat the whole site as disallowed for now
+            print(f"[RobotsCache] {robots_url} returned HTTP {e.code}. Not scraping this host for {ERROR_TTL // 60} minutes.")
+            return RobotsPolicy("denied", (), now, now + ERROR_TTL)
+        except (urllib.error.URLError, OSError) as e:
+            print(f"[RobotsCache] Could not read {robots_url}: {e}. Proceeding with caution.")
+        return RobotsPolicy("error", (), now, now + ERROR_TTL)
+
+    def policy(self, url):
+        """The cached policy for url's host, fetching robots.txt only when missing or expired."""
+        key = host_key(url)
+        with self._lock:
+            policy = self.policies.get(key)
+            if policy and not policy.expired:
+                self.hits += 1
+                return policy
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+
+        with host_lock:
+            with self._lock:
+                policy = self.policies.get(key)
+                if policy and not policy.expired:   # Another thread fetched it meanwhile
+                    self.hits += 1
+                    return policy
+                self.misses += 1
+            policy = self._fetch(key)
+            with self._lock:
+                self.policies[key] = policy
+        if self.cache_file and policy.status != "error":
+            self._save()
+        return policy
+
+    def check(self, url):
+        """(is_allowed, crawl_delay_seconds) for url."""
+        policy = self.policy(url)
+        return policy.can_fetch(self.user_agent, url), policy.crawl_delay(self.user_agent)
+
+    def stats(self):
+        return {"hosts": len(self.policies), "hits": self.hits, "misses": self.misses}
+
+
+class HostRateLimiter:
+    """Spaces requests to the same host at least 'delay' seconds apart (thread-safe)."""
+
+    def __init__(self):
+        self.next_allowed = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url, delay):
+        """Blocks until a request to url's host is allowed, then reserves the next slot."""
+        if delay <= 0:
+            return 0.0
+        key = host_key(url)
+        with self._lock:
+            now = time.monotonic()
+            start = max(self.next_allowed.get(key, now), now)
+            self.next_allowed[key] = start + delay
+        waited = start - now
+        if waited > 0:
+            print(f"[WebTool] Honouring crawl delay for {key}: waiting {waited:.1f} s")
+            time.sleep(waited)
+        return waited
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly).
+    # A local stand-in server: one "site" with robots.txt, requests on another port get 404.
+    import tempfile
+    from functools import partial
+    from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    with tempfile.TemporaryDirectory() as site, tempfile.TemporaryDirectory() as empty_site:
+        with open(os.path.join(site, "robots.txt"), "w") as f:
+            f.write("User-agent: *\nDisallow: /private/\nCrawl-delay: 1\n")
+        servers = [HTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=folder)) for folder in (site, empty_site)]
+        for server in servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        with_robots, without_robots = (f"http://127.0.0.1:{server.server_port}" for server in servers)
+
+        cache_file = os.path.join(site, "robots_cache.json")
+        cache = RobotsCache("JarvisAssistantScraper/1.0", cache_file=cache_file)
+        for url in [f"{with_robots}/news", f"{with_robots}/private/a", f"{with_robots}/news/2", f"{without_robots}/x", f"{without_robots}/y"]:
+            print(f"{url:<40} -> allowed, delay = {cache.check(url)}")
+        print(f"Stats: {cache.stats()}")
+        print(f"Reloaded from disk: {RobotsCache('JarvisAssistantScraper/1.0', cache_file=cache_file).stats()}")
+
+        limiter = HostRateLimiter()
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait(f"{with_robots}/news", cache.check(f"{with_robots}/news")[1])
+        print(f"3 requests with Crawl-delay 1 took {time.monotonic() - start:.2f} s")
+        for server in servers:
+            server.shutdown()
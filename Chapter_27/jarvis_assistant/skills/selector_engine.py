@@ -0,0 +1,238 @@
+# CODE LOCATION: jarvis-assistant/skills/selector_engine.py
+
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+try:
+    from cssselect import HTMLTranslator, SelectorError, parse as parse_css
+except ImportError:
+    print("Warning: cssselect not installed. Install with 'pip install cssselect' to run complex selectors on lxml.")
+    HTMLTranslator = None
+
+# --- The Selector Engine ---
+# parse_data() used to build a full BeautifulSoup tree and run soup.select():
+# every node becomes a Python object, so large pages spend most of their time
+# (and memory) in BeautifulSoup itself. A selector is now compiled ONCE into
+# an XPath expression and evaluated by lxml in C:
+#   simple selectors   -> "h2.widget-title", "p, h1, h2, h3, li", "#main", "div.card.news"
+#                         compiled here; very large pages are streamed instead, and
+#                         finished elements are freed as the parser moves on
+#   other selectors    -> "div.card > p a", "ul li:nth-child(2)", "a[href^='/news']"
+#                         translated by cssselect (when installed), matched right to left
+#   anything else      -> BeautifulSoup, exactly as before
+# Text follows BeautifulSoup's .text: no comments, and no script/style/template
+# (or ruby rt/rp) text unless the matched element is one of those itself.
+
+STREAM_MIN_CHARS = 4 * 1024 * 1024      # Bigger pages are streamed: about 5x less memory, 2x slower
+FEED_CHUNK_CHARS = 64 * 1024
+SIMPLE_PATTERN = re.compile(r'^(\*|[a-zA-Z][a-zA-Z0-9-]*)?((?:[.#][a-zA-Z_-][\w-]*)*)$')
+STRING_CONTAINERS = ("script", "style", "template", "rt", "rp")   # BeautifulSoup's special string types
+
+_IN_CONTAINER = " or ".join(f"self::{tag}" for tag in STRING_CONTAINERS)
+_PLAIN_TEXT = etree.XPath(f".//text()[not(ancestor::*[{_IN_CONTAINER}])]", smart_strings=False)
+_CONTAINER_TEXT = {
+    tag: etree.XPath(f".//text()[ancestor::*[{_IN_CONTAINER}][1][self::{tag}]]", smart_strings=False)
+    for tag in STRING_CONTAINERS
+}
+
+
+def element_text(element):
+    """The text BeautifulSoup's tag.text would give for this lxml element, stripped."""
+    text_of = _CONTAINER_TEXT.get(element.tag, _PLAIN_TEXT)
+    return "".join(text_of(element)).strip()
+
+
+if HTMLTranslator:
+    class RightToLeftTranslator(HTMLTranslator):
+        """
+        cssselect writes "div.card > p a" left to right (div/p/descendant::a), and
+        libxml2 merges the node set of every div into the result: quadratic on big
+        pages. Like a browser, this finds each 'a' and checks its ancestors instead.
+        """
+
+        def _relative(self, axis, left, right, fallback):
+            if left.path:           # A step that is not a plain element test: keep cssselect's form
+                return fallback(left, right)
+            return right.add_condition(f"{axis}::{left}")
+
+        def xpath_descendant_combinator(self, left, right):
+            return self._relative("ancestor", left, right, super().xpath_descendant_combinator)
+
+        def xpath_child_combinator(self, left, right):
+            return self._relative("parent", left, right, super().xpath_child_combinator)
+
+        def xpath_direct_adjacent_combinator(self, left, right):
+            return self._relative("preceding-sibling::*[1]/self", left, right, super().xpath_direct_adjacent_combinator)
+
+        def xpath_indirect_adjacent_combinator(self, left, right):
+            return self._relative("preceding-sibling", left, right, super().xpath_indirect_adjacent_combinator)
+
+        def selector_steps(self, css):
+            """[(element, condition), ...] per comma group, or None if a group needs cssselect's own path form."""
+            steps = []
+            for selector in parse_css(css):
+                expr = self.xpath(selector.parsed_tree)
+                if expr.path or selector.pseudo_element:
+                    return None
+                steps.append((expr.element, expr.condition))
+            return steps
+
+
+class SimpleSelector:
+    """One compound selector: an optional tag name plus any number of .class and #id parts."""
+
+    def __init__(self, tag, classes, element_id):
+        self.tag = tag
+        self.classes = frozenset(classes)
+        self.element_id = element_id
+
+    @classmethod
+    def parse(cls, text):
+        match = SIMPLE_PATTERN.match(text)
+        if not match or not text:
+            return None
+        tag = match.group(1) if match.group(1) not in (None, "*") else None
+        parts = re.findall(r'([.#])([\w-]+)', match.group(2))
+        ids = [name for kind, name in parts if kind == "#"]
+        if len(ids) > 1:
+            return None
+        return cls(tag.lower() if tag else None, [name for kind, name in parts if kind == "."], ids[0] if ids else None)
+
+    def matches(self, element):
+        if self.tag and element.tag != self.tag:
+            return False
+        if self.element_id and element.get("id") != self.element_id:
+            return False
+        return not self.classes or self.classes.issubset((element.get("class") or "").split())
+
+    def step(self):
+        """(element, condition) for an XPath step matching this compound."""
+        conditions = [f"@id='{self.element_id}'"] if self.element_id else []
+        conditions += [f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in sorted(self.classes)]
+        return self.tag or "*", " and ".join(conditions)
+
+
+def match_any(steps):
+    """
+    One XPath that finds elements matching any of the steps, in document order.
+    A single step with an "or" condition, never "a | b": libxml2 merges union
+    results pairwise, which is quadratic on pages with thousands of matches.
+    """
+    if len(steps) == 1:
+        element, condition = steps[0]
+        return f"descendant-or-self::{element}" + (f"[{condition}]" if condition else "")
+    alternatives = []
+    for element, condition in steps:
+        parts = ([f"self::{element}"] if element != "*" else []) + ([f"({condition})"] if condition else [])
+        alternatives.append(" and ".join(parts) or "true()")
+    return "descendant-or-self::*[" + " or ".join(f"({alternative})" for alternative in alternatives) + "]"
+
+
+class CompiledSelector:
+    """A CSS selector compiled once; extract() returns the stripped text of every match in document order."""
+
+    def __init__(self, selector):
+        self.selector = selector
+        self.simple = None          # [SimpleSelector, ...] when every group is a simple compound
+        self.xpath = None
+        groups = [group.strip() for group in selector.split(",")]
+        simple = [SimpleSelector.parse(group) for group in groups]
+        if all(simple):
+            self.simple = simple
+            self.xpath = etree.XPath(match_any([part.step() for part in simple]))
+        elif HTMLTranslator:
+            try:
+                translator = RightToLeftTranslator()
+                steps = translator.selector_steps(selector)
+                self.xpath = etree.XPath(match_any(steps) if steps else translator.css_to_xpath(selector))
+            except (SelectorError, etree.XPathError):
+                pass                # Valid for BeautifulSoup's soupsieve, or invalid: the fallback decides
+
+    @property
+    def engine(self):
+        if self.simple:
+            return "lxml (simple)"
+        return "lxml (cssselect)" if self.xpath is not None else "BeautifulSoup"
+
+    def extract(self, html_content, stream=None):
+        """stream=None picks streaming for simple selectors on pages above STREAM_MIN_CHARS."""
+        if not html_content:
+            return []
+        if self.xpath is None:
+            soup = BeautifulSoup(html_content, 'lxml')
+            return [tag.text.strip() for tag in soup.select(self.selector)]
+        if stream is None:
+            stream = self.simple is not None and len(html_content) >= STREAM_MIN_CHARS
+        if stream and self.simple:
+            return self._extract_streaming(html_content)
+        root = _parse_html(html_content)
+        if root is None:
+            return []
+        return [element_text(element) for element in self.xpath(root)]
+
+    def _extract_streaming(self, html_content):
+        parser = etree.HTMLPullParser(events=("start", "end"))
+        results = []
+        open_matches = []           # (result index, element) of matches still being parsed
+        for start in range(0, len(html_content), FEED_CHUNK_CHARS):
+            parser.feed(html_content[start:start + FEED_CHUNK_CHARS])
+            self._collect(parser.read_events(), results, open_matches)
+        parser.close()
+        self._collect(parser.read_events(), results, open_matches)
+        return results
+
+    def _collect(self, events, results, open_matches):
+        for event, element in events:
+            if event == "start":
+                if any(part.matches(element) for part in self.simple):
+                    open_matches.append((len(results), element))
+                    results.append(None)        # Keeps document order for nested matches
+                continue
+            if open_matches and open_matches[-1][1] is element:
+                index, _ = open_matches.pop()
+                results[index] = element_text(element)
+            if not open_matches:
+                # Nothing still needs this subtree: free it and the siblings before it
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+
+def _parse_html(html_content):
+    try:
+        return etree.HTML(html_content)
+    except ValueError:
+        # str input with an XML encoding declaration: let lxml decode the bytes itself
+        return etree.HTML(html_content.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector):
+    """Cached, so a selector used on many pages is compiled only once."""
+    return CompiledSelector(selector)
+
+
+def select_text(html_content, selector):
+    """Stripped text of every element matching the CSS selector, like [tag.text.strip() for tag in soup.select(...)]."""
+    return compile_selector(selector).extract(html_content)
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly).
+    # Every engine must agree with BeautifulSoup on the same page.
+    page = ("<html><head><style>h2 {color: red}</style></head><body>"
+            "<div id='main' class='card news'><h2 class='widget-title'>Top &amp; <b>story</b><!-- note --></h2>"
+            "<p>Intro <a href='/news/1'>first</a><script>track(1)</script> and more.</p></div>"
+            "<ul><li>One</li><li class='x'>Two <span>nested</span></li></ul>"
+            "<template><h2 class='widget-title'>Hidden</h2></template></body></html>")
+    for selector in ["h2.widget-title", "p, h1, h2, h3, li", "#main", "div.card.news", "div.card > p a",
+                     "li:nth-child(2)", "a[href^='/news']", "ul > li + li span", "h2 ~ p", "li:-soup-contains('One')", "script"]:
+        compiled = compile_selector(selector)
+        expected = [tag.text.strip() for tag in BeautifulSoup(page, 'lxml').select(selector)]
+        tree_result = compiled.extract(page, stream=False)
+        stream_result = compiled.extract(page, stream=True)
+        status = "OK" if tree_result == stream_result == expected else "MISMATCH"
+        print(f"{status:<8} {selector:<28} {compiled.engine:<17} {tree_result}")
@@ -1,42 +1,65 @@
 # CODE LOCATION: jarvis-assistant/skills/web_tools.py
 
-import urllib.robotparser
+import os
+import threading
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
 from pathlib import Path
 
+from skills.robots_cache import RobotsCache, HostRateLimiter
+from skills.http_client import get_http_client
+from skills.http_cache import HttpCache
+from skills.selector_engine import compile_selector
+
 # --- Configuration ---
 # The User-Agent is essential for ethical, identifiable scraping
 USER_AGENT = "JarvisAssistantScraper/1.0 (Ethical Scraping)"
 DEFAULT_TIMEOUT = 10
+# robots.txt policies survive restarts here; set JARVIS_ROBOTS_CACHE="" to keep them in memory only
+ROBOTS_CACHE_FILE = os.environ.get("JARVIS_ROBOTS_CACHE", str(Path(__file__).parent.parent / "data" / "robots_cache.json"))
+# Fetched pages are cached here (conditional GET); set JARVIS_HTTP_CACHE="" to disable
+HTTP_CACHE_DIR = os.environ.get("JARVIS_HTTP_CACHE", str(Path(__file__).parent.parent / "data" / "http_cache"))
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
 # ---
 
+RATE_LIMITER = HostRateLimiter()
+
+# The caches touch disk (the HTTP cache evicts old files when it opens), so they are
+# only created on first use: importing this module, e.g. in a worker process, has no side effects.
+_robots_cache = None
+_http_cache = False         # False = not created yet; None = disabled
+_caches_lock = threading.Lock()
+
+
+def get_robots_cache():
+    """The process-wide robots.txt policy cache."""
+    global _robots_cache
+    with _caches_lock:
+        if _robots_cache is None:
+            _robots_cache = RobotsCache(USER_AGENT, cache_file=ROBOTS_CACHE_FILE or None)
+        return _robots_cache
+
+
+def get_http_cache():
+    """The process-wide HTTP cache, or None if JARVIS_HTTP_CACHE="" disabled it."""
+    global _http_cache
+    with _caches_lock:
+        if _http_cache is False:
+            _http_cache = HttpCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES) if HTTP_CACHE_DIR else None
+        return _http_cache
+
+
 def check_robots_txt(url):
     """
     Ø Step 1: The Ethical Gatekeeper.
     Checks if the given URL is allowed for our user agent and returns the crawl delay.
-    Returns: (bool, int) -> (is_allowed, crawl_delay_seconds)
+    robots.txt is fetched once per host and cached (see skills/robots_cache.py).
+    Returns: (bool, float) -> (is_allowed, crawl_delay_seconds)
     """
     try:
-        # Determine the base URL for robots.txt (e.g., https://example.com)
-        parsed_url = urlparse(url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        robots_txt_url = f"{base_url}/robots.txt"
-        
-        parser = urllib.robotparser.RobotFileParser()
-        parser.set_url(robots_txt_url)
-        # Attempt to read the robots.txt file
-        parser.read() 
-        
-        is_allowed = parser.can_fetch(USER_AGENT, url)
-        
-        # NOTE: get_crawl_delay() is not standard/reliable, but we can implement basic logic.
-        # Returning 0 for now, as planned.
-        crawl_delay = 0 
+        is_allowed, crawl_delay = get_robots_cache().check(url)
         
         if not is_allowed:
-            print(f"[WebTool] Scraping denied for {USER_AGENT} by robots.txt policy at {robots_txt_url}")
+            print(f"[WebTool] Scraping denied for {USER_AGENT} by robots.txt policy for {url}")
             return False, 0
         
         return True, crawl_delay
@@ -46,15 +69,39 @@ def check_robots_txt(url):
         # If we can't read robots.txt, we default to allowing but warn the user.
         return True, 0
 
-def fetch_html(url):
+def fetch_html(url, crawl_delay=0):
     """
     Ø Step 2: The Network Retrieval.
     Executes the HTTP GET request to retrieve the raw HTML content.
+    Fresh cached pages skip the network; stale ones are revalidated (a 304 has no body).
+    crawl_delay is only waited out when a request is actually sent.
     """
+    http_cache = get_http_cache()
+    cached = http_cache.lookup(url) if http_cache else None
+    if cached and cached.fresh:
+        html = http_cache.read_text(cached)
+        if html is not None:
+            http_cache.record_hit()
+            print(f"[WebTool] Served {url} from the HTTP cache")
+            return html
+        cached = None
+
     headers = {'User-Agent': USER_AGENT}
+    if cached:
+        headers.update(cached.validators())
     try:
-        # Use a timeout to prevent endless hangs
-        response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        RATE_LIMITER.wait(url, crawl_delay)
+        # Shared keep-alive client (retries, compression); the timeout prevents endless hangs
+        response = get_http_client().get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        if response.status_code == 304 and cached:
+            html = http_cache.read_text(cached)
+            if html is not None:
+                http_cache.record_not_modified(cached, response.headers)
+                print(f"[WebTool] {url} not modified; using the cached copy")
+                return html
+            # The cached body vanished: fetch it again without validators
+            response = get_http_client().get(url, headers={'User-Agent': USER_AGENT}, timeout=DEFAULT_TIMEOUT)
+
         # Raise an exception for bad status codes (4xx or 5xx errors)
         response.raise_for_status() 
         
@@ -63,6 +110,8 @@ def fetch_html(url):
             print(f"[WebTool] Warning: URL returned non-HTML content type: {response.headers.get('Content-Type')}")
             return None
             
+        if http_cache:
+            http_cache.store(url, response)
         return response.text
         
     except requests.RequestException as e:
@@ -81,16 +130,10 @@ def parse_data(html_content, selector):
         return []
         
     try:
-        # Use the 'lxml' parser for speed and robustness
+        # The selector is compiled once and evaluated on lxml's C tree; only selectors
+        # lxml cannot run go through BeautifulSoup (see skills/selector_engine.py).
         # NOTE: Requires 'pip install lxml'
-        soup = BeautifulSoup(html_content, 'lxml')
-        
-        # Use the provided CSS selector to find all matching elements
-        tag_results = soup.select(selector)
-        
-        # *** TWEAK: Extract clean text content from the tags ***
-        # This transforms the messy BeautifulSoup object list into a clean string list.
-        text_results = [tag.text.strip() for tag in tag_results]
+        text_results = compile_selector(selector).extract(html_content)
         
         print(f"[WebTool] Extracted {len(text_results)} elements using selector: '{selector}'")
         return text_results
@@ -108,12 +151,12 @@ def scrape_url_for_selector(url, selector):
              (denied by robots.txt, fetch error, or no content).
     """
     # 1. Ethical Check
-    is_allowed, _ = check_robots_txt(url)
+    is_allowed, crawl_delay = check_robots_txt(url)
     if not is_allowed:
         return None 
         
-    # 2. Fetch HTML
-    html_content = fetch_html(url)
+    # 2. Fetch HTML (politeness: the site's Crawl-delay applies to real requests only)
+    html_content = fetch_html(url, crawl_delay)
     if not html_content:
         return None
         
@@ -135,4 +178,6 @@ if __name__ == '__main__':
         for i, el in enumerate(elements[:5]):
             print(f"{i+1}. Content: {el}")
     else:
-        print("--- Scraping Test Failed ---")
\ No newline at end of file
+        print("--- Scraping Test Failed ---")
+    if get_http_cache():
+        print(f"HTTP cache: {get_http_cache().stats()}")
\ No newline at end of file
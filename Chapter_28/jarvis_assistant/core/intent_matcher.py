@@ -0,0 +1,144 @@
+# CODE LOCATION: jarvis-assistant/core/intent_matcher.py
+
+from collections import deque
+
+# --- The Compiled Trigger Matcher (Aho-Corasick Automaton) ---
+# Built ONCE from the SKILL_MAP at startup. A single left-to-right pass over the
+# command finds every trigger phrase, no matter how many triggers are registered.
+
+
+class IntentMatcher:
+    """
+    Multi-pattern matcher over all SKILL_MAP trigger phrases.
+
+    Matching keeps the old substring semantics ('keyword in command'), but the
+    winner no longer depends on dict order: the LONGEST trigger found wins,
+    and ties fall back to the order in which triggers were registered.
+    """
+
+    def __init__(self, skill_map=None):
+        # State 0 is the root. Each state has: goto table, failure link, best output.
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]       # All trigger indexes ending at this state (via fail chain)
+        self._best = [None]    # Single most specific trigger index ending here
+        self._triggers = []    # index -> (keyword, handler)
+        self._compiled = False
+
+        if skill_map:
+            for keyword, handler in skill_map.items():
+                self.add(keyword, handler)
+            self.compile()
+
+    def __len__(self):
+        return len(self._triggers)
+
+    def add(self, keyword, handler):
+        """Registers one trigger phrase. Call compile() after the last add()."""
+        keyword = keyword.lower()
+        if not keyword:
+            raise ValueError("Trigger keyword cannot be empty.")
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._best.append(None)
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._out[state].append(len(self._triggers))
+        self._triggers.append((keyword, handler))
+        self._compiled = False
+
+    def _rank(self, index):
+        """Sort key for 'most specific': longer first, then earlier registration."""
+        return (len(self._triggers[index][0]), -index)
+
+    def compile(self):
+        """Builds failure links breadth-first and pre-computes the best output per state."""
+        queue = deque()
+        for char, state in self._goto[0].items():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+        for state, outputs in enumerate(self._out):
+            self._best[state] = max(outputs, key=self._rank) if outputs else None
+
+        self._compiled = True
+        return self
+
+    def _scan(self, text):
+        """Yields (end_position, state) for every state that has at least one output."""
+        if not self._compiled:
+            self.compile()
+
+        goto, fail, best = self._goto, self._fail, self._best
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if best[state] is not None:
+                yield position, state
+
+    def find_all(self, text):
+        """
+        Returns every trigger found in the text as (start, keyword, handler),
+        in the order they appear.
+        """
+        matches = []
+        for end, state in self._scan(text.lower()):
+            for index in self._out[state]:
+                keyword, handler = self._triggers[index]
+                matches.append((end - len(keyword) + 1, keyword, handler))
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+    def match(self, text):
+        """
+        Returns (keyword, handler) for the most specific trigger in the text,
+        or None if no trigger is present.
+        """
+        winner = None
+        for _, state in self._scan(text.lower()):
+            candidate = self._best[state]
+            if winner is None or self._rank(candidate) > self._rank(winner):
+                winner = candidate
+
+        if winner is None:
+            return None
+        return self._triggers[winner]
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    def handle_calendar_open(command): pass
+    def handle_view_schedule(command): pass
+
+    test_map = {
+        "schedule": handle_calendar_open,
+        "calendar": handle_calendar_open,
+        "view schedule": handle_view_schedule,
+        "show schedule": handle_view_schedule,
+    }
+    matcher = IntentMatcher(test_map)
+
+    for test_command in ["please view schedule for today", "open the calendar", "schedule a meeting", "hello"]:
+        result = matcher.match(test_command)
+        print(f"'{test_command}' -> {result[0] if result else None}")
@@ -0,0 +1,326 @@
+# CODE LOCATION: jarvis-assistant/core/speech_cache.py
+
+import hashlib
+import math
+import os
+import struct
+import threading
+import time
+import wave
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import simpleaudio
+except ImportError:
+    print("Warning: simpleaudio not installed. Install with 'pip install simpleaudio' to replay cached speech.")
+    simpleaudio = None
+
+# --- The Rendered-Speech Cache ---
+# "At your service. How may I help?" sounds the same every time, so it is
+# rendered ONCE to a WAV file and replayed straight to the audio device.
+# Entries are content-addressed by (text, voice, rate): changing the voice or
+# the speaking rate simply produces new keys. Hot clips stay in an in-memory
+# LRU of raw PCM buffers; everything else is one small WAV read away.
+# Some speech drivers ignore the file extension (macOS 'nsss' always writes
+# AIFF), so every render is checked and converted to WAV before it is stored.
+# A driver whose output cannot be converted disables the cache, loudly.
+
+DEFAULT_MEMORY_BYTES = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class PcmClip:
+    """Raw PCM audio plus the format needed to play it."""
+    pcm: bytes
+    channels: int
+    sample_width: int
+    sample_rate: int
+
+    @property
+    def duration(self):
+        return len(self.pcm) / (self.channels * self.sample_width * self.sample_rate)
+
+
+class UnsupportedAudioFormat(ValueError):
+    """The speech driver wrote a file the cache cannot convert to WAV."""
+
+
+def load_wav(path):
+    with wave.open(str(path), "rb") as wav:
+        return PcmClip(
+            pcm=wav.readframes(wav.getnframes()),
+            channels=wav.getnchannels(),
+            sample_width=wav.getsampwidth(),
+            sample_rate=wav.getframerate(),
+        )
+
+
+def _aiff_sample_rate(extended):
+    """80-bit IEEE 754 extended float (AIFF's COMM sample rate) -> int."""
+    exponent, mantissa = struct.unpack(">HQ", extended)
+    if exponent == 0 and mantissa == 0:
+        return 0
+    return round(mantissa * math.pow(2, (exponent & 0x7FFF) - 16383 - 63))
+
+
+def load_aiff(path):
+    """Uncompressed AIFF / AIFF-C ('NONE' or 'sowt') -> PcmClip in WAV byte order."""
+    data = Path(path).read_bytes()
+    kind = data[8:12]
+    position, comm, sound = 12, None, None
+    while position + 8 <= len(data):
+        chunk_id, size = struct.unpack(">4sI", data[position:position + 8])
+        body = data[position + 8:position + 8 + size]
+        if chunk_id == b"COMM":
+            comm = body
+        elif chunk_id == b"SSND":
+            offset = struct.unpack(">I", body[:4])[0]
+            sound = body[8 + offset:]
+        position += 8 + size + (size & 1)           # Chunks are padded to an even length
+    if comm is None or sound is None:
+        raise UnsupportedAudioFormat(f"{Path(path).name}: AIFF file without COMM/SSND chunks")
+
+    channels, frames, bits = struct.unpack(">hIh", comm[:8])
+    sample_rate = _aiff_sample_rate(comm[8:18])
+    compression = comm[18:22] if kind == b"AIFC" else b"NONE"
+    if compression not in (b"NONE", b"sowt"):
+        raise UnsupportedAudioFormat(f"{Path(path).name}: compressed AIFF-C ({compression.decode(errors='replace')})")
+    width = (bits + 7) // 8
+    pcm = sound[:frames * channels * width]
+
+    big_endian = compression == b"NONE"
+    if width == 1:
+        pcm = bytes((sample + 128) & 0xFF for sample in pcm)     # Signed (AIFF) -> unsigned (WAV) 8-bit
+    elif width in (2, 4) and big_endian:      # WAV is little-endian on every platform
+        samples = array("h" if width == 2 else "i", pcm)
+        samples.byteswap()
+        pcm = samples.tobytes()
+    elif width == 3 and big_endian:
+        swapped = bytearray(pcm)
+        swapped[0::3], swapped[2::3] = pcm[2::3], pcm[0::3]
+        pcm = bytes(swapped)
+    return PcmClip(pcm=pcm, channels=channels, sample_width=width, sample_rate=sample_rate)
+
+
+def audio_format(path):
+    """"wav" or "aiff" from the file's header, whatever its extension says."""
+    with open(path, "rb") as f:
+        header = f.read(12)
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"FORM" and header[8:12] in (b"AIFF", b"AIFC"):
+        return "aiff"
+    raise UnsupportedAudioFormat(f"{Path(path).name}: not WAV or AIFF (starts with {header!r})")
+
+
+def save_wav(clip, path):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(clip.channels)
+        wav.setsampwidth(clip.sample_width)
+        wav.setframerate(clip.sample_rate)
+        wav.writeframes(clip.pcm)
+
+
+def play_clip(clip, is_cancelled=None):
+    """Plays a clip on the default audio device. Returns False if it was cancelled."""
+    play = simpleaudio.play_buffer(clip.pcm, clip.channels, clip.sample_width, clip.sample_rate)
+    while play.is_playing():
+        if is_cancelled and is_cancelled():
+            play.stop()
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class SpeechCache:
+    """
+    (text, voice, rate) -> PcmClip. get() is safe from any thread; rendering
+    happens on the TTS worker thread through render_pending().
+    """
+
+    def __init__(self, cache_dir, voice="default", rate=None, max_memory_bytes=DEFAULT_MEMORY_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.voice = voice
+        self.rate = rate
+        self.max_memory_bytes = max_memory_bytes
+        self.memory = OrderedDict()      # key -> PcmClip, least recently used first
+        self.memory_bytes = 0
+        self.pending = []                # phrases waiting to be pre-rendered
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disabled = None             # Why the cache was turned off, if it was
+        self._lock = threading.Lock()
+
+    @property
+    def can_play(self):
+        return simpleaudio is not None
+
+    def key(self, text):
+        normalized = " ".join(text.split())
+        return hashlib.sha1(f"{self.voice}\0{self.rate}\0{normalized}".encode("utf-8")).hexdigest()
+
+    def path_for(self, text):
+        return self.cache_dir / f"{self.key(text)}.wav"
+
+    # --- Lookups ---
+
+    def _remember(self, key, clip):
+        self.memory[key] = clip
+        self.memory_bytes += len(clip.pcm)
+        while self.memory_bytes > self.max_memory_bytes and len(self.memory) > 1:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted.pcm)
+
+    def get(self, text):
+        """Returns the cached PcmClip for text, or None on a miss."""
+        if self.disabled:
+            return None
+        key = self.key(text)
+        with self._lock:
+            clip = self.memory.get(key)
+            if clip is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return clip
+
+        path = self.cache_dir / f"{key}.wav"
+        if not path.exists():
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            clip = load_wav(path)
+        except (wave.Error, EOFError, OSError) as e:
+            print(f"[Speech Cache] Dropping unreadable entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            self.queue_prerender([text])     # Rendered again (and converted) when the worker is idle
+            return None
+
+        with self._lock:
+            self._remember(key, clip)
+            self.hits += 1
+            self.disk_hits += 1
+        return clip
+
+    # --- Pre-rendering ---
+
+    def queue_prerender(self, phrases):
+        """Any thread: asks the TTS worker to render these phrases when it is idle."""
+        with self._lock:
+            for phrase in phrases:
+                if phrase not in self.pending and not self.path_for(phrase).exists():
+                    self.pending.append(phrase)
+
+    def has_pending(self):
+        return bool(self.pending) and not self.disabled
+
+    def disable(self, reason):
+        with self._lock:
+            self.disabled = reason
+            self.pending.clear()
+        print(f"[Speech Cache] Disabled, every phrase will be synthesized live: {reason}")
+
+    def render_pending(self, render_to_file, max_items=None):
+        """
+        TTS worker thread only: renders queued phrases with render_to_file(text, path).
+        Each WAV is written to a temporary name first, so a crash never leaves a half file.
+        Output in another format (AIFF) is converted to WAV first.
+        """
+        rendered = 0
+        while self.has_pending() and (max_items is None or rendered < max_items):
+            with self._lock:
+                phrase = self.pending.pop(0)
+            path = self.path_for(phrase)
+            if path.exists():
+                continue
+
+            temp_path = path.with_suffix(".tmp.wav")
+            start = time.perf_counter()
+            try:
+                render_to_file(phrase, temp_path)
+                if audio_format(temp_path) == "aiff":
+                    save_wav(load_aiff(temp_path), temp_path)
+                load_wav(temp_path)            # Validates the file before it becomes visible
+                os.replace(temp_path, path)
+                rendered += 1
+                print(f"[Speech Cache] Rendered '{phrase[:40]}' in {(time.perf_counter() - start) * 1000:.0f} ms")
+            except UnsupportedAudioFormat as e:
+                temp_path.unlink(missing_ok=True)
+                self.disable(f"the speech driver's output cannot be converted to WAV ({e})")
+            except Exception as e:
+                print(f"[Speech Cache] Could not render '{phrase[:40]}': {e}")
+                temp_path.unlink(missing_ok=True)
+        return rendered
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_clips": len(self.memory),
+                "memory_bytes": self.memory_bytes,
+                "pending": len(self.pending),
+            }
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    import tempfile
+
+    def render_tone(text, path):
+        """Stand-in renderer: one 440 Hz beep per word."""
+        rate = 16000
+        samples = [int(8000 * math.sin(2 * math.pi * 440 * i / rate)) for i in range(rate // 10)]
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(struct.pack(f"<{len(samples)}h", *samples) * len(text.split()))
+
+    def render_aiff_tone(text, path):
+        """Stand-in for macOS 'nsss': AIFF (big-endian) whatever the extension says."""
+        render_tone(text, path)
+        clip = load_wav(path)
+        samples = array("h", clip.pcm)
+        samples.byteswap()
+        frames = len(clip.pcm) // 2
+        exponent = clip.sample_rate.bit_length() - 1
+        rate = struct.pack(">HQ", 16383 + exponent, clip.sample_rate << (63 - exponent))   # 80-bit float
+        comm = struct.pack(">hIh", 1, frames, 16) + rate
+        ssnd = struct.pack(">II", 0, 0) + samples.tobytes()
+        body = b"AIFF" + struct.pack(">4sI", b"COMM", len(comm)) + comm + struct.pack(">4sI", b"SSND", len(ssnd)) + ssnd
+        Path(path).write_bytes(b"FORM" + struct.pack(">I", len(body)) + body)
+
+    def render_mp3(text, path):
+        Path(path).write_bytes(b"ID3\x04" + bytes(64))
+
+    with tempfile.TemporaryDirectory() as folder:
+        cache = SpeechCache(folder, voice="test-voice", rate=180)
+        cache.queue_prerender(["At your service. How may I help?", "I am sorry, I did not recognize that command."])
+        cache.render_pending(render_tone)
+
+        for attempt in range(2):
+            start = time.perf_counter()
+            clip = cache.get("At your service.  How may I help?")
+            print(f"Lookup {attempt + 1}: {clip.duration:.2f} s clip in {(time.perf_counter() - start) * 1_000_000:.0f} us")
+        print(f"Miss: {cache.get('Something new entirely.')}")
+        print(cache.stats())
+
+        aiff_cache = SpeechCache(Path(folder) / "aiff", voice="test-voice", rate=180)
+        aiff_cache.queue_prerender(["At your service. How may I help?"])
+        aiff_cache.render_pending(render_aiff_tone)
+        converted = aiff_cache.get("At your service. How may I help?")
+        print(f"AIFF driver: {'same audio as the WAV render' if converted == clip else 'MISMATCH'}")
+
+        mp3_cache = SpeechCache(Path(folder) / "mp3", voice="test-voice", rate=180)
+        mp3_cache.queue_prerender(["At your service. How may I help?"])
+        mp3_cache.render_pending(render_mp3)
+        print(f"Unsupported driver: disabled={mp3_cache.disabled is not None}, pending={mp3_cache.has_pending()}")
@@ -0,0 +1,229 @@
+# CODE LOCATION: jarvis-assistant/core/speech_scheduler.py
+
+import threading
+import time
+from collections import deque
+from queue import Empty
+
+# --- The Priority Speech Scheduler ---
+# Replaces the plain FIFO speech Queue. Three levels:
+#   URGENT  - schedule reminders: jump the line and interrupt lower-priority speech
+#   NORMAL  - answers and skill results: always spoken, in order
+#   CHATTER - progress messages: merged with a neighbouring chatter message,
+#             or dropped when the queue is already deep
+# A NORMAL item that gets interrupted is put back at the front of its level and
+# spoken again after the urgent one. An interrupted CHATTER item is simply dropped.
+
+URGENT, NORMAL, CHATTER = 0, 1, 2
+LEVEL_NAMES = {URGENT: "urgent", NORMAL: "normal", CHATTER: "chatter"}
+
+MAX_DEPTH = 6                    # Queued items before chatter is shed
+MAX_COALESCED_CHARS = 240
+
+
+class SpeechItem:
+    """One queued utterance. 'preempted' is set when an urgent item wants the speaker."""
+
+    def __init__(self, text, priority):
+        self.text = text
+        self.priority = priority
+        self.enqueued_at = time.perf_counter()
+        self.parts = 1
+        self.requeues = 0
+        self.preempted = threading.Event()
+
+    @property
+    def level(self):
+        return LEVEL_NAMES[self.priority]
+
+
+class SpeechScheduler:
+    """
+    Thread-safe, Queue-like scheduler for the TTS worker:
+    put(text, priority) from anywhere, get() / done(item) in the worker, join() to wait for silence.
+    """
+
+    def __init__(self, max_depth=MAX_DEPTH, max_coalesced_chars=MAX_COALESCED_CHARS, metrics=None):
+        self.max_depth = max_depth
+        self.max_coalesced_chars = max_coalesced_chars
+        self.metrics = metrics               # Optional PipelineMetrics for wait times
+        self.current = None                  # The item being spoken right now
+        self.counters = {"queued": 0, "coalesced": 0, "dropped": 0, "preempted": 0, "max_depth": 0}
+        self._levels = {priority: deque() for priority in LEVEL_NAMES}
+        self._last_queued = None             # Coalescing only merges with the newest queued item
+        self._depth_total = 0
+        self._unfinished = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _depth(self):
+        return sum(len(items) for items in self._levels.values())
+
+    def qsize(self):
+        with self._cond:
+            return self._depth()
+
+    def empty(self):
+        return self.qsize() == 0
+
+    # --- Producers ---
+
+    def put(self, text, priority=NORMAL):
+        """Queues text. Returns the SpeechItem it ended up in, or None if it was dropped."""
+        with self._cond:
+            depth = self._depth()
+
+            if priority == CHATTER:
+                last = self._last_queued
+                if (last is not None and last.priority == CHATTER
+                        and len(last.text) + 1 + len(text) <= self.max_coalesced_chars):
+                    last.text = f"{last.text} {text}"
+                    last.parts += 1
+                    self.counters["coalesced"] += 1
+                    return last
+                if depth >= self.max_depth:
+                    self.counters["dropped"] += 1
+                    print(f"[Speech Scheduler] Queue is deep ({depth}), dropped chatter: {text[:40]}")
+                    return None
+
+            item = SpeechItem(text, priority)
+            self._levels[priority].append(item)
+            self._last_queued = item
+            self._unfinished += 1
+            self.counters["queued"] += 1
+            if depth + 1 > self.max_depth:
+                self._shed_chatter()
+
+            depth = self._depth()
+            self._depth_total += depth
+            self.counters["max_depth"] = max(self.counters["max_depth"], depth)
+
+            current = self.current
+            if priority == URGENT and current is not None and current.priority > URGENT:
+                current.preempted.set()
+                self.counters["preempted"] += 1
+                print(f"[Speech Scheduler] Urgent speech is interrupting: {current.text[:40]}")
+
+            self._cond.notify()
+            return item
+
+    def _shed_chatter(self):
+        """Drops the oldest queued chatter until the queue is back within max_depth."""
+        chatter = self._levels[CHATTER]
+        while chatter and self._depth() > self.max_depth:
+            dropped = chatter.popleft()
+            if dropped is self._last_queued:
+                self._last_queued = None
+            self._unfinished -= 1
+            self.counters["dropped"] += 1
+            print(f"[Speech Scheduler] Queue is deep, dropped chatter: {dropped.text[:40]}")
+        if self._unfinished == 0:
+            self._cond.notify_all()
+
+    def close(self):
+        """The worker's get() returns None once everything queued has been spoken."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # --- The TTS worker ---
+
+    def get(self, timeout=None):
+        """Highest priority first, FIFO within a level. Raises queue.Empty on timeout."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._cond:
+            while self._depth() == 0:
+                if self._closed:
+                    return None
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    raise Empty
+                self._cond.wait(remaining)
+
+            for priority in sorted(self._levels):
+                if self._levels[priority]:
+                    item = self._levels[priority].popleft()
+                    break
+            if item is self._last_queued:
+                self._last_queued = None
+            self.current = item
+
+        if self.metrics:
+            self.metrics.record(f"speech.wait.{item.level}", time.perf_counter() - item.enqueued_at)
+        return item
+
+    def done(self, item, completed=True):
+        """
+        Called by the worker after speaking an item. An interrupted NORMAL item is
+        re-queued once at the front of its level; everything else is finished.
+        """
+        with self._cond:
+            self.current = None
+            if not completed and item.preempted.is_set() and item.priority == NORMAL and item.requeues < 1:
+                item.preempted.clear()
+                item.requeues += 1
+                self._levels[NORMAL].appendleft(item)
+                self._cond.notify()
+                return
+
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._cond.notify_all()
+
+    def join(self):
+        """Blocks until every queued item has been spoken (or dropped)."""
+        with self._cond:
+            while self._unfinished:
+                self._cond.wait()
+
+    # --- Metrics ---
+
+    def stats(self):
+        with self._cond:
+            queued = self.counters["queued"]
+            return {
+                "depth": self._depth(),
+                "depth_by_level": {LEVEL_NAMES[p]: len(items) for p, items in self._levels.items()},
+                "mean_depth_at_enqueue": self._depth_total / queued if queued else 0.0,
+                **self.counters,
+            }
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    from metrics import PipelineMetrics
+
+    metrics = PipelineMetrics()
+    scheduler = SpeechScheduler(max_depth=3, metrics=metrics)
+    spoken = []
+
+    def worker():
+        while True:
+            item = scheduler.get()
+            if item is None:
+                break
+            start = time.perf_counter()
+            while time.perf_counter() - start < 0.05 * len(item.text.split()):
+                if item.preempted.is_set():
+                    break
+                time.sleep(0.005)
+            completed = not item.preempted.is_set()
+            spoken.append((item.level, item.text, "done" if completed else "interrupted"))
+            scheduler.done(item, completed)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+
+    scheduler.put("Here is a long skill result that takes a while to read out loud to you.")
+    time.sleep(0.1)
+    scheduler.put("Reminder: Your appointment for standup starts in 1 minute at 09:30.", URGENT)
+    for message in ["Found a URL on the clipboard.", "Starting the download.", "Still working."]:
+        scheduler.put(message, CHATTER)
+    scheduler.join()
+    scheduler.close()
+    thread.join()
+
+    for line in spoken:
+        print(line)
+    print(scheduler.stats())
+    metrics.print_report()
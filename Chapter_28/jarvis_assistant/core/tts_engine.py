@@ -0,0 +1,181 @@
+# CODE LOCATION: jarvis-assistant/core/tts_engine.py
+
+import threading
+import time
+import traceback
+
+# --- The Persistent Speech Engine (macOS/Linux, pyttsx3) ---
+# ONE engine lives for the whole session, owned by the TTS worker thread.
+# It is a private pyttsx3.Engine, not the engine pyttsx3.init() caches and
+# hands to every caller asking for the same driver.
+# Instead of init -> say -> sleep(0.5) -> destroy for every sentence, we drive
+# pyttsx3's external loop and wait for its 'finished-utterance' event.
+# The engine is only rebuilt after a driver error.
+
+WORDS_PER_MINUTE_FLOOR = 80       # Used for the safety timeout only
+TIMEOUT_PADDING_SECONDS = 3.0
+
+
+class PersistentSpeechEngine:
+    """
+    Long-lived pyttsx3 engine, built by and used from ONE thread (the TTS worker).
+    rate=None keeps the driver's default rate and records it once the engine is built.
+    """
+
+    def __init__(self, driver_name, rate=None):
+        self.driver_name = driver_name
+        self.rate = rate
+        self.engine = None
+        self.builds = 0
+        self.last_started_at = None
+        self.last_finished_at = None
+        self._started_count = 0
+        self._finished_count = 0
+        self._on_chunk_started = None
+        self._progress = threading.Event()
+
+    # --- Engine lifecycle ---
+
+    def start(self):
+        """Builds the engine now instead of on the first sentence. Raises if the driver cannot start."""
+        if self.engine is None:
+            self._build()
+
+    def _build(self):
+        import pyttsx3
+
+        start = time.perf_counter()
+        # pyttsx3.init() returns the engine it cached for this driver, shared with
+        # any other caller (and never replaced after a failure); build our own.
+        engine = pyttsx3.Engine(self.driver_name)
+        if self.rate:
+            engine.setProperty('rate', self.rate)
+        else:
+            self.rate = engine.getProperty('rate')  # Part of the speech cache key
+        engine.connect('started-utterance', self._on_started)
+        engine.connect('finished-utterance', self._on_finished)
+        engine.startLoop(False)  # External loop: we pump it with iterate()
+        self.engine = engine
+        self.builds += 1
+        print(f"[TTS Engine] Built '{self.driver_name}' engine #{self.builds} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def _teardown(self):
+        if self.engine:
+            try:
+                self.engine.endLoop()
+            except Exception:
+                pass
+        self.engine = None
+
+    def shutdown(self):
+        self._teardown()
+
+    # --- Completion events (fired inside engine.iterate(), i.e. on the worker thread) ---
+
+    def _on_started(self, name):
+        self.last_started_at = time.perf_counter()
+        self._started_count += 1
+        if self._on_chunk_started:
+            self._on_chunk_started(self._started_count - 1)
+        self._progress.set()
+
+    def _on_finished(self, name, completed):
+        self.last_finished_at = time.perf_counter()
+        self._finished_count += 1
+        self._progress.set()
+
+    def _max_duration(self, text):
+        words = max(len(text.split()), 1)
+        return words / WORDS_PER_MINUTE_FLOOR * 60 + TIMEOUT_PADDING_SECONDS
+
+    # --- Speaking ---
+
+    def speak(self, text):
+        """Speaks text and returns once the driver reports the utterance finished."""
+        return self.speak_chunks([text])
+
+    def render_to_file(self, text, path):
+        """Synthesizes text into a file instead of the speakers (used by the speech cache; AIFF on macOS)."""
+        if not self._run([text], submit=lambda chunk: self.engine.save_to_file(chunk, str(path))):
+            raise RuntimeError("the speech driver failed or timed out while rendering")
+
+    def voice_id(self):
+        """The active voice, part of the speech cache key."""
+        if self.engine is None:
+            self._build()
+        return self.engine.getProperty('voice')
+
+    def speak_chunks(self, chunks, is_cancelled=None, on_chunk_started=None):
+        """
+        Speaks chunks back to back: all of them are queued on the driver up front,
+        so the next one starts without a round trip through this loop. pyttsx3
+        synthesizes serially, so nothing is rendered ahead of the chunk playing.
+        is_cancelled() is polled every few milliseconds; when it turns True the
+        current utterance is stopped and the queued rest is dropped.
+        """
+        return self._run(chunks, None, is_cancelled, on_chunk_started)
+
+    def _run(self, chunks, submit=None, is_cancelled=None, on_chunk_started=None):
+        """
+        Pumps the external loop until every chunk finished. Returns False if it was
+        cancelled, timed out or the driver failed, i.e. the text was NOT fully spoken.
+        """
+        if not chunks:
+            return True
+        try:
+            if self.engine is None:
+                self._build()
+            submit = submit or self.engine.say
+
+            self._started_count = 0
+            self._finished_count = 0
+            self._on_chunk_started = on_chunk_started
+            for chunk in chunks:
+                submit(chunk)
+            progress = None
+            deadline = 0.0
+
+            while self._finished_count < len(chunks):
+                if is_cancelled and is_cancelled():
+                    print("[TTS Engine] Speech cancelled.")
+                    self.engine.stop()      # Also clears the chunks still queued on the driver
+                    return False
+
+                self._progress.clear()
+                self.engine.iterate()
+
+                now = time.perf_counter()
+                if (self._started_count, self._finished_count) != progress:
+                    progress = (self._started_count, self._finished_count)
+                    current = chunks[min(self._finished_count, len(chunks) - 1)]
+                    deadline = now + self._max_duration(current)
+                elif now > deadline:
+                    print("[TTS Engine] Timed out waiting for the utterance to finish. Stopping it.")
+                    self.engine.stop()
+                    return False        # Truncated: must not be cached or reported as spoken
+                self._progress.wait(0.01)
+            return True
+
+        except Exception as e:
+            # Driver error: drop this engine, the next sentence builds a fresh one.
+            print(f"[TTS Engine Error]: {e}")
+            traceback.print_exc()
+            self._teardown()
+            return False
+
+        finally:
+            self._on_chunk_started = None
+
+
+if __name__ == "__main__":
+    # Simple test case (will only run if this file is executed directly)
+    import platform
+
+    driver = 'nsss' if platform.system() == "Darwin" else ('sapi5' if platform.system() == "Windows" else 'espeak')
+    speaker = PersistentSpeechEngine(driver)
+    for sentence in ["At your service.", "This is the second sentence on the same engine."]:
+        queued = time.perf_counter()
+        speaker.speak(sentence)
+        if speaker.last_started_at:
+            print(f"First audio after {(speaker.last_started_at - queued) * 1000:.0f} ms")
+    speaker.shutdown()
@@ -0,0 +1,133 @@
+# CODE LOCATION: jarvis-assistant/core/wake_word.py
+
+import time
+
+import pvporcupine
+from pvrecorder import PvRecorder
+
+from core.audio_capture import AudioCapture, PcmRingBuffer, RingBufferSource, frame_rms
+from core.noise_floor import NoiseFloorEstimator
+
+# --- The Persistent Wake Word Service ---
+# ONE Porcupine detector and ONE PvRecorder for the whole session.
+# Old cycle: create Porcupine -> open the recorder -> detect -> delete both.
+# New cycle: resume -> detect -> pause (while the command is heard) -> resume.
+# Model loading and audio device setup are paid once.
+#
+# The recorder feeds a shared ring buffer (core.audio_capture) that never
+# stops, so the command recognizer reads the SAME stream, starting from a
+# pre-roll just before the wake word ended.
+
+RING_SECONDS = 10.0          # Audio history kept in the ring buffer
+PREROLL_SECONDS = 0.5        # How far before the detection point the recognizer starts
+ONE_BREATH_WINDOW = 0.4      # Speech right after the wake word means "Jarvis, read pdf" in one go
+
+
+class WakeWordService:
+    """Owns the wake word detector and the shared audio stream. Use it from one thread (the main loop)."""
+
+    def __init__(self, access_key, keyword, device_index=-1, detector_factory=None, recorder_factory=None):
+        self.access_key = access_key
+        self.keyword = keyword
+        self.device_index = device_index
+        self.detector_factory = detector_factory or pvporcupine.create
+        self.recorder_factory = recorder_factory or PvRecorder
+        self.porcupine = None
+        self.recorder = None
+        self.ring = None
+        self.capture = None
+        self.noise_floor = None
+        self.listening = False
+        self.detections = 0
+        self.detection_seq = None    # Ring position right after the wake word
+        self.init_seconds = None
+        self.last_rearm_seconds = None
+        self._rearm_started = None
+
+    def start(self):
+        """Loads the model and starts the capture thread (once). Raises on failure."""
+        if self.porcupine is not None:
+            return
+        start = time.perf_counter()
+        self.porcupine = self.detector_factory(access_key=self.access_key, keywords=[self.keyword])
+        try:
+            frame_length = self.porcupine.frame_length
+            sample_rate = self.porcupine.sample_rate
+            self.recorder = self.recorder_factory(frame_length=frame_length, device_index=self.device_index)
+            self.ring = PcmRingBuffer(int(RING_SECONDS * sample_rate / frame_length), frame_length, sample_rate)
+            self.noise_floor = NoiseFloorEstimator(self.ring.frame_seconds)
+            self.capture = AudioCapture(self.recorder, self.ring, self.noise_floor)
+            self.capture.start()
+        except Exception:
+            self.close()
+            raise
+        self.listening = True
+        self.init_seconds = time.perf_counter() - start
+        print(f"[Wake Word] Detector and audio stream ready in {self.init_seconds * 1000:.0f} ms")
+
+    def pause(self):
+        """Stops wake word detection during active listening. Capture keeps running for the recognizer."""
+        self.listening = False
+
+    def resume(self):
+        if not self.listening:
+            self._rearm_started = time.perf_counter()
+            self.listening = True
+
+    def wait_for_wake_word(self):
+        """Blocks until the wake word is heard. Returns the keyword index."""
+        self.start()
+        self.resume()
+        reader = self.ring.reader()       # Only fresh audio: never re-detect an old "Jarvis"
+        while True:
+            pcm = reader.read()
+            if pcm is None:
+                raise RuntimeError("audio capture stopped")
+            keyword_index = self.porcupine.process(pcm)
+            if self._rearm_started is not None:
+                # Re-arm latency: resume() until the detector has processed live audio again
+                self.last_rearm_seconds = time.perf_counter() - self._rearm_started
+                self._rearm_started = None
+            if keyword_index >= 0:
+                self.detections += 1
+                self.detection_seq = reader.position
+                return keyword_index
+
+    # --- The command recognizer's side of the shared stream ---
+
+    def speech_follows_wake_word(self, energy_threshold, window=ONE_BREATH_WINDOW):
+        """True if the user kept talking right after the wake word (waits up to 'window' seconds)."""
+        reader = self.ring.reader(self.detection_seq)
+        frames = self.ring.frames_for(window)
+        loud = 0
+        for _ in range(frames):
+            frame = reader.read(timeout=window)
+            if frame is None:
+                break
+            if frame_rms(frame) > energy_threshold:
+                loud += 1
+        return loud >= frames / 3
+
+    def command_source(self, preroll=True):
+        """
+        An sr.AudioSource on the shared stream. With preroll it starts just before
+        the wake word ended; otherwise at the newest audio (e.g. after Jarvis spoke).
+        """
+        if preroll and self.detection_seq is not None:
+            return RingBufferSource(self.ring, self.detection_seq - self.ring.frames_for(PREROLL_SECONDS))
+        return RingBufferSource(self.ring)
+
+    def close(self):
+        if self.capture:
+            self.capture.stop()
+        if self.recorder:
+            try:
+                self.recorder.delete()
+            except Exception as e:
+                print(f"Warning: Could not delete recorder object. {e}")
+        if self.porcupine:
+            self.porcupine.delete()
+        self.capture = None
+        self.recorder = None
+        self.porcupine = None
+        self.listening = False
@@ -1,13 +1,12 @@
 import os
-import pvporcupine
-from pvrecorder import PvRecorder
 import threading 
 import speech_recognition as sr
 import platform 
 from pathlib import Path
-from queue import Queue
+from queue import Empty
 import time
 import traceback
+import atexit
 import re 
 
 try:
@@ -19,8 +18,17 @@ except ImportError:
 # --- CALENDAR SKILL IMPORT ---
 from skills.calendar_tool import JarvisScheduler, ScheduleGUI, ListViewerGUI, ScheduleMonitor
 
+# --- CORE SERVICES ---
+from core.intent_matcher import IntentMatcher
+from core.tts_engine import PersistentSpeechEngine
+from core.speech_cache import SpeechCache, play_clip
+from core.wake_word import WakeWordService
+from core.vad import capture_utterance
+from core.speech_scheduler import SpeechScheduler, URGENT, NORMAL, CHATTER
+from core.metrics import PipelineMetrics
+
 # --- GLOBAL HARDWARE OBJECTS ---
-global_recorder = None
+global_wake_service = None  # One Porcupine detector + PvRecorder for the whole session
 global_recognizer = None
 schedule_monitor = None  # Global monitor instance
 
@@ -34,17 +42,36 @@ if SYSTEM_OS == "Windows":
         print("FATAL ERROR: win32com.client not found. Install with 'pip install pywin32'")
         exit()
     tts_engine_win = None
-    speech_queue = Queue()
+    WIN32_SPEAK_TIMEOUT_MS = 30000  # Upper bound for SAPI's WaitUntilDone
 else:
-    import pyttsx3
     print(f"TTS Backend: pyttsx3 ({SYSTEM_OS})")
-    tts_engine = None
-    speech_queue = Queue()
+
+tts_ready = threading.Event()  # Set by the TTS worker once it can speak
+
+# --- PRIORITY SPEECH SCHEDULER ---
+# Reminders are URGENT (they interrupt a long answer), progress and filler lines
+# are CHATTER (merged or dropped under load). Everything else is NORMAL,
+# including every skill result: the answer to a command must never be shed.
+SPEECH_METRICS = PipelineMetrics()
+speech_queue = SpeechScheduler(metrics=SPEECH_METRICS)
+
+# --- RENDERED-SPEECH CACHE ---
+# Fixed phrases and upcoming reminders are rendered to WAV while the worker is
+# idle, then replayed straight to the audio device.
+SPEECH_CACHE_DIR = Path(__file__).parent / "data" / "speech_cache"
+CACHED_PHRASES = (
+    "At your service. How may I help?",
+    "I am sorry, I did not recognize that command.",
+    "Opening your visual scheduler now.",
+    "Your schedule is currently empty.",
+    "You have no upcoming appointments in the next 2 hours.",
+)
+speech_cache = None  # Created by the TTS worker once the voice and rate are known
 
 # --- TTS INITIALIZATION ---
 
 def initialize_tts_global():
-    global tts_engine, tts_engine_win
+    global tts_engine_win
     if SYSTEM_OS == "Windows":
         try:
             tts_engine_win = win32com.client.Dispatch("SAPI.SpVoice")
@@ -53,76 +80,115 @@ def initialize_tts_global():
         except Exception as e:
             print(f"CRITICAL TTS FAILURE: {e}")
             tts_engine_win = None
-    else:
-        try:
-            driver = 'nsss' if SYSTEM_OS == "Darwin" else 'espeak'
-            tts_engine = pyttsx3.init(driver)
-            rate = tts_engine.getProperty('rate')
-            tts_engine.setProperty('rate', rate)
-            print("pyttsx3 engine initialized.")
-        except Exception as e:
-            print(f"TTS Error: {e}") 
-            tts_engine = None
+    # pyttsx3: no engine here, the TTS worker builds and owns its own (PersistentSpeechEngine)
 
 initialize_tts_global()
 
 # --- TTS WORKER THREAD ---
 
-def _speak_pyttsx3(text):
-    temp_engine = None
-    try:
-        driver = 'nsss' if SYSTEM_OS == "Darwin" else 'espeak'
-        temp_engine = pyttsx3.init(driver)
-        temp_engine.setProperty('rate', tts_engine.getProperty('rate'))
-        temp_engine.say(text)
-        temp_engine.startLoop(False) 
-        time.sleep(0.5) 
-    except Exception as e:
-        print(f"[TTS Error - pyttsx3]: {e}")
-    finally:
-        if temp_engine:
-            try:
-                temp_engine.stop() 
-                del temp_engine
-            except:
-                pass
-
-def _speak_win32com(text):
+def _speak_pyttsx3(speaker, item):
+    # Persistent engine: returns when the utterance finished, or False if it was interrupted
+    return speaker.speak_chunks([item.text], is_cancelled=item.preempted.is_set)
+
+def _speak_win32com(item):
     if tts_engine_win:
         try:
-            tts_engine_win.Speak(text, 1)
-            time.sleep(2)
+            tts_engine_win.Speak(item.text, 1)
+            waited_ms = 0
+            while not tts_engine_win.WaitUntilDone(100):
+                waited_ms += 100
+                if item.preempted.is_set() or waited_ms >= WIN32_SPEAK_TIMEOUT_MS:
+                    tts_engine_win.Speak("", 3)  # Async + purge: stops the current utterance
+                    return False
         except Exception as e:
             print(f"[TTS Error - win32com]: {e}")
+    return True
+
+def _render_win32com(text, path):
+    """(Windows) Renders text into a WAV file through a SAPI file stream."""
+    file_stream = win32com.client.Dispatch("SAPI.SpFileStream")
+    file_stream.Open(str(path), 3)  # SSFMCreateForWrite
+    previous_output = tts_engine_win.AudioOutputStream
+    tts_engine_win.AudioOutputStream = file_stream
+    try:
+        tts_engine_win.Speak(text, 0)
+    finally:
+        file_stream.Close()
+        tts_engine_win.AudioOutputStream = previous_output
+
+def _create_speech_cache(speaker):
+    """Builds the rendered-speech cache for the active voice/rate. Returns (cache, render_function)."""
+    try:
+        if SYSTEM_OS == "Windows":
+            cache = SpeechCache(SPEECH_CACHE_DIR, voice=tts_engine_win.Voice.Id, rate=tts_engine_win.Rate)
+            render = _render_win32com
+        else:
+            cache = SpeechCache(SPEECH_CACHE_DIR, voice=speaker.voice_id(), rate=speaker.rate)
+            render = speaker.render_to_file
+    except Exception as e:
+        print(f"[TTS Worker] Speech cache disabled: {e}")
+        return None, None
+
+    if not cache.can_play:
+        print("[TTS Worker] Speech cache disabled: no audio playback backend.")
+        return None, None
+    cache.queue_prerender(CACHED_PHRASES)
+    cache.queue_prerender(upcoming_reminder_messages())
+    return cache, render
 
 def tts_worker():
+    global speech_cache
     print("[TTS Worker] Started")
+    # One long-lived engine, owned by this thread
+    speaker = None
+    if SYSTEM_OS != "Windows":
+        driver = 'nsss' if SYSTEM_OS == "Darwin" else 'espeak'
+        speaker = PersistentSpeechEngine(driver)
+        try:
+            speaker.start()
+        except Exception as e:
+            print(f"TTS Error: {e}")
+            return
+    speech_cache, render = _create_speech_cache(speaker)
+    tts_ready.set()
+
     while True:
-        text = speech_queue.get()
-        if text is None: 
+        # Pre-render cached phrases only while nothing is waiting to be spoken
+        if speech_cache and speech_cache.has_pending() and speech_queue.empty():
+            speech_cache.render_pending(render, max_items=1)
+            continue
+        try:
+            item = speech_queue.get(timeout=1.0)
+        except Empty:
+            continue
+        if item is None: 
             break
         
-        if SYSTEM_OS == "Windows":
-            _speak_win32com(text)
+        clip = speech_cache.get(item.text) if speech_cache else None
+        if clip:
+            completed = play_clip(clip, is_cancelled=item.preempted.is_set)  # Cache hit: the TTS engine is not touched
+        elif SYSTEM_OS == "Windows":
+            completed = _speak_win32com(item)
         else:
-            _speak_pyttsx3(text)
+            completed = _speak_pyttsx3(speaker, item)
         
-        speech_queue.task_done()
+        speech_queue.done(item, completed)
+
+    if speaker:
+        speaker.shutdown()
 
 def start_tts_worker():
-    is_ready = (SYSTEM_OS == "Windows" and tts_engine_win) or (SYSTEM_OS != "Windows" and tts_engine)
-    if is_ready:
+    if SYSTEM_OS != "Windows" or tts_engine_win:
         worker = threading.Thread(target=tts_worker, daemon=True)
         worker.start()
-        time.sleep(0.2)
+        tts_ready.wait(timeout=5.0)
         print("TTS Worker Thread Started")
 
-def jarvis_speak(text): 
-    """Queue text for speech output."""
+def jarvis_speak(text, priority=NORMAL): 
+    """Queue text for speech output (priority: URGENT, NORMAL or CHATTER)."""
     print(f"\n[JARVIS]: {text}\n")
-    is_ready = (SYSTEM_OS == "Windows" and tts_engine_win) or (SYSTEM_OS != "Windows" and tts_engine)
-    if is_ready:
-        speech_queue.put(text)
+    if tts_ready.is_set():
+        speech_queue.put(text, priority)
     else: 
         print(f"[JARVIS SPEAKS (Fallback)]: {text}")
 
@@ -132,20 +198,34 @@ DATA_DIR.mkdir(exist_ok=True)
 scheduler_engine = JarvisScheduler(DATA_DIR)
 
 # --- NOTIFICATION CALLBACK ---
-def on_schedule_notification(event):
-    """Called by ScheduleMonitor when an event is approaching."""
-    minutes = event['minutes_until']
-    task = event['task']
-    start_time = event['start_time']
-    
+def reminder_message(task, start_time, minutes):
+    """The spoken reminder text (shared by the notification and the speech cache pre-render)."""
     if minutes <= 0:
-        message = f"Attention! Your appointment for {task} is starting now at {start_time}."
+        return f"Attention! Your appointment for {task} is starting now at {start_time}."
     elif minutes == 1:
-        message = f"Reminder: Your appointment for {task} starts in 1 minute at {start_time}."
+        return f"Reminder: Your appointment for {task} starts in 1 minute at {start_time}."
     else:
-        message = f"Reminder: Your appointment for {task} starts in {minutes} minutes at {start_time}."
+        return f"Reminder: Your appointment for {task} starts in {minutes} minutes at {start_time}."
+
+def upcoming_reminder_messages(hours_ahead=24):
+    """
+    Every reminder the ScheduleMonitor may speak for the coming events. It fires
+    on its first check inside the reminder window (whole minutes, rounded down),
+    or at the start time itself.
+    """
+    messages = []
+    for event in scheduler_engine.get_upcoming_events(minutes_ahead=hours_ahead * 60):
+        reminder = event['reminder_minutes'] or 0
+        for minutes in sorted({reminder, reminder - 1, 1, 0}, reverse=True):
+            if minutes >= 0:
+                messages.append(reminder_message(event['task'], event['start_time'], minutes))
+    return messages
+
+def on_schedule_notification(event):
+    """Called by ScheduleMonitor when an event is approaching."""
+    message = reminder_message(event['task'], event['start_time'], event['minutes_until'])
     
-    jarvis_speak(message)
+    jarvis_speak(message, URGENT)
     print(f"[ALARM] {message}")
 
 # --- START SCHEDULE MONITOR ---
@@ -161,7 +241,7 @@ def start_schedule_monitor():
 # --- CALENDAR HANDLERS ---
 
 def handle_calendar_open(command):
-    jarvis_speak("Opening your visual scheduler now.")
+    jarvis_speak("Opening your visual scheduler now.", CHATTER)
     try:
         app = ScheduleGUI(scheduler_engine)
         saved_data = app.run() 
@@ -170,6 +250,8 @@ def handle_calendar_open(command):
                         f"for {saved_data['date']} at {saved_data['start']}. "
                         f"I will remind you {saved_data['reminder']} minutes before.")
             jarvis_speak(response)
+            if speech_cache:
+                speech_cache.queue_prerender(upcoming_reminder_messages())
         else:
             jarvis_speak("The scheduling session was cancelled.")
     except Exception as e:
@@ -195,13 +277,13 @@ def handle_view_schedule(command):
     return True
 
 def handle_calendar_delete(command):
-    global global_recorder, global_recognizer
+    global global_wake_service, global_recognizer
     
     target = command.replace("cancel", "").replace("delete", "").replace("remove", "").strip()
     
     if not target:
         jarvis_speak("Which appointment should I cancel?")
-        target = listen_for_command(global_recorder, global_recognizer) 
+        target = listen_for_command(global_wake_service, global_recognizer) 
         
         if not target or target == "none":
             jarvis_speak("I didn't catch that. Cancellation aborted.")
@@ -260,48 +342,56 @@ ACCESS_KEY = os.environ.get("PICOVOICE_ACCESS_KEY")
 WAKE_WORD = "jarvis" 
 
 def wake_word_loop():
+    """Blocks until the wake word is heard on the persistent WakeWordService (built on first use)."""
+    global global_wake_service
     if not ACCESS_KEY:
         print("ERROR: PICOVOICE_ACCESS_KEY not set.")
         return None
-    try:
-        porcupine = pvporcupine.create(access_key=ACCESS_KEY, keywords=[WAKE_WORD])
-    except Exception as e:
-        print(f"Porcupine Error: {e}")
-        return None
+    if global_wake_service is None:
+        service = WakeWordService(ACCESS_KEY, WAKE_WORD)
+        try:
+            service.start()
+        except Exception as e:
+            print(f"Porcupine Error: {e}")
+            return None
+        global_wake_service = service
 
-    recorder = PvRecorder(frame_length=porcupine.frame_length, device_index=-1)
-    recorder.start()
     print(f"Listening passively for '{WAKE_WORD}'...")
-
-    try:
-        while True: 
-            pcm = recorder.read() 
-            if porcupine.process(pcm) >= 0:
-                print(f"Wake Word Detected: {WAKE_WORD.upper()}!")
-                break 
-    finally:   
-        porcupine.delete()  
-    return recorder 
+    global_wake_service.wait_for_wake_word()
+    if global_wake_service.last_rearm_seconds is not None:
+        print(f"[Wake Word] Re-armed in {global_wake_service.last_rearm_seconds * 1000:.1f} ms")
+    print(f"Wake Word Detected: {WAKE_WORD.upper()}!")
+    return global_wake_service 
 
 # --- STT COMMAND LISTENER ---
-def listen_for_command(recorder, recognizer):
-    if not recorder: 
+def listen_for_command(wake_word_service, recognizer, one_breath=False):
+    """Hears the command from the shared audio stream (from the pre-roll when one_breath)."""
+    if not wake_word_service: 
         return None 
     
-    recorder.stop()
-    speech_queue.join() 
-    time.sleep(0.3)
+    wake_word_service.pause()  # The detector stops consuming; the capture stream keeps running
+    if not one_breath:
+        speech_queue.join() 
+        time.sleep(0.3)
 
-    with sr.Microphone() as source:
+    # Starting at the newest audio after Jarvis has spoken means it never hears itself.
+    with wake_word_service.command_source(preroll=one_breath) as source:
         print("--- JARVIS: Active Listening State. Speak Now... ---")
-        recognizer.adjust_for_ambient_noise(source, duration=1.0) 
+        # The noise floor is tracked continuously on the capture thread: no 1 s calibration pause.
+        if not wake_word_service.noise_floor.apply(recognizer):
+            recognizer.adjust_for_ambient_noise(source, duration=1.0) 
         try:   
-            audio = recognizer.listen(source, timeout=10, phrase_time_limit=8)   
-            command = recognizer.recognize_google(audio)
-            return command.lower()
+            audio = capture_utterance(source, recognizer.energy_threshold, timeout=10, phrase_time_limit=8)   
+            command = recognizer.recognize_google(audio).lower()
+            if command.startswith(WAKE_WORD):   # The pre-roll can catch the tail of the wake word
+                command = command[len(WAKE_WORD):].lstrip(" ,")
+            return command
         except sr.WaitTimeoutError:
             print("--- Timeout ---")
             return None
+        except OSError as e:
+            print(f"--- Audio stream stopped: {e} ---")
+            return None
         except sr.UnknownValueError:
             print("--- Unknown Value ---")
             return None
@@ -337,6 +427,9 @@ SKILL_MAP = {
     "reset notifications": handle_reset_notifications,
 }
 
+# Compiled ONCE at startup: "view schedule" now beats "schedule" regardless of dict order.
+INTENT_MATCHER = IntentMatcher(SKILL_MAP)
+
 def parse_command_for_intent(command):
     if command is None: 
         return False
@@ -344,18 +437,29 @@ def parse_command_for_intent(command):
     if "how may i help" in command or "at your service" in command: 
         return True
 
-    for keyword, skill_function in SKILL_MAP.items():
-        if keyword in command:
-            print(f"[LOGIC] Matched: '{keyword}'")
-            skill_function(command)
-            return True
+    match = INTENT_MATCHER.match(command)
+    if match:
+        keyword, skill_function = match
+        print(f"[LOGIC] Matched: '{keyword}'")
+        skill_function(command)
+        return True
             
     jarvis_speak("I am sorry, I did not recognize that command.")
     return False
 
+# --- SPEECH METRICS REPORT ---
+def report_speech_metrics():
+    """Prints queue depth, drops and per-level wait times when Jarvis shuts down."""
+    print(f"\n[Speech Scheduler] {speech_queue.stats()}")
+    SPEECH_METRICS.print_report()
+    if global_wake_service and global_wake_service.noise_floor.applied:
+        global_wake_service.noise_floor.report()
+
+atexit.register(report_speech_metrics)
+
 # --- MAIN LOOP ---
 def main():
-    global global_recorder, global_recognizer
+    global global_wake_service, global_recognizer
     
     start_tts_worker()
     start_schedule_monitor()  # Start monitoring schedules
@@ -370,25 +474,27 @@ def main():
     print("  - Say 'Jarvis' to activate")
     print("="*60 + "\n")
 
-    while True:
-        active_recorder = wake_word_loop() 
-        if active_recorder is None:
-            speech_queue.put(None)
-            return
-        
-        global_recorder = active_recorder
-        
-        jarvis_speak("At your service. How may I help?")
-        command_text = listen_for_command(active_recorder, r) 
-        
-        if command_text:
-            print(f"[COMMAND]: {command_text}")
-            parse_command_for_intent(command_text)
-        
-        try:
-            active_recorder.delete()
-        except:
-            pass
+    try:
+        while True:
+            active_wake_service = wake_word_loop() 
+            if active_wake_service is None:
+                speech_queue.close()
+                return
+            
+            # "Jarvis, show my schedule" in one breath: skip the acknowledgement.
+            active_wake_service.noise_floor.apply(r)
+            one_breath = active_wake_service.speech_follows_wake_word(r.energy_threshold)
+            if not one_breath:
+                jarvis_speak("At your service. How may I help?")
+            command_text = listen_for_command(active_wake_service, r, one_breath) 
+            
+            if command_text:
+                print(f"[COMMAND]: {command_text}")
+                parse_command_for_intent(command_text)
+            # The next wake_word_loop() resumes the same detector instead of rebuilding it.
+    finally:
+        if global_wake_service:
+            global_wake_service.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file